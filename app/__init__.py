@@ -11,6 +11,8 @@ from app.database import close_db
 from app.config import Config
 from app.companies.routes import companies_bp
 from app.common.logging import setup_logger
+from app.common.json_provider import FastJSONProvider
+from app.common.compression import compress_response
 from app.middleware.rate_limit import api_rate_limit
 from app.cache.redis_cache import cache
 from app.middleware.security import security
@@ -21,6 +23,7 @@ from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from app.crawling import scheduler
 from app.crawling.routes import crawling_bp
 from app.resumes.routes import resumes_bp
+from app.saved_searches.routes import saved_searches_bp
 from .crawling import init_app as init_crawling
 import time
 import atexit
@@ -41,14 +44,17 @@ def create_app():
     
     # 환경 변수에서 직접 로드 (백업)
     app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY')
+
+    # JSON 응답 직렬화 (orjson, 없으면 표준 json)
+    app.json = FastJSONProvider(app)
     
     # CORS 설정 수정
     CORS(app, resources={
         r"/*": {
             "origins": "*",
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"],
-            "expose_headers": ["Content-Type", "Authorization"],
+            "allow_headers": ["Content-Type", "Authorization", "If-None-Match"],
+            "expose_headers": ["Content-Type", "Authorization", "ETag"],
             "supports_credentials": True
         }
     })
@@ -72,6 +78,7 @@ def create_app():
     app.register_blueprint(bookmarks_bp, url_prefix='/bookmarks')
     app.register_blueprint(companies_bp, url_prefix='/companies')
     app.register_blueprint(resumes_bp)
+    app.register_blueprint(saved_searches_bp, url_prefix='/saved-searches')
 
     # 먼저 swagger.json 생성
     swagger_data = {
@@ -145,6 +152,7 @@ def create_app():
         'applications.yml', 
         'bookmarks.yml', 
         'resumes.yml',
+        'saved_searches.yml',
         'crawling.yml'
     ]
     for yaml_file in yaml_files:
@@ -229,7 +237,8 @@ def create_app():
         # 응답 로깅
         logger.log_response(response)
         
-        return response
+        # 응답 압축 (로깅이 본문을 읽은 뒤 마지막 단계)
+        return compress_response(response)
 
     @app.errorhandler(Exception)
     def handle_error(error):
@@ -105,13 +105,12 @@ class Application:
             cursor.execute("""
                 SELECT 
                     a.*,
-                    j.title as posting_title,
-                    j.deadline_date,
-                    c.name as company_name,
+                    s.title as posting_title,
+                    s.deadline_date,
+                    s.company_name,
                     r.title as resume_title
                 FROM applications a
-                JOIN job_postings j ON a.posting_id = j.posting_id
-                JOIN companies c ON j.company_id = c.company_id
+                JOIN job_search s ON a.posting_id = s.posting_id
                 JOIN resumes r ON a.resume_id = r.resume_id
                 WHERE a.user_id = %s
                 ORDER BY a.applied_at DESC
@@ -1,4 +1,5 @@
 from app.database import get_db
+from app.jobs.read_model import split_names
 import logging
 
 class Bookmark:
@@ -110,37 +111,34 @@ class Bookmark:
                 SELECT 
                     b.bookmark_id,
                     b.created_at as bookmarked_at,
-                    j.posting_id,
-                    j.title,
-                    j.experience_level,
-                    j.employment_type,
-                    j.salary_info,
-                    j.deadline_date,
-                    c.company_id,
-                    c.name as company_name,
-                    l.city,
-                    l.district,
-                    GROUP_CONCAT(DISTINCT ts.name) as tech_stacks
+                    s.posting_id,
+                    s.title,
+                    s.experience_level,
+                    s.employment_type,
+                    s.salary_info,
+                    s.deadline_date,
+                    s.company_id,
+                    s.company_name,
+                    s.city,
+                    s.district,
+                    s.tech_stack_names as tech_stacks
                 FROM bookmarks b
-                JOIN job_postings j ON b.posting_id = j.posting_id
-                JOIN companies c ON j.company_id = c.company_id
-                LEFT JOIN locations l ON j.location_id = l.location_id
-                LEFT JOIN posting_tech_stacks pts ON j.posting_id = pts.posting_id
-                LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-                WHERE b.user_id = %s AND j.status = 'active'
-                GROUP BY b.bookmark_id
+                JOIN job_search s ON b.posting_id = s.posting_id
+                WHERE b.user_id = %s AND s.status = 'active'
                 ORDER BY b.created_at DESC
                 LIMIT %s OFFSET %s
             """, (user_id, per_page, (page - 1) * per_page))
             
             bookmarks = cursor.fetchall()
+            for bookmark in bookmarks:
+                bookmark['tech_stacks'] = split_names(bookmark['tech_stacks'])
 
             # 전체 개수 조회
             cursor.execute("""
                 SELECT COUNT(*) as total
                 FROM bookmarks b
-                JOIN job_postings j ON b.posting_id = j.posting_id
-                WHERE b.user_id = %s AND j.status = 'active'
+                JOIN job_search s ON b.posting_id = s.posting_id
+                WHERE b.user_id = %s AND s.status = 'active'
             """, (user_id,))
             
             total = cursor.fetchone()['total']
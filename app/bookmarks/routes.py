@@ -120,14 +120,12 @@ def get_bookmarks():
         cursor.execute("""
             SELECT SQL_CALC_FOUND_ROWS 
                 b.bookmark_id, b.posting_id, b.created_at,
-                j.title as job_title, 
-                j.deadline_date as deadline, j.salary_info as salary,
-                c.name as company_name,
-                l.city as company_location
+                s.title as job_title, 
+                s.deadline_date as deadline, s.salary_info as salary,
+                s.company_name,
+                s.city as company_location
             FROM bookmarks b
-            JOIN job_postings j ON b.posting_id = j.posting_id
-            JOIN companies c ON j.company_id = c.company_id
-            LEFT JOIN locations l ON j.location_id = l.location_id
+            JOIN job_search s ON b.posting_id = s.posting_id
             WHERE b.user_id = %s
             ORDER BY b.created_at DESC
             LIMIT %s OFFSET %s
@@ -0,0 +1,53 @@
+import logging
+from typing import Iterable, Optional
+
+import redis
+
+from app.cache.redis_cache import cache
+
+
+class PostingVersions:
+    """채용공고 버전 카운터 (조건부 요청 ETag 계산용)
+
+    공고 쓰기 커밋 이후(notify_postings_changed) 전체 버전과 공고별 버전을 1씩 올린다.
+    Redis에 두므로 여러 워커 프로세스가 같은 값을 보며, 읽기는 GET/HGET 한 번이다.
+    Redis 장애 시 None을 반환하고, 호출한 쪽은 조건부 응답 없이 평소대로 응답한다.
+    """
+
+    GLOBAL_KEY = 'postings:version'
+    POSTING_KEY = 'postings:versions'
+
+    def bump(self, posting_ids: Iterable[int]) -> Optional[str]:
+        """전체/공고별 버전 증가 - 올린 뒤의 전체 버전 반환 (Redis 장애 시 None)"""
+        posting_ids = list(posting_ids)
+        if not posting_ids:
+            return None
+        try:
+            pipe = cache.redis_client.pipeline()
+            pipe.incr(self.GLOBAL_KEY)
+            for posting_id in posting_ids:
+                pipe.hincrby(self.POSTING_KEY, posting_id, 1)
+            return str(pipe.execute()[0])
+        except redis.RedisError as e:
+            logging.warning(f"Posting version bump error: {str(e)}")
+            return None
+
+    def current(self) -> Optional[str]:
+        """전체 공고 버전 (목록 조회용)"""
+        try:
+            return str(cache.redis_client.get(self.GLOBAL_KEY) or 0)
+        except redis.RedisError as e:
+            logging.warning(f"Posting version read error: {str(e)}")
+            return None
+
+    def of(self, posting_id: int) -> Optional[str]:
+        """공고 하나의 버전 (상세 조회용)"""
+        try:
+            return str(cache.redis_client.hget(self.POSTING_KEY, posting_id) or 0)
+        except redis.RedisError as e:
+            logging.warning(f"Posting version read error: {str(e)}")
+            return None
+
+
+# 싱글톤 인스턴스 생성
+posting_versions = PostingVersions()
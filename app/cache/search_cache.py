@@ -0,0 +1,138 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Set
+
+import redis
+
+from app.cache.redis_cache import cache
+
+# 태그를 붙일 필터 → 태그 이름 (제외 조건은 결과를 좁히기만 하므로 태그에 쓰지 않음)
+TAG_FIELDS = (
+    ('tech_stacks', 'stack'),
+    ('categories', 'category'),
+    ('location_id', 'location'),
+    ('location_ids', 'location')
+)
+
+# 태그 필터가 없는 검색(전체 목록, 키워드/연봉 조건만 있는 경우)은 모든 공고 변경에 무효화
+ALL_TAG = 'all'
+# region 필터 검색 - 지역 매핑에 새 지역이 추가되면 무효화
+REGION_TAG = 'region'
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    if isinstance(value, Decimal):
+        # Flask JSON 응답과 같은 표기
+        return str(value)
+    raise TypeError(f"Unsupported type: {type(value).__name__}")
+
+
+def _decode(obj: Dict):
+    if '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    if '__date__' in obj:
+        return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+class SearchResultCache:
+    """채용공고 목록 조회 결과 캐시
+
+    정규화한 조회 조건 문자열의 해시를 키로 쓰므로 파라미터 순서/대소문자/기본값 차이에도
+    같은 항목을 찾는다. 항목마다 조건에 쓰인 기술스택/카테고리/지역 ID를 태그로 기록해 두고,
+    공고가 바뀌면 그 공고의 (변경 전후) 태그가 붙은 항목만 삭제한다.
+    """
+
+    RESULT_PREFIX = 'search:result'
+    TAG_PREFIX = 'search:tag'
+
+    def __init__(self):
+        self.ttl = int(os.getenv('SEARCH_CACHE_TTL', 120))
+
+    def _result_key(self, signature: str) -> str:
+        return f"{self.RESULT_PREFIX}:{hashlib.sha1(signature.encode()).hexdigest()}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.TAG_PREFIX}:{tag}"
+
+    def get(self, signature: str) -> Optional[Dict]:
+        try:
+            cached = cache.redis_client.get(self._result_key(signature))
+        except redis.RedisError as e:
+            logging.warning(f"Search cache read error: {str(e)}")
+            return None
+        return json.loads(cached, object_hook=_decode) if cached is not None else None
+
+    def set(self, signature: str, result: Dict, filters: Optional[Dict]):
+        key = self._result_key(signature)
+        try:
+            pipe = cache.redis_client.pipeline()
+            pipe.setex(key, self.ttl, json.dumps(result, default=_encode, ensure_ascii=False))
+            for tag in self.filter_tags(filters):
+                pipe.sadd(self._tag_key(tag), key)
+                pipe.expire(self._tag_key(tag), self.ttl)
+            pipe.execute()
+        except (redis.RedisError, TypeError) as e:
+            logging.warning(f"Search cache write error: {str(e)}")
+
+    def invalidate(self, posting_values: Iterable[Dict[str, tuple]], regions_changed: bool = False):
+        """변경된 공고들의 색인 값(bitmap_index.values_for, 변경 전후 모두)에 해당하는 항목 삭제"""
+        tags = {ALL_TAG}
+        if regions_changed:
+            tags.add(REGION_TAG)
+        for values in posting_values:
+            tags.update(self.value_tags(values))
+
+        try:
+            pipe = cache.redis_client.pipeline()
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            keys = set().union(*pipe.execute())
+            cache.redis_client.delete(*keys, *tag_keys)
+        except redis.RedisError as e:
+            logging.warning(f"Search cache invalidation error: {str(e)}")
+
+    def clear(self):
+        """모든 항목 삭제 - 변경된 공고의 이전 태그를 알 수 없을 때 사용"""
+        try:
+            keys = list(cache.redis_client.scan_iter(f"{self.RESULT_PREFIX}:*"))
+            keys.extend(cache.redis_client.scan_iter(f"{self.TAG_PREFIX}:*"))
+            for start in range(0, len(keys), 1000):
+                cache.redis_client.delete(*keys[start:start + 1000])
+        except redis.RedisError as e:
+            logging.warning(f"Search cache clear error: {str(e)}")
+
+    @staticmethod
+    def filter_tags(filters: Optional[Dict]) -> Set[str]:
+        """조회 조건이 의존하는 태그 - 태그 필터가 없으면 'all'"""
+        tags = set()
+        for field, tag in TAG_FIELDS:
+            value = (filters or {}).get(field)
+            if value is None or value == '':
+                continue
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            if field == 'location_ids':
+                tags.add(REGION_TAG)
+            tags.update(f"{tag}:{v}" for v in values)
+        return tags or {ALL_TAG}
+
+    @staticmethod
+    def value_tags(values: Dict[str, tuple]) -> Set[str]:
+        """공고 하나의 기술스택/카테고리/지역 태그"""
+        tags = {f"stack:{v}" for v in values.get('tech_stacks', ())}
+        tags.update(f"category:{v}" for v in values.get('categories', ()))
+        tags.update(f"location:{v}" for v in values.get('location_id', ()))
+        return tags
+
+
+# 싱글톤 인스턴스 생성
+search_cache = SearchResultCache()
@@ -0,0 +1,85 @@
+"""응답 압축 (Accept-Encoding에 따라 brotli 또는 gzip)
+
+create_app의 after_request 마지막 단계에서 적용한다. 크기를 아는 응답은 COMPRESS_MIN_SIZE 이상일 때만,
+스트리밍 응답(내보내기)은 청크 단위로 압축한다. 정적 파일(direct_passthrough)과 이미 인코딩된 응답은 제외한다.
+brotli는 선택 의존성이며 설치되지 않았으면 gzip만 사용한다.
+"""
+import os
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 - 없으면 gzip만 사용
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'text/csv',
+    'text/plain',
+    'text/html'
+}
+
+
+def choose_encoding(accept_encodings) -> Optional[str]:
+    """Accept-Encoding 중 사용할 인코딩 - q값이 높은 쪽, 같으면 brotli (q=0은 거부)"""
+    candidates = (['br'] if brotli is not None else []) + ['gzip']
+    best = max(candidates, key=lambda encoding: accept_encodings.quality(encoding))
+    return best if accept_encodings.quality(best) > 0 else None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_stream(chunks: Iterable, encoding: str) -> Iterator[bytes]:
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        process, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        process, finish = compressor.compress, compressor.flush
+
+    for chunk in chunks:
+        data = process(chunk.encode() if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+def compress_response(response: Response) -> Response:
+    """요청의 Accept-Encoding에 맞춰 응답 본문 압축"""
+    if (request.method == 'HEAD' or response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    # 같은 URL이라도 Accept-Encoding에 따라 본문이 다름
+    response.vary.add('Accept-Encoding')
+
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(compress(data, encoding))
+
+    response.headers['Content-Encoding'] = encoding
+    return response
@@ -0,0 +1,47 @@
+"""조건부 요청 (ETag / If-None-Match) 과 Cache-Control
+
+ETag는 응답 본문이 아니라 공고 버전(app.cache.posting_versions)과 요청 URL로 계산하므로
+본문을 만들기 전에 비교할 수 있고, 일치하면 DB 조회와 직렬화 없이 304를 반환한다.
+조회수/관련 공고처럼 쓰기 이벤트 없이 바뀌는 값도 응답에 들어 있어 약한(W/) ETag를 쓰며,
+시간 구간(HTTP_ETAG_WINDOW)을 ETag에 포함해 이런 값은 최대 그 시간 안에 새로 받게 한다.
+"""
+import hashlib
+import os
+import time
+from typing import Optional
+
+from flask import Response, request
+
+# 클라이언트/CDN이 재검증 없이 응답을 재사용하는 시간 (초)
+MAX_AGE = int(os.getenv('HTTP_CACHE_MAX_AGE', 30))
+# 버전이 같아도 ETag가 바뀌는 주기 (초)
+ETAG_WINDOW = int(os.getenv('HTTP_ETAG_WINDOW', 300))
+
+
+def make_etag(version: Optional[str], *parts) -> Optional[str]:
+    """버전 + 요청 URL(+ 추가 값)로 ETag 값 계산 - 버전을 모르면 None"""
+    if version is None:
+        return None
+    window = int(time.time() // ETAG_WINDOW) if ETAG_WINDOW > 0 else 0
+    key = '|'.join(str(part) for part in (version, window, request.full_path) + parts)
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+def is_not_modified(etag: Optional[str]) -> bool:
+    """If-None-Match가 현재 ETag와 일치하는지 (약한 비교)"""
+    return etag is not None and request.if_none_match.contains_weak(etag)
+
+
+def cache_headers(response: Response, etag: Optional[str], max_age: int = MAX_AGE) -> Response:
+    """성공 응답에 ETag / Cache-Control 설정 (ETag를 모르면 그대로 반환)"""
+    if etag is None:
+        return response
+    response.set_etag(etag, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+def not_modified(etag: str, max_age: int = MAX_AGE) -> Response:
+    """본문 없는 304 응답"""
+    return cache_headers(Response(status=304), etag, max_age)
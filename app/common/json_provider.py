@@ -0,0 +1,95 @@
+"""빠른 JSON 직렬화 (orjson, 없으면 표준 json)
+
+Flask 응답(jsonify/make_response)은 FastJSONProvider를 통해 orjson으로 직렬화한다.
+출력 형식은 기본 provider와 같게 유지한다 (datetime/date는 HTTP 날짜 문자열, Decimal은 문자열,
+키 정렬). 차이는 비 ASCII 문자를 \\u 이스케이프 없이 UTF-8 그대로 내보내는 것뿐이다.
+"""
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+@lru_cache(maxsize=4096)
+def http_date(value: date) -> str:
+    """werkzeug.http.http_date와 같은 RFC 822 문자열 (시간대 없는 값은 UTC로 간주)
+
+    목록 응답의 날짜 변환이 직렬화 시간 대부분을 차지해 email.utils를 거치지 않고 직접 만들며,
+    마감일/등록일처럼 반복되는 값은 캐시한다.
+    """
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    elif value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return (f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} {value.year:04d} "
+            f"{value.hour:02d}:{value.minute:02d}:{value.second:02d} GMT")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    return DefaultJSONProvider.default(value)
+
+
+def dumps(obj: Any, default: Optional[Callable] = None, sort_keys: bool = False,
+          indent: bool = False, iso_datetime: bool = False) -> bytes:
+    """obj → UTF-8 JSON 바이트
+
+    datetime/date는 기본적으로 default가 변환한다. iso_datetime이면 orjson이 직접 ISO 8601로 쓰며
+    (표준 json으로 처리할 때와 같도록 default도 isoformat()을 반환해야 함), Decimal 등은 항상 default를 거친다.
+    orjson이 없거나 처리할 수 없는 값(64비트 범위 밖 정수 등)이면 표준 json으로 직렬화한다.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not iso_datetime:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(obj, default=default, sort_keys=sort_keys, ensure_ascii=False,
+                      indent=2 if indent else None,
+                      separators=None if indent else (',', ':')).encode()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson 기반 Flask JSON provider - create_app에서 app.json으로 설정"""
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # 표준 json 인자(cls, indent 등)를 직접 넘긴 호출은 기본 구현 사용
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return dumps(obj, default=self.default, sort_keys=self.sort_keys).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            dumps(obj, default=self.default, sort_keys=self.sort_keys, indent=indent) + b"\n",
+            mimetype=self.mimetype
+        )
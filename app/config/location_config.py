@@ -15,4 +15,8 @@ class LocationConfig:
         if sub_region:
             return self._codes.get(region, {}).get(sub_region)
         return next((code for r in self._codes.values() 
-                    for loc, code in r.items() if loc == region), None) 
\ No newline at end of file
+                    for loc, code in r.items() if loc == region), None)
+
+    def get_groups(self):
+        """지역 그룹명 → {지역명: 사람인 지역 코드}"""
+        return self._codes
@@ -51,6 +51,70 @@ def init_app(app):
                         app.logger.info(f"Scheduled crawling completed: {saved_count} jobs saved")
                     except Exception as e:
                         app.logger.error(f"Scheduled crawling failed: {str(e)}")
+
+            from app.jobs.views import view_counter
+
+            @scheduler.task('interval', id='flush_view_counts', seconds=view_counter.flush_interval)
+            def flush_view_counts():
+                with app.app_context():
+                    try:
+                        from app.database import get_db
+                        flushed = view_counter.flush(get_db())
+                        if flushed:
+                            app.logger.debug(f"View counts flushed: {flushed} postings")
+                    except Exception as e:
+                        app.logger.error(f"View count flush failed: {str(e)}")
+
+            from app.jobs.unique_views import unique_view_counter
+
+            @scheduler.task('interval', id='materialize_unique_views',
+                            seconds=unique_view_counter.materialize_interval)
+            def materialize_unique_views():
+                with app.app_context():
+                    try:
+                        from app.database import get_db
+                        unique_view_counter.materialize(get_db())
+                    except Exception as e:
+                        app.logger.error(f"Unique view materialize failed: {str(e)}")
+
+            from app.jobs.related import related_engine
+
+            @scheduler.task('interval', id='refresh_related_postings',
+                            seconds=related_engine.refresh_interval)
+            def refresh_related_postings():
+                with app.app_context():
+                    try:
+                        from app.database import get_db
+                        refreshed = related_engine.refresh(get_db())
+                        if refreshed:
+                            app.logger.info(f"Related postings refreshed: {refreshed} postings")
+                    except Exception as e:
+                        app.logger.error(f"Related postings refresh failed: {str(e)}")
+
+            from app.search import search_index, bitmap_index
+
+            @scheduler.task('interval', id='reload_search_indexes', seconds=search_index.max_age)
+            def reload_search_indexes():
+                # 다른 워커의 변경분 반영 - 요청 밖에서 새 색인을 만든 뒤 교체
+                with app.app_context():
+                    try:
+                        search_index.load()
+                        bitmap_index.load()
+                    except Exception as e:
+                        app.logger.error(f"Search index reload failed: {str(e)}")
+
+            from app.jobs.sweeper import posting_sweeper
+
+            @scheduler.task('interval', id='sweep_postings', seconds=posting_sweeper.interval)
+            def sweep_postings():
+                with app.app_context():
+                    try:
+                        from app.database import get_db
+                        expired, archived = posting_sweeper.sweep(get_db())
+                        if expired or archived:
+                            app.logger.info(f"Posting sweep completed: {expired} expired, {archived} archived")
+                    except Exception as e:
+                        app.logger.error(f"Posting sweep failed: {str(e)}")
             
             scheduler.start()
             app.logger.info("Scheduler started successfully")
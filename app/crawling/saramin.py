@@ -7,6 +7,8 @@ from datetime import datetime
 from .models import Job, Company
 from .config import CrawlingConfig
 from app.database import get_db
+from app.jobs.events import notify_postings_created
+from app.jobs.read_model import sync_job_search
 import asyncio
 import csv
 import os
@@ -200,6 +202,7 @@ class SaraminCrawler:
         """채용 정보 저장 - 중복 체크 추가"""
         try:
             saved = 0
+            saved_ids = []
             db = get_db()
             cursor = db.cursor(dictionary=True)
             
@@ -256,9 +259,12 @@ class SaraminCrawler:
                     job_data.get('salary', ''),
                     job_data.get('deadline', None)  # deadline이 없으면 NULL
                 ))
+                saved_ids.append(cursor.lastrowid)
                 saved += 1
             
+            sync_job_search(cursor, saved_ids)
             db.commit()
+            notify_postings_created(saved_ids)
             self.logger.info(f"저장 완료: {saved}개의 채용공고")
             return saved
             
@@ -1,5 +1,7 @@
 from flask import current_app
 from app.database import get_db
+from app.jobs.events import notify_postings_changed, notify_postings_created
+from app.jobs.read_model import sync_job_search
 import csv
 import os
 import logging
@@ -46,6 +48,8 @@ def import_csv_to_db(csv_file_path=None):
 
         saved_count = 0
         updated_count = 0
+        changed_ids = []
+        new_ids = []
         
         with open(csv_file_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
@@ -100,6 +104,7 @@ def import_csv_to_db(csv_file_path=None):
                         deadline_date,
                         existing['posting_id']
                     ))
+                    changed_ids.append(existing['posting_id'])
                     updated_count += 1
                 else:
                     # 새 공고 추가
@@ -126,9 +131,15 @@ def import_csv_to_db(csv_file_path=None):
                         row.get('salary', ''),
                         deadline_date
                     ))
+                    changed_ids.append(cursor.lastrowid)
+                    new_ids.append(cursor.lastrowid)
                     saved_count += 1
             
+            sync_job_search(cursor, changed_ids)
             db.commit()
+            # 새 공고만 저장된 검색과 대조
+            notify_postings_changed(set(changed_ids) - set(new_ids))
+            notify_postings_created(new_ids)
             logging.info(f"CSV import completed: {saved_count} new jobs saved, {updated_count} jobs updated")
             return saved_count + updated_count
             
@@ -0,0 +1,163 @@
+"""채용공고 일괄 등록 (POST /jobs/bulk)
+
+항목 검증을 한 번에 끝낸 뒤 유효한 항목만 executemany로 한 트랜잭션에 저장한다.
+(공고 / 기술스택 연결 / 카테고리 연결 각각 다중 행 INSERT 한 번, 공고 ID는 첫 행 ID부터 연속)
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+# 요청 하나에 받을 수 있는 최대 공고 수
+MAX_BULK_SIZE = 500
+
+# 문자열 컬럼 → 최대 길이 (job_postings 스키마)
+_TEXT_FIELDS = {
+    'title': 255,
+    'experience_level': 50,
+    'education_level': 50,
+    'employment_type': 50,
+    'salary_info': 100
+}
+
+_INSERT_COLUMNS = (
+    'company_id', 'title', 'job_description', 'experience_level', 'education_level',
+    'employment_type', 'salary_info', 'location_id', 'deadline_date'
+)
+
+
+def _id_list(value) -> Optional[List[int]]:
+    """ID 목록 검증 (정수 목록이 아니면 None)"""
+    if not isinstance(value, list) or not all(isinstance(x, int) and not isinstance(x, bool) for x in value):
+        return None
+    return list(dict.fromkeys(value))
+
+
+def validate_item(item) -> Tuple[Optional[Dict], Optional[str]]:
+    """공고 항목 하나의 형식 검증 → (정규화한 항목, 에러)"""
+    if not isinstance(item, dict):
+        return None, "Item must be an object"
+
+    for field in ('title', 'job_description'):
+        if not isinstance(item.get(field), str) or not item[field].strip():
+            return None, f"Missing required field: {field}"
+
+    posting = {'title': item['title'].strip(), 'job_description': item['job_description']}
+    for field, max_length in _TEXT_FIELDS.items():
+        value = posting.get(field, item.get(field))
+        if value is None:
+            posting[field] = None
+            continue
+        if not isinstance(value, str):
+            return None, f"{field} must be a string"
+        if len(value) > max_length:
+            return None, f"{field} is too long (max {max_length})"
+        posting[field] = value
+
+    location_id = item.get('location_id')
+    if location_id is not None and (not isinstance(location_id, int) or isinstance(location_id, bool)):
+        return None, "location_id must be an integer"
+    posting['location_id'] = location_id
+
+    deadline_date = item.get('deadline_date')
+    if deadline_date is not None:
+        try:
+            deadline_date = datetime.strptime(deadline_date, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            return None, "deadline_date must be YYYY-MM-DD"
+    posting['deadline_date'] = deadline_date
+
+    for field in ('categories', 'tech_stacks'):
+        ids = _id_list(item.get(field, []))
+        if ids is None:
+            return None, f"{field} must be a list of integers"
+        posting[field] = ids
+
+    return posting, None
+
+
+def validate_items(items: List, known_ids: Dict[str, Set[int]]) -> Tuple[List[Tuple[int, Dict]], Dict[int, str]]:
+    """전체 항목 검증 → ([(요청 내 위치, 항목)], {위치: 에러})
+
+    known_ids: 존재하는 location_id / category_id / stack_id ('locations', 'categories', 'tech_stacks')
+    """
+    valid, errors = [], {}
+    for index, item in enumerate(items):
+        posting, error = validate_item(item)
+        if error is None:
+            if posting['location_id'] is not None and posting['location_id'] not in known_ids['locations']:
+                error = f"Unknown location_id: {posting['location_id']}"
+            for field in ('categories', 'tech_stacks'):
+                unknown = [x for x in posting[field] if x not in known_ids[field]]
+                if unknown and error is None:
+                    error = f"Unknown {field}: {', '.join(map(str, unknown))}"
+        if error is None:
+            valid.append((index, posting))
+        else:
+            errors[index] = error
+    return valid, errors
+
+
+def referenced_ids(items: List) -> Dict[str, Set[int]]:
+    """항목들이 참조하는 지역/카테고리/기술스택 ID (존재 확인 쿼리용, 형식 오류는 무시)"""
+    referenced = {'locations': set(), 'categories': set(), 'tech_stacks': set()}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if isinstance(item.get('location_id'), int):
+            referenced['locations'].add(item['location_id'])
+        for field in ('categories', 'tech_stacks'):
+            referenced[field].update(_id_list(item.get(field, [])) or ())
+    return referenced
+
+
+def fetch_known_ids(cursor, referenced: Dict[str, Set[int]]) -> Dict[str, Set[int]]:
+    """참조된 ID 중 실제로 있는 것 (테이블마다 IN 조회 한 번)"""
+    known = {}
+    for key, table, column in (('locations', 'locations', 'location_id'),
+                               ('categories', 'job_categories', 'category_id'),
+                               ('tech_stacks', 'tech_stacks', 'stack_id')):
+        ids = sorted(referenced[key])
+        if not ids:
+            known[key] = set()
+            continue
+        cursor.execute(f"""
+            SELECT {column} FROM {table}
+            WHERE {column} IN ({','.join(['%s'] * len(ids))})
+        """, ids)
+        known[key] = {row[column] if isinstance(row, dict) else row[0] for row in cursor.fetchall()}
+    return known
+
+
+def insert_postings(cursor, company_id: int, postings: List[Dict]) -> List[int]:
+    """공고와 기술스택/카테고리 연결을 executemany로 저장 (호출한 쪽 트랜잭션, 커밋하지 않음)
+
+    공고는 다중 행 INSERT 한 번으로 저장한다. 행 수가 정해진 단순 INSERT는 innodb_autoinc_lock_mode와
+    무관하게 문장 하나에 연속된 AUTO_INCREMENT 값을 받으므로, lastrowid(첫 행 ID)부터 순서대로 ID를 붙인다.
+    """
+    if not postings:
+        return []
+
+    cursor.executemany(f"""
+        INSERT INTO job_postings ({', '.join(_INSERT_COLUMNS)})
+        VALUES ({', '.join(['%s'] * len(_INSERT_COLUMNS))})
+    """, [(company_id,) + tuple(posting[column] for column in _INSERT_COLUMNS[1:]) for posting in postings])
+
+    first_id = cursor.lastrowid
+    posting_ids = [first_id + index for index in range(len(postings))]
+
+    category_rows = [(posting_id, category_id)
+                     for posting_id, posting in zip(posting_ids, postings) for category_id in posting['categories']]
+    if category_rows:
+        cursor.executemany("""
+            INSERT INTO posting_categories (posting_id, category_id)
+            VALUES (%s, %s)
+        """, category_rows)
+
+    stack_rows = [(posting_id, stack_id)
+                  for posting_id, posting in zip(posting_ids, postings) for stack_id in posting['tech_stacks']]
+    if stack_rows:
+        cursor.executemany("""
+            INSERT INTO posting_tech_stacks (posting_id, stack_id)
+            VALUES (%s, %s)
+        """, stack_rows)
+
+    return posting_ids
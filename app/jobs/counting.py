@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import redis
+
+from app.cache.redis_cache import cache
+from app.jobs.listing import build_where
+
+# count 파라미터 값 → 집계 방식
+COUNT_MODES = {
+    'true': 'exact',
+    'exact': 'exact',
+    'false': 'none',
+    'none': 'none',
+    'estimate': 'estimate'
+}
+
+
+def parse_count_mode(value: Optional[str]) -> str:
+    """count 쿼리 파라미터 해석 - 잘못된 값이면 ValueError"""
+    if value is None or value == '':
+        return 'exact'
+    mode = COUNT_MODES.get(value.lower())
+    if mode is None:
+        raise ValueError("count must be one of true, false, estimate")
+    return mode
+
+
+def filter_signature(filters: Optional[Dict]) -> str:
+    """필터를 정규화한 문자열 (파라미터 순서/중복/대소문자 차이를 제거)"""
+    normalized = {}
+    for key, value in (filters or {}).items():
+        if value is None or value == '' or value == []:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(set(value))
+        elif isinstance(value, str):
+            value = ' '.join(value.lower().split())
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class PostingCounter:
+    """검색 조건별 전체 건수 집계
+
+    목록 조회와 동일한 WHERE 절을 사용하며, 정확한 건수는 필터 시그니처별로
+    Redis에 짧게 캐시한다. 공고가 변경되면 세대(generation)를 올려 한 번에 무효화한다.
+    """
+
+    TTL = 30
+    GENERATION_KEY = 'count:generation'
+
+    def count(self, cursor, filters: Optional[Dict], mode: str = 'exact',
+              where: Optional[Tuple[str, List]] = None) -> Tuple[Optional[int], bool]:
+        """(전체 건수, 정확한 값 여부) 반환 - mode가 none이면 (None, False)
+
+        where: 목록 조회에서 이미 만든 build_where() 결과 (재사용)
+        """
+        if mode == 'none':
+            return None, False
+
+        where_sql, params = where or build_where(filters)
+
+        if mode == 'estimate':
+            return self._estimate(cursor, where_sql, params), False
+
+        cache_key = self._cache_key(filters)
+        if cache_key:
+            try:
+                cached = cache.redis_client.get(cache_key)
+                if cached is not None:
+                    return int(cached), True
+            except redis.RedisError as e:
+                logging.warning(f"Count cache read error: {str(e)}")
+                cache_key = None
+
+        cursor.execute(f"SELECT COUNT(*) as total FROM job_postings p{where_sql}", params)
+        total = cursor.fetchone()['total']
+
+        if cache_key:
+            try:
+                cache.redis_client.setex(cache_key, self.TTL, total)
+            except redis.RedisError as e:
+                logging.warning(f"Count cache write error: {str(e)}")
+
+        return total, True
+
+    def invalidate(self):
+        """공고 변경 시 캐시된 건수 전체 무효화"""
+        try:
+            cache.redis_client.incr(self.GENERATION_KEY)
+        except redis.RedisError as e:
+            logging.warning(f"Count cache invalidation error: {str(e)}")
+
+    def _cache_key(self, filters: Optional[Dict]) -> Optional[str]:
+        try:
+            generation = cache.redis_client.get(self.GENERATION_KEY) or 0
+        except redis.RedisError as e:
+            logging.warning(f"Count cache generation error: {str(e)}")
+            return None
+        digest = hashlib.sha1(filter_signature(filters).encode()).hexdigest()
+        return f"count:{generation}:{digest}"
+
+    @staticmethod
+    def _estimate(cursor, where_sql: str, params) -> int:
+        """옵티마이저 통계(EXPLAIN의 rows × filtered)로 건수 추정"""
+        cursor.execute(f"EXPLAIN SELECT p.posting_id FROM job_postings p{where_sql}", params)
+        for row in cursor.fetchall():
+            if row.get('table') == 'p':
+                rows = row.get('rows') or 0
+                filtered = float(row.get('filtered') or 100)
+                return int(rows * filtered / 100)
+        return 0
+
+
+# 싱글톤 인스턴스 생성
+posting_counter = PostingCounter()
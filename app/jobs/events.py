@@ -0,0 +1,83 @@
+import logging
+from typing import Iterable
+
+from app.search import search_index, bitmap_index, facet_index, suggest_index
+from app.search.percolator import percolator
+from app.cache.search_cache import search_cache
+from app.cache.posting_versions import posting_versions
+from app.jobs.counting import posting_counter
+from app.jobs.related import related_engine
+from app.jobs.regions import region_index
+
+
+def notify_postings_changed(posting_ids: Iterable[int]):
+    """채용공고 생성/수정/삭제 커밋 이후 호출 - 인메모리 인덱스 동기화
+
+    동기화 실패가 쓰기 요청 자체를 실패시키지 않도록 에러는 로깅만 한다.
+    """
+    posting_ids = [posting_id for posting_id in dict.fromkeys(posting_ids) if posting_id]
+    if not posting_ids:
+        return
+
+    try:
+        search_index.refresh(posting_ids)
+    except Exception as e:
+        logging.error(f"Search index sync error: {str(e)}")
+
+    # 변경 전 기술스택/카테고리/지역 - 검색 결과 캐시 무효화에 변경 후 값과 함께 사용
+    # (이 프로세스가 비트맵 색인을 적재하지 않았으면 - 크롤러/정리 작업/CLI/새 워커 - 이전 값을 알 수 없음)
+    indexed = bitmap_index.loaded
+    old_values = [bitmap_index.values_for(posting_id) for posting_id in posting_ids]
+
+    try:
+        bitmap_index.refresh(posting_ids)
+    except Exception as e:
+        logging.error(f"Bitmap index sync error: {str(e)}")
+
+    new_values = [bitmap_index.values_for(posting_id) for posting_id in posting_ids]
+
+    regions_changed = False
+    try:
+        # 새 지역이 추가된 경우 region 필터 매핑 갱신 (공고의 location_id는 비트맵 색인 값 재사용)
+        regions_changed = region_index.refresh(location_id for values in new_values
+                                               for location_id in values.get('location_id', ()))
+    except Exception as e:
+        logging.error(f"Region index sync error: {str(e)}")
+
+    try:
+        if indexed:
+            search_cache.invalidate(old_values + new_values, regions_changed)
+        else:
+            search_cache.clear()
+    except Exception as e:
+        logging.error(f"Search cache invalidation error: {str(e)}")
+
+    try:
+        facet_index.refresh(posting_ids)
+    except Exception as e:
+        logging.error(f"Facet index sync error: {str(e)}")
+
+    try:
+        suggest_index.refresh(posting_ids)
+    except Exception as e:
+        logging.error(f"Suggest index sync error: {str(e)}")
+
+    posting_counter.invalidate()
+
+    # 관련 공고는 주기 작업에서 증분 재계산
+    related_engine.mark_dirty(posting_ids)
+
+    # 색인/캐시 갱신 이후 버전을 올려 이전 ETag로 온 조건부 요청이 새 응답을 받게 함
+    # (비트맵 색인은 그 사이 다른 워커의 변경이 없었으면 올린 버전까지 최신으로 기록)
+    bitmap_index.advance(posting_versions.bump(posting_ids))
+
+
+def notify_postings_created(posting_ids: Iterable[int]):
+    """새 채용공고 커밋 이후 호출 - 인덱스 동기화 후 저장된 검색과 대조"""
+    posting_ids = list(posting_ids)
+    notify_postings_changed(posting_ids)
+
+    try:
+        percolator.percolate(posting_ids)
+    except Exception as e:
+        logging.error(f"Saved search percolation error: {str(e)}")
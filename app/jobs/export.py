@@ -0,0 +1,127 @@
+import csv
+import io
+import logging
+import os
+import threading
+from datetime import date, datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from app.common.json_provider import dumps
+from app.jobs.fields import DEFAULT_LISTING_FIELDS, select_columns
+from app.jobs.read_model import expand_row
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+# 기본 내보내기 필드 - 목록 카드 필드 + 학력/기술스택·카테고리 ID
+DEFAULT_EXPORT_FIELDS = DEFAULT_LISTING_FIELDS + ('education_level', 'tech_stack_ids', 'category_ids')
+
+# 서버 측 커서에서 한 번에 읽는 행 수
+FETCH_SIZE = 500
+
+# 동시에 진행할 수 있는 내보내기 수 - 스트림마다 연결 풀(pool_size=5)의 커넥션 하나를 끝까지 점유하므로
+# 느린 클라이언트가 풀을 다 써서 다른 API 요청이 막히지 않도록 제한한다 (초과 요청은 429)
+MAX_CONCURRENT_EXPORTS = int(os.getenv('EXPORT_MAX_CONCURRENT', 2))
+export_slots = threading.BoundedSemaphore(MAX_CONCURRENT_EXPORTS)
+
+
+def parse_since(value: Optional[str]) -> Optional[datetime]:
+    """since 파라미터(ISO 날짜 또는 일시) 해석 - 형식이 잘못되면 ValueError"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        raise ValueError("since must be an ISO 8601 date or datetime")
+
+
+def parse_after_id(value: Optional[str], since: Optional[datetime]) -> Optional[int]:
+    """after_id 파라미터 (since와 같은 등록 시각의 공고 중 이 ID 이후부터) - 형식이 잘못되면 ValueError"""
+    if not value:
+        return None
+    if since is None:
+        raise ValueError("after_id requires since")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError("after_id must be an integer")
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return '|'.join(str(v) for v in value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_postings(conn, fields: Tuple[str, ...], since: Optional[datetime] = None,
+                  after_id: Optional[int] = None) -> Iterator[Dict]:
+    """활성 공고를 created_at, posting_id 순으로 한 행씩 반환
+
+    버퍼링하지 않는 서버 측 커서로 FETCH_SIZE씩 읽으므로 메모리 사용량이 전체 건수와 무관하다.
+    since는 그 시각을 포함한다 (같은 시각에 등록된 공고를 건너뛰지 않도록).
+    마지막으로 받은 행의 (created_at, posting_id)를 since/after_id로 넘기면 중복 없이 정확히 이어 받는다.
+    """
+    fields = tuple(dict.fromkeys(('posting_id',) + tuple(fields)))
+    columns, join_postings, _ = select_columns(fields)
+
+    query = f"SELECT {columns} FROM job_search s"
+    if join_postings:
+        query += " JOIN job_postings p ON s.posting_id = p.posting_id"
+    query += " WHERE s.status = 'active'"
+    params = []
+    if since and after_id is not None:
+        query += " AND (s.created_at > %s OR (s.created_at = %s AND s.posting_id > %s))"
+        params.extend([since, since, after_id])
+    elif since:
+        query += " AND s.created_at >= %s"
+        params.append(since)
+    query += " ORDER BY s.created_at, s.posting_id"
+
+    cursor = conn.cursor(dictionary=True, buffered=False)
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield expand_row(row)
+    finally:
+        # 중간에 연결이 끊긴 경우 남은 결과를 비워야 커넥션을 재사용할 수 있다
+        try:
+            if conn.unread_result:
+                conn.consume_results()
+            cursor.close()
+        except Exception as e:
+            logging.warning(f"Export cursor close error: {str(e)}")
+
+
+def stream_ndjson(rows: Iterator[Dict]) -> Iterator[str]:
+    for row in rows:
+        yield dumps(row, default=_json_default, iso_datetime=True).decode() + '\n'
+
+
+def stream_csv(rows: Iterator[Dict], fields: Tuple[str, ...]) -> Iterator[str]:
+    """CSV 스트림 - 목록 필드는 '|'로 연결"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow([_csv_value(row.get(field)) for field in fields])
+        if count % FETCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
@@ -0,0 +1,81 @@
+from typing import List, Optional, Tuple
+
+# 응답 필드 → SELECT 식 (s: job_search, p: job_postings, c: companies)
+# tech_stacks/categories 등 목록 필드는 read_model.expand_row()에서 변환된다
+FIELD_COLUMNS = {
+    'posting_id': 's.posting_id',
+    'company_id': 's.company_id',
+    'company_name': 's.company_name',
+    'title': 's.title',
+    'experience_level': 's.experience_level',
+    'education_level': 's.education_level',
+    'employment_type': 's.employment_type',
+    'salary_info': 's.salary_info',
+    'salary_min': 's.salary_min',
+    'salary_max': 's.salary_max',
+    'location_id': 's.location_id',
+    'city': 's.city',
+    'district': 's.district',
+    'deadline_date': 's.deadline_date',
+    'view_count': 's.view_count',
+    'unique_view_count': 's.unique_view_count',
+    'status': 's.status',
+    'created_at': 's.created_at',
+    'deleted_at': 's.deleted_at',
+    'tech_stacks': 's.tech_stack_names',
+    'tech_stack_ids': 's.tech_stack_ids',
+    'categories': 's.category_names',
+    'category_ids': 's.category_ids',
+    'job_description': 'p.job_description'
+}
+
+# 상세 조회에서만 제공하는 필드
+DETAIL_ONLY_COLUMNS = {
+    'company_description': 'c.description as company_description',
+}
+DETAIL_COMPUTED_FIELDS = ('recent_unique_view_count',)
+
+LISTING_FIELDS = tuple(FIELD_COLUMNS)
+DETAIL_FIELDS = LISTING_FIELDS + tuple(DETAIL_ONLY_COLUMNS) + DETAIL_COMPUTED_FIELDS
+
+# 목록 카드 기본 필드 - 본문(job_description) 등 큰 컬럼 제외
+DEFAULT_LISTING_FIELDS = (
+    'posting_id', 'company_id', 'company_name', 'title',
+    'experience_level', 'employment_type', 'salary_info', 'salary_min', 'salary_max',
+    'location_id', 'city', 'district', 'deadline_date',
+    'view_count', 'unique_view_count', 'created_at',
+    'tech_stacks', 'categories'
+)
+
+
+def parse_fields(value: Optional[str], allowed: Tuple[str, ...],
+                 default: Optional[Tuple[str, ...]] = None) -> Tuple[str, ...]:
+    """fields 쿼리 파라미터(쉼표 구분) 검증 - 허용되지 않은 필드가 있으면 ValueError
+
+    posting_id는 항상 포함된다.
+    """
+    if not value:
+        return default or allowed
+
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    return tuple(dict.fromkeys(['posting_id'] + fields))
+
+
+def select_columns(fields: Tuple[str, ...]) -> Tuple[str, bool, bool]:
+    """요청 필드 → (SELECT 목록, job_postings 조인 필요 여부, companies 조인 필요 여부)
+
+    계산 필드(recent_unique_view_count 등)는 SELECT 목록에서 제외된다.
+    """
+    columns: List[str] = []
+    for field in fields:
+        expression = FIELD_COLUMNS.get(field) or DETAIL_ONLY_COLUMNS.get(field)
+        if expression is not None:
+            columns.append(expression)
+
+    join_postings = any(column.startswith('p.') for column in columns)
+    join_companies = any(column.startswith('c.') for column in columns)
+    return ', '.join(columns), join_postings, join_companies
@@ -0,0 +1,186 @@
+from typing import Dict, List, Optional, Tuple
+
+from app.search import search_index, bitmap_index, hangul_phrases
+from app.jobs.pagination import SORT_COLUMNS, normalize_sort, order_clause, keyset_clause
+from app.jobs.read_model import expand_row
+from app.jobs.fields import LISTING_FIELDS, select_columns
+from app.jobs.views import view_counter
+
+# 색인 결과를 IN 목록으로 넘길 최대 ID 수 (넘으면 비트맵 결과는 세미조인, 검색 후보는 LIKE 사용)
+MAX_ID_FILTER = 5000
+
+TAG_FILTERS = ('tech_stacks', 'categories', 'exclude_tech_stacks', 'exclude_categories')
+
+
+def placeholders(count: int) -> str:
+    return ','.join(['%s'] * count)
+
+
+def tag_semijoins(filters: Dict, alias: str = 'p') -> Tuple[List[str], List]:
+    """기술스택/카테고리 조건을 조인 테이블 세미조인으로 표현 (비트맵 결과가 너무 클 때)"""
+    conditions: List[str] = []
+    params: List = []
+
+    for field, table, column in (('tech_stacks', 'posting_tech_stacks', 'stack_id'),
+                                 ('categories', 'posting_categories', 'category_id')):
+        values = filters.get(field)
+        if values:
+            having = ""
+            if field == 'tech_stacks' and filters.get('tech_stacks_mode') == 'all':
+                having = f" GROUP BY t.posting_id HAVING COUNT(DISTINCT t.{column}) = %s"
+            conditions.append(f"""{alias}.posting_id IN (
+                SELECT t.posting_id FROM {table} t
+                WHERE t.{column} IN ({placeholders(len(values))}){having})""")
+            params.extend(values)
+            if having:
+                params.append(len(set(values)))
+
+        excluded = filters.get(f'exclude_{field}')
+        if excluded:
+            conditions.append(f"""{alias}.posting_id NOT IN (
+                SELECT t.posting_id FROM {table} t
+                WHERE t.{column} IN ({placeholders(len(excluded))}))""")
+            params.extend(excluded)
+
+    return conditions, params
+
+
+def build_where(filters: Optional[Dict], alias: str = 'p') -> Tuple[str, List]:
+    """job_postings 단일 테이블 조건으로 WHERE 절 생성
+
+    기술스택/카테고리 조건은 비트맵 색인으로 구한 posting_id 목록으로 바꾸고,
+    결과가 MAX_ID_FILTER를 넘거나 색인이 최신이 아닐 때만 세미조인(IN 서브쿼리)으로 조인 테이블을 참조한다.
+    검색어 후보 ID도 MAX_ID_FILTER를 넘으면 목록 대신 LIKE 조건을 쓴다.
+    """
+    conditions = [f"{alias}.status = 'active'"]
+    params: List = []
+    filters = filters or {}
+
+    candidate_ids = None
+    if filters.get('search'):
+        # 역색인에서 후보 ID를 구하고 SQL은 해당 ID만 조회
+        # (짧은 접두어처럼 후보가 MAX_ID_FILTER를 넘으면 바인드 파라미터 대신 LIKE)
+        candidate_ids = search_index.candidates(filters['search'])
+        if candidate_ids is not None and len(candidate_ids) > MAX_ID_FILTER:
+            candidate_ids = None
+        if candidate_ids is None:
+            conditions.append(f"({alias}.title LIKE %s OR {alias}.job_description LIKE %s)")
+            search_term = f"%{filters['search']}%"
+            params.extend([search_term, search_term])
+        else:
+            # 2-gram이 모두 있어도 연속하지 않는 후보('개발자' → '개발 ... 발자국')는 구간 LIKE로 제외
+            for phrase in hangul_phrases(filters['search']):
+                conditions.append(f"({alias}.title LIKE %s OR {alias}.job_description LIKE %s)")
+                params.extend([f"%{phrase}%", f"%{phrase}%"])
+
+    if any(filters.get(key) for key in TAG_FILTERS):
+        # 기술스택/카테고리 조건은 비트맵 색인으로 ID 집합을 계산해 조인 테이블을 거치지 않는다
+        # (다른 워커의 공고 변경이 아직 반영되지 않은 색인이면 다음 재구성까지 세미조인)
+        matched = bitmap_index.match(filters) if bitmap_index.is_current() else None
+        if matched is not None and candidate_ids is not None:
+            candidate_ids = [posting_id for posting_id in candidate_ids if posting_id in matched]
+        elif matched is not None and len(matched) <= MAX_ID_FILTER:
+            candidate_ids = list(matched)
+        else:
+            tag_conditions, tag_params = tag_semijoins(filters, alias)
+            conditions.extend(tag_conditions)
+            params.extend(tag_params)
+
+    if candidate_ids is not None:
+        if candidate_ids:
+            conditions.append(f"{alias}.posting_id IN ({placeholders(len(candidate_ids))})")
+            params.extend(candidate_ids)
+        else:
+            conditions.append("FALSE")
+
+    if filters.get('location_id'):
+        conditions.append(f"{alias}.location_id = %s")
+        params.append(filters['location_id'])
+
+    # region 필터를 풀어 놓은 location_id 목록 (빈 목록이면 일치하는 지역 없음)
+    if filters.get('location_ids') is not None:
+        if filters['location_ids']:
+            conditions.append(f"{alias}.location_id IN ({placeholders(len(filters['location_ids']))})")
+            params.extend(filters['location_ids'])
+        else:
+            conditions.append("FALSE")
+
+    for field in ('experience_level', 'employment_type'):
+        if filters.get(field):
+            conditions.append(f"{alias}.{field} = %s")
+            params.append(filters[field])
+
+    # 연봉 범위(원/년) - 공고의 범위가 [salary_min, salary_max] 안에 드는 경우 (각각 인덱스 범위 조건)
+    if filters.get('salary_min'):
+        conditions.append(f"{alias}.salary_min >= %s")
+        params.append(filters['salary_min'])
+    if filters.get('salary_max'):
+        conditions.append(f"{alias}.salary_max <= %s")
+        params.append(filters['salary_max'])
+
+    return " WHERE " + " AND ".join(conditions), params
+
+
+def select_page(cursor, where_sql: str, params: List, sort_by: str, limit: int,
+                offset: int = 0, keyset: Optional[Tuple] = None) -> List[Dict]:
+    """1단계: 정렬/페이지에 필요한 컬럼만으로 posting_id 목록 조회"""
+    sort_by = normalize_sort(sort_by)
+    column, _ = SORT_COLUMNS[sort_by]
+    params = list(params)
+
+    query = f"SELECT p.posting_id, p.{column} FROM job_postings p{where_sql}"
+    if keyset:
+        keyset_sql, keyset_params = keyset_clause(sort_by, *keyset)
+        query += keyset_sql
+        params.extend(keyset_params)
+
+    query += order_clause(sort_by)
+    query += " LIMIT %s OFFSET %s"
+    params.extend([limit, offset])
+
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+
+def rank_page(cursor, where_sql: str, params: List, query: str, limit: int,
+              offset: int = 0, keyset: Optional[Tuple] = None) -> Tuple[List[Dict], int]:
+    """1단계(관련도순): 조건에 맞는 posting_id만 조회해 검색 색인의 BM25 점수로 정렬
+
+    본문은 SQL로 읽지 않고 색인의 토큰 빈도로만 점수를 계산한다.
+    (posting_id/score 행 목록, 조건에 맞는 전체 건수) 반환
+    """
+    cursor.execute(f"SELECT p.posting_id FROM job_postings p{where_sql}", params)
+    ranked = search_index.rank(query, [row['posting_id'] for row in cursor.fetchall()])
+    total = len(ranked)
+
+    if keyset:
+        last_score, last_id = keyset
+        ranked = [(posting_id, score) for posting_id, score in ranked if (score, posting_id) < (last_score, last_id)]
+
+    return [{'posting_id': posting_id, 'score': score}
+            for posting_id, score in ranked[offset:offset + limit]], total
+
+
+def hydrate_postings(cursor, posting_ids: List[int], fields: Optional[Tuple[str, ...]] = None,
+                     exclude_deleted: bool = False) -> List[Dict]:
+    """2단계: 선택된 ID의 job_search 읽기 모델 행 조회 (회사/지역/기술스택/카테고리 포함)
+
+    결과는 posting_ids 순서를 유지하며 tech_stacks/categories는 이름 목록이다.
+    fields를 주면 해당 컬럼만 조회한다 (job_description을 요청한 경우에만 job_postings 조인).
+    view_count에는 아직 반영되지 않은 조회수 증가분이 포함된다.
+    """
+    if not posting_ids:
+        return []
+
+    columns, join_postings, _ = select_columns(fields or LISTING_FIELDS)
+    query = f"SELECT {columns} FROM job_search s"
+    if join_postings:
+        query += " JOIN job_postings p ON s.posting_id = p.posting_id"
+    query += f" WHERE s.posting_id IN ({placeholders(len(posting_ids))})"
+    if exclude_deleted:
+        query += " AND s.status != 'deleted'"
+
+    cursor.execute(query, posting_ids)
+    postings = {row['posting_id']: expand_row(row) for row in view_counter.merge(cursor.fetchall())}
+
+    return [postings[posting_id] for posting_id in posting_ids if posting_id in postings]
@@ -1,5 +1,22 @@
 from typing import Dict, List, Optional, Union
 from app.database import get_db
+from app.jobs.events import notify_postings_changed, notify_postings_created
+from app.jobs.pagination import normalize_sort, encode_cursor, decode_cursor, RELEVANCE_SORT, DEFAULT_SORT
+from app.jobs.listing import build_where, select_page, rank_page, hydrate_postings
+from app.jobs.read_model import sync_job_search, expand_row
+from app.jobs.salary import parse_salary
+from app.jobs.reference import reference_registry, normalize_key
+from app.jobs.tags import sync_tags
+from app.jobs.utils import changed_values
+from app.jobs.bulk import validate_items, referenced_ids, fetch_known_ids, insert_postings
+from app.jobs.fields import DEFAULT_LISTING_FIELDS, DETAIL_FIELDS, select_columns
+from app.jobs.views import view_counter
+from app.jobs.unique_views import unique_view_counter
+from app.jobs.related import related_engine
+from app.jobs.counting import posting_counter, filter_signature
+from app.cache.search_cache import search_cache
+from app.search import tokenize, hangul_phrases, search_index, facet_index, suggest_index
+import json
 import logging
 from datetime import datetime
 
@@ -10,41 +27,26 @@ class Job:
         cursor = db.cursor(dictionary=True)
 
         try:
-            query = """
-            SELECT DISTINCT
-                jp.posting_id,
-                c.name as company_name,
-                jp.title,
-                jp.job_description,
-                jp.experience_level,
-                jp.education_level,
-                jp.employment_type,
-                jp.salary_info,
-                jp.location_id,
-                CONCAT(l.city, ' ', COALESCE(l.district, '')) as location,
-                jp.deadline_date,
-                jp.view_count,
-                jp.created_at,
-                GROUP_CONCAT(DISTINCT ts.name) as tech_stacks,
-                GROUP_CONCAT(DISTINCT jc.name) as job_categories
-            FROM job_postings jp
-            JOIN companies c ON jp.company_id = c.company_id
-            LEFT JOIN locations l ON jp.location_id = l.location_id
-            LEFT JOIN posting_tech_stacks pts ON jp.posting_id = pts.posting_id
-            LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-            LEFT JOIN posting_categories pc ON jp.posting_id = pc.posting_id
-            LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
-            WHERE jp.status = 'active'
-            """
-
-            params = []
-
-            if filters.get('keyword'):
-                query += " AND (jp.title LIKE %s OR jp.job_description LIKE %s)"
-                params.extend([f"%{filters['keyword']}%", f"%{filters['keyword']}%"])
-            
+            # 기술스택/카테고리 이름은 메모리 맵으로 ID 변환 (모두 없는 이름이면 결과 없음)
+            tag_filters = {}
+            for field, kind, filter_key in (('tech_stacks', 'tech_stacks', 'tech_stacks'),
+                                            ('job_categories', 'categories', 'categories')):
+                names = filters.get(field, [])
+                if names:
+                    tag_filters[filter_key] = reference_registry.ids(kind, names)
+                    if not tag_filters[filter_key]:
+                        return []
+
+            # 1단계: 조인 없이 job_postings 조건(+비트맵 색인)으로 페이지 ID 선택
+            where_sql, params = build_where({
+                'search': filters.get('keyword'),
+                'location_id': filters.get('location_id'),
+                **tag_filters
+            }, alias='jp')
+            query = f"SELECT jp.posting_id FROM job_postings jp{where_sql}"
+
             if filters.get('company'):
-                query += " AND c.name LIKE %s"
+                query += " AND jp.company_id IN (SELECT company_id FROM companies WHERE name LIKE %s)"
                 params.append(f"%{filters['company']}%")
             
             if filters.get('employment_type'):
@@ -54,31 +56,24 @@ class Job:
             if filters.get('position'):
                 query += " AND jp.title LIKE %s"
                 params.append(f"%{filters['position']}%")
-
-            if filters.get('location_id'):
-                query += " AND jp.location_id = %s"
-                params.append(filters['location_id'])
             
             if filters.get('salary_info'):
-                query += " AND jp.salary_info LIKE %s"
-                params.append(f"%{filters['salary_info']}%")
+                # 금액이 있으면 정규화된 연봉 범위로 비교 (인덱스 범위 조건), 없으면 문구 검색
+                salary_min, salary_max = parse_salary(filters['salary_info'])
+                if salary_min is not None:
+                    query += " AND jp.salary_min >= %s"
+                    params.append(salary_min)
+                if salary_max is not None:
+                    query += " AND jp.salary_max <= %s"
+                    params.append(salary_max)
+                if salary_min is None and salary_max is None:
+                    query += " AND jp.salary_info LIKE %s"
+                    params.append(f"%{filters['salary_info']}%")
             
             if filters.get('experience_level'):
                 query += " AND jp.experience_level = %s"
                 params.append(filters['experience_level'])
 
-            tech_stacks = filters.get('tech_stacks', [])
-            if tech_stacks:
-                query += f" AND ts.name IN ({','.join(['%s'] * len(tech_stacks))})"
-                params.extend(tech_stacks)
-
-            job_categories = filters.get('job_categories', [])
-            if job_categories:
-                query += f" AND jc.name IN ({','.join(['%s'] * len(job_categories))})"
-                params.extend(job_categories)
-
-            query += " GROUP BY jp.posting_id"
-
             valid_sort_fields = {
                 'created_at': 'jp.created_at',
                 'view_count': 'jp.view_count',
@@ -88,25 +83,36 @@ class Job:
 
             sort_field = valid_sort_fields.get(filters.get('sort_field'), 'jp.created_at')
             sort_direction = 'DESC' if filters.get('sort_order', 'desc').lower() == 'desc' else 'ASC'
-            query += f" ORDER BY {sort_field} {sort_direction}"
+            query += f" ORDER BY {sort_field} {sort_direction}, jp.posting_id {sort_direction}"
 
             page_size = 20
             offset = (page - 1) * page_size
             query += f" LIMIT {page_size} OFFSET {offset}"
 
             cursor.execute(query, params)
-            jobs = cursor.fetchall()
-
-            for job in jobs:
-                if job['tech_stacks']:
-                    job['tech_stacks'] = job['tech_stacks'].split(',')
-                else:
-                    job['tech_stacks'] = []
-
-                if job['job_categories']:
-                    job['job_categories'] = job['job_categories'].split(',')
-                else:
-                    job['job_categories'] = []
+            posting_ids = [row['posting_id'] for row in cursor.fetchall()]
+
+            # 2단계: 선택된 ID만 배치 조회
+            jobs = []
+            for posting in hydrate_postings(cursor, posting_ids):
+                jobs.append({
+                    'posting_id': posting['posting_id'],
+                    'company_name': posting['company_name'],
+                    'title': posting['title'],
+                    'job_description': posting['job_description'],
+                    'experience_level': posting['experience_level'],
+                    'education_level': posting['education_level'],
+                    'employment_type': posting['employment_type'],
+                    'salary_info': posting['salary_info'],
+                    'location_id': posting['location_id'],
+                    'location': (f"{posting['city']} {posting['district'] or ''}"
+                                 if posting['city'] else None),
+                    'deadline_date': posting['deadline_date'],
+                    'view_count': posting['view_count'],
+                    'created_at': posting['created_at'],
+                    'tech_stacks': posting['tech_stacks'],
+                    'job_categories': posting['categories']
+                })
 
             return jobs
 
@@ -114,72 +120,35 @@ class Job:
             cursor.close()
 
     @staticmethod
-    def get_job_detail(job_id: int) -> Optional[Dict]:
+    def get_job_detail(job_id: int, visitor: Optional[str] = None) -> Optional[Dict]:
         db = get_db()
         cursor = db.cursor(dictionary=True)
 
         try:
-            cursor.execute(
-                "UPDATE job_postings SET view_count = view_count + 1 WHERE posting_id = %s",
-                (job_id,)
-            )
-            db.commit()
-
-            query = """
-            SELECT 
-                jp.*,
-                c.name as company_name,
-                l.city,
-                l.district,
-                GROUP_CONCAT(DISTINCT ts.name) as tech_stacks,
-                GROUP_CONCAT(DISTINCT jc.name) as job_categories
-            FROM job_postings jp
-            JOIN companies c ON jp.company_id = c.company_id
-            LEFT JOIN locations l ON jp.location_id = l.location_id
-            LEFT JOIN posting_tech_stacks pts ON jp.posting_id = pts.posting_id
-            LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-            LEFT JOIN posting_categories pc ON jp.posting_id = pc.posting_id
-            LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
-            WHERE jp.posting_id = %s AND jp.status != 'deleted'
-            GROUP BY jp.posting_id
-            """
-
-            cursor.execute(query, (job_id,))
+            cursor.execute("""
+                SELECT s.*, p.job_description
+                FROM job_search s
+                JOIN job_postings p ON s.posting_id = p.posting_id
+                WHERE s.posting_id = %s AND s.status != 'deleted'
+            """, (job_id,))
             job = cursor.fetchone()
 
             if not job:
                 return None
 
-            if job['tech_stacks']:
-                job['tech_stacks'] = job['tech_stacks'].split(',')
-            else:
-                job['tech_stacks'] = []
-
-            if job['job_categories']:
-                job['job_categories'] = job['job_categories'].split(',')
-            else:
-                job['job_categories'] = []
-
-            # Get related jobs
-            related_query = """
-            SELECT DISTINCT jp.posting_id, jp.title, c.name as company_name
-            FROM job_postings jp
-            JOIN companies c ON jp.company_id = c.company_id
-            LEFT JOIN posting_tech_stacks pts ON jp.posting_id = pts.posting_id
-            LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-            WHERE jp.status = 'active' 
-            AND jp.posting_id != %s
-            AND (jp.company_id = %s 
-                 OR ts.name IN (SELECT ts2.name 
-                               FROM posting_tech_stacks pts2 
-                               JOIN tech_stacks ts2 ON pts2.stack_id = ts2.stack_id 
-                               WHERE pts2.posting_id = %s))
-            ORDER BY RAND()
-            LIMIT 5
-            """
-
-            cursor.execute(related_query, (job_id, job['company_id'], job_id))
-            job['related_jobs'] = cursor.fetchall()
+            # 조회수는 버퍼에 누적하고 주기적으로 일괄 반영
+            view_counter.increment(job_id)
+            job = view_counter.merge([expand_row(job)])[0]
+            if visitor:
+                unique_view_counter.record(job_id, visitor)
+                job['unique_view_count'] = unique_view_counter.count(job_id)
+            job['job_categories'] = job.pop('categories')
+
+            # 사전 계산된 관련 공고
+            job['related_jobs'] = [
+                {'posting_id': row['posting_id'], 'title': row['title'], 'company_name': row['company_name']}
+                for row in related_engine.get_related(cursor, job_id, limit=5)
+            ]
 
             return job
 
@@ -195,24 +164,7 @@ class Job:
             # Handle location
             location_id = None
             if 'location' in job_data:
-                cursor.execute(
-                    """
-                    SELECT location_id FROM locations 
-                    WHERE city = %s AND (district = %s OR (district IS NULL AND %s IS NULL))
-                    """,
-                    (job_data['location']['city'], job_data['location'].get('district'),
-                     job_data['location'].get('district'))
-                )
-                location_result = cursor.fetchone()
-
-                if location_result:
-                    location_id = location_result['location_id']
-                else:
-                    cursor.execute(
-                        "INSERT INTO locations (city, district) VALUES (%s, %s)",
-                        (job_data['location']['city'], job_data['location'].get('district'))
-                    )
-                    location_id = cursor.lastrowid
+                location_id = reference_registry.resolve_one(cursor, 'locations', job_data['location'])
 
             # Insert job posting
             cursor.execute(
@@ -231,48 +183,12 @@ class Job:
 
             posting_id = cursor.lastrowid
 
-            # Handle tech stacks
-            if job_data.get('tech_stacks'):
-                for tech in job_data['tech_stacks']:
-                    cursor.execute("SELECT stack_id FROM tech_stacks WHERE name = %s", (tech,))
-                    result = cursor.fetchone()
-                    if result:
-                        stack_id = result['stack_id']
-                    else:
-                        cursor.execute(
-                            "INSERT INTO tech_stacks (name, category) VALUES (%s, 'Other')",
-                            (tech,)
-                        )
-                        stack_id = cursor.lastrowid
-
-                    cursor.execute(
-                        "INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s)",
-                        (posting_id, stack_id)
-                    )
-
-            # Handle job categories
-            if job_data.get('job_categories'):
-                for category in job_data['job_categories']:
-                    cursor.execute(
-                        "SELECT category_id FROM job_categories WHERE name = %s",
-                        (category,)
-                    )
-                    result = cursor.fetchone()
-                    if result:
-                        category_id = result['category_id']
-                    else:
-                        cursor.execute(
-                            "INSERT INTO job_categories (name) VALUES (%s)",
-                            (category,)
-                        )
-                        category_id = cursor.lastrowid
-
-                    cursor.execute(
-                        "INSERT INTO posting_categories (posting_id, category_id) VALUES (%s, %s)",
-                        (posting_id, category_id)
-                    )
+            # Handle tech stacks / job categories (이름 → ID 일괄 변환)
+            Job._sync_tag_names(cursor, posting_id, job_data)
 
+            sync_job_search(cursor, [posting_id])
             db.commit()
+            notify_postings_created([posting_id])
             return posting_id
 
         except Exception as e:
@@ -296,7 +212,8 @@ class Job:
                 """,
                 (job_id,)
             )
-            if not cursor.fetchone():
+            current = cursor.fetchone()
+            if not current:
                 return "Job posting not found"
 
             updates = {}
@@ -310,78 +227,24 @@ class Job:
                     updates[field] = job_data[field]
 
             if 'location' in job_data:
-                cursor.execute(
-                    """
-                    SELECT location_id FROM locations 
-                    WHERE city = %s AND (district = %s OR (district IS NULL AND %s IS NULL))
-                    """,
-                    (job_data['location']['city'], job_data['location'].get('district'),
-                     job_data['location'].get('district'))
-                )
-                location_result = cursor.fetchone()
-
-                if location_result:
-                    updates['location_id'] = location_result['location_id']
-                else:
-                    cursor.execute(
-                        "INSERT INTO locations (city, district) VALUES (%s, %s)",
-                        (job_data['location']['city'], job_data['location'].get('district'))
-                    )
-                    updates['location_id'] = cursor.lastrowid
+                updates['location_id'] = reference_registry.resolve_one(cursor, 'locations', job_data['location'])
 
+            # 값이 바뀐 컬럼만 갱신
+            updates = changed_values(current, updates)
             if updates:
                 set_clause = ", ".join(f"{key} = %s" for key in updates)
                 query = f"UPDATE job_postings SET {set_clause} WHERE posting_id = %s"
                 cursor.execute(query, list(updates.values()) + [job_id])
 
-            if 'tech_stacks' in job_data:
-                cursor.execute("DELETE FROM posting_tech_stacks WHERE posting_id = %s", (job_id,))
-                for tech in job_data['tech_stacks']:
-                    cursor.execute("SELECT stack_id FROM tech_stacks WHERE name = %s", (tech,))
-                    result = cursor.fetchone()
-                    if result:
-                        stack_id = result['stack_id']
-                    else:
-                        cursor.execute(
-                            "INSERT INTO tech_stacks (name) VALUES (%s)",
-                            (tech,)
-                        )
-                        stack_id = cursor.lastrowid
-
-                    cursor.execute(
-                        """
-                        INSERT INTO posting_tech_stacks (posting_id, stack_id)
-                        VALUES (%s, %s)
-                        """,
-                        (job_id, stack_id)
-                    )
-
-            if 'job_categories' in job_data:
-                cursor.execute("DELETE FROM posting_categories WHERE posting_id = %s", (job_id,))
-                for category in job_data['job_categories']:
-                    cursor.execute(
-                        "SELECT category_id FROM job_categories WHERE name = %s",
-                        (category,)
-                    )
-                    result = cursor.fetchone()
-                    if result:
-                        category_id = result['category_id']
-                    else:
-                        cursor.execute(
-                            "INSERT INTO job_categories (name) VALUES (%s)",
-                            (category,)
-                        )
-                        category_id = cursor.lastrowid
-
-                    cursor.execute(
-                        """
-                        INSERT INTO posting_categories (posting_id, category_id)
-                        VALUES (%s, %s)
-                        """,
-                        (job_id, category_id)
-                    )
+            tags_changed = Job._sync_tag_names(cursor, job_id, job_data)
 
+            # 바뀐 것이 없으면 읽기 모델/색인/캐시를 건드리지 않는다
+            changed = bool(updates) or tags_changed
+            if changed:
+                sync_job_search(cursor, [job_id])
             db.commit()
+            if changed:
+                notify_postings_changed([job_id])
             return None
 
         except Exception as e:
@@ -412,14 +275,33 @@ class Job:
                 "UPDATE job_postings SET status='deleted' WHERE posting_id=%s",
                 (job_id,)
             )
+            sync_job_search(cursor, [job_id])
             db.commit()
+            notify_postings_changed([job_id])
             return None
 
         except Exception as e:
             db.rollback()
             return str(e)
         finally:
-            cursor.close() 
+            cursor.close()
+
+    @staticmethod
+    def _sync_tag_names(cursor, posting_id: int, job_data: Dict) -> bool:
+        """기술스택/카테고리 이름 목록을 ID로 바꿔 연결을 맞춤 (없는 이름은 생성) - 바뀐 것이 있으면 True
+
+        job_data에 없는 필드는 건드리지 않는다.
+        """
+        changed = False
+        for field, kind in (('tech_stacks', 'tech_stacks'), ('job_categories', 'categories')):
+            if field not in job_data:
+                continue
+            names = job_data[field] or []
+            ids = reference_registry.resolve(cursor, kind, names)
+            tag_ids = [ids[key] for key in (normalize_key(kind, name) for name in names) if key in ids]
+            changed = sync_tags(cursor, posting_id, kind, tag_ids) or changed
+        return changed
+
 
 class JobPosting:
     @staticmethod
@@ -468,7 +350,9 @@ class JobPosting:
                         VALUES (%s, %s)
                     """, (posting_id, stack_id))
 
+            sync_job_search(cursor, [posting_id])
             db.commit()
+            notify_postings_created([posting_id])
             return posting_id, None
 
         except Exception as e:
@@ -479,132 +363,178 @@ class JobPosting:
             cursor.close()
 
     @staticmethod
-    def get_posting(posting_id: int):
+    def create_postings_bulk(user_id: int, items: list):
+        """여러 채용공고를 한 트랜잭션으로 등록 - 항목별 결과 반환 (요청 순서)
+
+        잘못된 항목은 건너뛰고 나머지만 저장한다. 회사는 요청마다 한 번만 찾거나 만든다.
+        """
         db = get_db()
         cursor = db.cursor(dictionary=True)
 
         try:
-            # 채용공고 기본 정보 조회
-            cursor.execute("""
-                SELECT 
-                    p.*,
-                    c.name as company_name,
-                    c.description as company_description,
-                    l.city, l.district,
-                    GROUP_CONCAT(DISTINCT jc.name) as categories,
-                    GROUP_CONCAT(DISTINCT ts.name) as tech_stacks
-                FROM job_postings p
-                LEFT JOIN companies c ON p.company_id = c.company_id
-                LEFT JOIN locations l ON p.location_id = l.location_id
-                LEFT JOIN posting_categories pc ON p.posting_id = pc.posting_id
-                LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
-                LEFT JOIN posting_tech_stacks pts ON p.posting_id = pts.posting_id
-                LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-                WHERE p.posting_id = %s AND p.status = 'active'
-                GROUP BY p.posting_id
-            """, (posting_id,))
+            known_ids = fetch_known_ids(cursor, referenced_ids(items))
+            valid, errors = validate_items(items, known_ids)
+
+            posting_ids = []
+            if valid:
+                # POST /jobs와 같은 사용자별 회사 (있으면 재사용)
+                cursor.execute("""
+                    SELECT company_id FROM companies
+                    WHERE name = CONCAT('Company_', %s)
+                    ORDER BY company_id LIMIT 1
+                """, (user_id,))
+                company = cursor.fetchone()
+                if company:
+                    company_id = company['company_id']
+                else:
+                    cursor.execute("""
+                        INSERT INTO companies (name)
+                        VALUES (CONCAT('Company_', %s))
+                    """, (user_id,))
+                    company_id = cursor.lastrowid
+
+                posting_ids = insert_postings(cursor, company_id, [posting for _, posting in valid])
+                sync_job_search(cursor, posting_ids)
+                db.commit()
+                notify_postings_created(posting_ids)
+
+            created = {index: posting_id for (index, _), posting_id in zip(valid, posting_ids)}
+            results = []
+            for index in range(len(items)):
+                if index in created:
+                    results.append({'index': index, 'status': 'created', 'posting_id': created[index]})
+                else:
+                    results.append({'index': index, 'status': 'error', 'message': errors[index]})
+
+            return {
+                'created': len(created),
+                'failed': len(errors),
+                'results': results
+            }, None
+
+        except Exception as e:
+            db.rollback()
+            logging.error(f"Bulk posting creation error: {str(e)}")
+            return None, str(e)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def record_view(posting_id: int, visitor: str = None):
+        """상세 조회 기록 (조회수, 고유 방문자)"""
+        # 조회수 증가 (버퍼에 누적하고 주기적으로 일괄 반영)
+        view_counter.increment(posting_id)
+
+        # 고유 방문자
+        if visitor:
+            unique_view_counter.record(posting_id, visitor)
+
+    @staticmethod
+    def get_posting(posting_id: int, visitor: str = None, fields: tuple = DETAIL_FIELDS):
+        """채용공고 상세 - visitor(방문자 키)가 있으면 고유 방문자로 기록, fields로 응답 필드 선택"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            # 채용공고 기본 정보 조회 (job_search 읽기 모델, 요청한 경우에만 본문/회사 소개 조인)
+            columns, join_postings, join_companies = select_columns(fields)
+            query = f"SELECT {columns} FROM job_search s"
+            if join_postings:
+                query += " JOIN job_postings p ON s.posting_id = p.posting_id"
+            if join_companies:
+                query += " LEFT JOIN companies c ON s.company_id = c.company_id"
+            query += " WHERE s.posting_id = %s AND s.status = 'active'"
+            cursor.execute(query, (posting_id,))
             
             posting = cursor.fetchone()
             if not posting:
                 return None, "Posting not found"
 
-            # 조회수 증가
-            cursor.execute("""
-                UPDATE job_postings 
-                SET view_count = view_count + 1 
-                WHERE posting_id = %s
-            """, (posting_id,))
-            
-            db.commit()
+            JobPosting.record_view(posting_id, visitor)
+            posting = view_counter.merge([expand_row(posting)])[0]
+
+            # 고유 방문자 수 (원본 조회수와 함께 제공, 최근 7일 값은 일별 키 기준)
+            if 'unique_view_count' in fields:
+                posting['unique_view_count'] = unique_view_counter.count(posting_id)
+            if 'recent_unique_view_count' in fields:
+                posting['recent_unique_view_count'] = unique_view_counter.count(posting_id, days=7)
+
             return posting, None
 
         except Exception as e:
-            db.rollback()
             logging.error(f"Posting fetch error: {str(e)}")
             return None, str(e)
         finally:
             cursor.close()
 
     @staticmethod
-    def search_postings(filters: dict = None, sort_by: str = None, page: int = 1, per_page: int = 10):
+    def search_postings(filters: dict = None, sort_by: str = None, page: int = 1, per_page: int = 10,
+                        page_cursor: str = None, count_mode: str = 'exact',
+                        fields: tuple = DEFAULT_LISTING_FIELDS):
         db = get_db()
         cursor = db.cursor(dictionary=True)
 
         try:
-            # 기본 쿼리 구성
-            query = """
-                SELECT 
-                    p.*,
-                    c.name as company_name,
-                    l.city, l.district,
-                    GROUP_CONCAT(DISTINCT jc.name) as categories,
-                    GROUP_CONCAT(DISTINCT ts.name) as tech_stacks
-                FROM job_postings p
-                LEFT JOIN companies c ON p.company_id = c.company_id
-                LEFT JOIN locations l ON p.location_id = l.location_id
-                LEFT JOIN posting_categories pc ON p.posting_id = pc.posting_id
-                LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
-                LEFT JOIN posting_tech_stacks pts ON p.posting_id = pts.posting_id
-                LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-                WHERE p.status = 'active'
-            """
-            params = []
-
-            # 필터 적용
-            if filters:
-                if 'search' in filters:
-                    query += " AND (p.title LIKE %s OR p.job_description LIKE %s)"
-                    search_term = f"%{filters['search']}%"
-                    params.extend([search_term, search_term])
-                
-                if 'location_id' in filters:
-                    query += " AND p.location_id = %s"
-                    params.append(filters['location_id'])
-                
-                if 'categories' in filters:
-                    query += " AND jc.category_id IN (%s)"
-                    params.append(filters['categories'])
-                
-                if 'tech_stacks' in filters:
-                    query += " AND ts.stack_id IN (%s)"
-                    params.append(filters['tech_stacks'])
-
-            # 그룹화
-            query += " GROUP BY p.posting_id"
-
-            # 정렬
-            if sort_by == 'latest':
-                query += " ORDER BY p.created_at DESC"
-            elif sort_by == 'views':
-                query += " ORDER BY p.view_count DESC"
-            elif sort_by == 'deadline':
-                query += " ORDER BY p.deadline_date ASC"
-
-            # 페이지네이션
-            query += " LIMIT %s OFFSET %s"
-            params.extend([per_page, (page - 1) * per_page])
+            sort_by = normalize_sort(sort_by)
+            search = (filters or {}).get('search')
+            if sort_by == RELEVANCE_SORT and not (search and tokenize(search)):
+                # 색인할 검색어가 없으면 관련도를 매길 수 없으므로 최신순
+                sort_by = DEFAULT_SORT
+
+            # 정규화한 조회 조건이 같으면 캐시된 결과 사용 (공고 변경 시 태그 단위로 무효화)
+            signature = json.dumps([filter_signature(filters), sort_by, None if page_cursor else page,
+                                    per_page, page_cursor, count_mode, sorted(fields)])
+            cached = search_cache.get(signature)
+            if cached is not None:
+                return cached, None
+
+            if page_cursor:
+                try:
+                    last_value, last_id = decode_cursor(page_cursor, sort_by)
+                except ValueError as e:
+                    return None, str(e)
+
+            # 1단계: job_postings 조건만으로 페이지의 posting_id 선택
+            #        (다음 페이지 존재 여부 확인을 위해 1건 더 조회)
+            #        관련도순은 조건에 맞는 ID를 검색 색인의 BM25 점수로 정렬
+            where_sql, params = build_where(filters)
+            keyset = (last_value, last_id) if page_cursor else None
+            offset = 0 if page_cursor else (page - 1) * per_page
+            ranked_total = None
+            if sort_by == RELEVANCE_SORT:
+                page_rows, ranked_total = rank_page(cursor, where_sql, params, search, per_page + 1,
+                                                    offset=offset, keyset=keyset)
+            else:
+                page_rows = select_page(cursor, where_sql, params, sort_by, per_page + 1,
+                                        offset=offset, keyset=keyset)
 
-            cursor.execute(query, params)
-            postings = cursor.fetchall()
-
-            # 전체 결과 수 조회
-            count_query = """
-                SELECT COUNT(DISTINCT p.posting_id) as total
-                FROM job_postings p
-                LEFT JOIN posting_categories pc ON p.posting_id = pc.posting_id
-                LEFT JOIN posting_tech_stacks pts ON p.posting_id = pts.posting_id
-                WHERE p.status = 'active'
-            """
-            cursor.execute(count_query)
-            total = cursor.fetchone()['total']
+            next_cursor = None
+            if len(page_rows) > per_page:
+                page_rows = page_rows[:per_page]
+                next_cursor = encode_cursor(sort_by, page_rows[-1])
 
-            return {
+            # 2단계: 선택된 ID만 회사/지역/태그 정보 배치 조회
+            postings = hydrate_postings(cursor, [row['posting_id'] for row in page_rows], fields)
+
+            # 전체 결과 수 - 목록과 같은 조건 사용 (count=false면 생략, estimate면 추정치)
+            #                관련도순은 정렬하면서 이미 정확한 건수를 구했으므로 재사용
+            if ranked_total is not None and count_mode != 'none':
+                total, exact = ranked_total, True
+            else:
+                total, exact = posting_counter.count(cursor, filters, count_mode,
+                                                     where=(where_sql, params))
+
+            result = {
                 'postings': postings,
                 'total': total,
-                'page': page,
+                'total_estimated': total is not None and not exact,
+                'page': None if page_cursor else page,
                 'per_page': per_page,
-                'total_pages': (total + per_page - 1) // per_page
-            }, None
+                'total_pages': (total + per_page - 1) // per_page if total is not None else None,
+                'next_cursor': next_cursor
+            }
+            search_cache.set(signature, result, filters)
+            return result, None
 
         except Exception as e:
             logging.error(f"Posting search error: {str(e)}")
@@ -612,6 +542,65 @@ class JobPosting:
         finally:
             cursor.close()
 
+    @staticmethod
+    def get_postings_batch(posting_ids: list, fields: tuple = DEFAULT_LISTING_FIELDS):
+        """여러 채용공고를 한 번에 조회 - 요청 순서 유지, 없거나 삭제된 ID는 제외
+
+        상세 조회와 달리 조회수를 증가시키지 않는다.
+        """
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            return hydrate_postings(cursor, posting_ids, fields, exclude_deleted=True), None
+
+        except Exception as e:
+            logging.error(f"Posting batch fetch error: {str(e)}")
+            return None, str(e)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def get_facets(filters: dict = None, limit: int = 20):
+        """현재 필터 조건의 패싯(기술스택/카테고리/지역/경력/고용형태)별 공고 수"""
+        filters = filters or {}
+
+        try:
+            candidate_ids = None
+            if filters.get('search'):
+                candidate_ids = search_index.candidates(filters['search'])
+
+            # 색인할 토큰이 없는 검색어, 본문 확인이 필요한 한글 구간과 연봉 범위 조건은 SQL로 후보 조회
+            sql_filters = {key: filters[key] for key in ('salary_min', 'salary_max') if filters.get(key)}
+            if filters.get('search') and (candidate_ids is None or hangul_phrases(filters['search'])):
+                sql_filters['search'] = filters['search']
+            if sql_filters:
+                db = get_db()
+                cursor = db.cursor(dictionary=True)
+                try:
+                    where_sql, params = build_where(sql_filters)
+                    cursor.execute(f"SELECT p.posting_id FROM job_postings p{where_sql}", params)
+                    matched = {row['posting_id'] for row in cursor.fetchall()}
+                finally:
+                    cursor.close()
+                candidate_ids = matched if candidate_ids is None else candidate_ids & matched
+
+            return facet_index.counts(filters, candidate_ids, limit), None
+
+        except Exception as e:
+            logging.error(f"Facet count error: {str(e)}")
+            return None, str(e)
+
+    @staticmethod
+    def get_suggestions(query: str, limit: int = 5):
+        """검색어 자동완성 - 공고 제목/회사명/기술스택명 접두어 일치 (인메모리 색인만 사용)"""
+        try:
+            return suggest_index.suggest(query, limit), None
+
+        except Exception as e:
+            logging.error(f"Suggestion error: {str(e)}")
+            return None, str(e)
+
     @staticmethod
     def update_posting(posting_id: int, company_id: int, data: dict):
         db = get_db()
@@ -620,15 +609,16 @@ class JobPosting:
         try:
             # 채용공고 존재 여부 및 권한 확인
             cursor.execute("""
-                SELECT posting_id 
+                SELECT *
                 FROM job_postings 
                 WHERE posting_id = %s AND company_id = %s AND status = 'active'
             """, (posting_id, company_id))
             
-            if not cursor.fetchone():
+            current = cursor.fetchone()
+            if not current:
                 return "Posting not found or unauthorized"
 
-            # 기본 정보 업데이트
+            # 기본 정보 업데이트 (값이 바뀐 컬럼만)
             update_fields = []
             update_values = []
             
@@ -643,10 +633,11 @@ class JobPosting:
                 'deadline_date': 'deadline_date'
             }
 
-            for key, field in field_mappings.items():
-                if key in data:
-                    update_fields.append(f"{field} = %s")
-                    update_values.append(data[key])
+            updates = changed_values(current, {field: data[key] for key, field in field_mappings.items()
+                                               if key in data})
+            for field, value in updates.items():
+                update_fields.append(f"{field} = %s")
+                update_values.append(value)
 
             if update_fields:
                 update_values.extend([posting_id, company_id])
@@ -657,25 +648,18 @@ class JobPosting:
                 """
                 cursor.execute(query, update_values)
 
-            # 직무 카테고리 업데이트
-            if 'categories' in data:
-                cursor.execute("DELETE FROM posting_categories WHERE posting_id = %s", (posting_id,))
-                for category_id in data['categories']:
-                    cursor.execute("""
-                        INSERT INTO posting_categories (posting_id, category_id)
-                        VALUES (%s, %s)
-                    """, (posting_id, category_id))
-
-            # 기술 스택 업데이트
-            if 'tech_stacks' in data:
-                cursor.execute("DELETE FROM posting_tech_stacks WHERE posting_id = %s", (posting_id,))
-                for stack_id in data['tech_stacks']:
-                    cursor.execute("""
-                        INSERT INTO posting_tech_stacks (posting_id, stack_id)
-                        VALUES (%s, %s)
-                    """, (posting_id, stack_id))
+            # 직무 카테고리 / 기술 스택 업데이트 (현재 연결과의 차이만 반영)
+            changed = bool(update_fields)
+            for kind in ('categories', 'tech_stacks'):
+                if kind in data:
+                    changed = sync_tags(cursor, posting_id, kind, data[kind] or []) or changed
 
+            # 바뀐 것이 없으면 읽기 모델/색인/캐시를 건드리지 않는다
+            if changed:
+                sync_job_search(cursor, [posting_id])
             db.commit()
+            if changed:
+                notify_postings_changed([posting_id])
             return None
 
         except Exception as e:
@@ -718,7 +702,9 @@ class JobPosting:
 
             # 북마크는 그대로 유지 (히스토리 목적)
             
+            sync_job_search(cursor, [posting_id])
             db.commit()
+            notify_postings_changed([posting_id])
             return None
 
         except Exception as e:
@@ -735,50 +721,9 @@ class JobPosting:
         cursor = db.cursor(dictionary=True)
         
         try:
-            # 현재 공고의 회사ID와 기술스택 조회
-            cursor.execute("""
-                SELECT company_id, 
-                       GROUP_CONCAT(stack_id) as tech_stacks
-                FROM job_postings j
-                LEFT JOIN posting_tech_stacks pt ON j.posting_id = pt.posting_id
-                WHERE j.posting_id = %s
-                GROUP BY j.posting_id
-            """, (posting_id,))
-            
-            current_job = cursor.fetchone()
-            if not current_job:
-                return [], "Job posting not found"
-            
-            # 관련 공고 조회 (같은 회사의 다른 공고 또는 비슷한 기술스택을 가진 공고)
-            cursor.execute("""
-                SELECT DISTINCT j.*, c.name as company_name,
-                       GROUP_CONCAT(DISTINCT t.name) as tech_stacks
-                FROM job_postings j
-                LEFT JOIN companies c ON j.company_id = c.company_id
-                LEFT JOIN posting_tech_stacks pt ON j.posting_id = pt.posting_id
-                LEFT JOIN tech_stacks t ON pt.stack_id = t.stack_id
-                WHERE j.posting_id != %s 
-                AND j.deleted_at IS NULL
-                AND (j.company_id = %s 
-                     OR pt.stack_id IN (
-                         SELECT stack_id 
-                         FROM posting_tech_stacks 
-                         WHERE posting_id = %s
-                     ))
-                GROUP BY j.posting_id
-                ORDER BY j.created_at DESC
-                LIMIT %s
-            """, (posting_id, current_job['company_id'], posting_id, limit))
-            
-            related_jobs = cursor.fetchall()
-            
-            # tech_stacks 처리
-            for job in related_jobs:
-                if job['tech_stacks']:
-                    job['tech_stacks'] = job['tech_stacks'].split(',')
-                else:
-                    job['tech_stacks'] = []
-                
+            # 사전 계산된 관련 공고 (기술스택 가중 유사도 + 같은 회사/카테고리 가산점)
+            related_jobs = [expand_row(job) for job in related_engine.get_related(cursor, posting_id, limit)]
+
             return related_jobs, None
             
         except Exception as e:
@@ -0,0 +1,91 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+# 정렬 기준별 (정렬 컬럼, 방향) - 동일 값은 posting_id로 순서를 고정
+SORT_COLUMNS = {
+    'latest': ('created_at', 'DESC'),
+    # 새로고침/봇에 영향받지 않도록 고유 방문자 수 기준
+    'views': ('unique_view_count', 'DESC'),
+    'deadline': ('deadline_date', 'ASC'),
+    # 최소 연봉 높은 순 (급여 정보가 없는 공고는 마지막)
+    'salary': ('salary_min', 'DESC')
+}
+
+# 검색 색인의 BM25 점수로 메모리에서 정렬하는 기준 (커서 키: 점수)
+RELEVANCE_SORT = 'relevance'
+
+DEFAULT_SORT = 'latest'
+
+
+def normalize_sort(sort_by: Optional[str]) -> str:
+    return sort_by if sort_by in SORT_COLUMNS or sort_by == RELEVANCE_SORT else DEFAULT_SORT
+
+
+def _sort_key_column(sort_by: str) -> str:
+    return 'score' if sort_by == RELEVANCE_SORT else SORT_COLUMNS[sort_by][0]
+
+
+def order_clause(sort_by: str, alias: str = 'p') -> str:
+    column, direction = SORT_COLUMNS[normalize_sort(sort_by)]
+    return f" ORDER BY {alias}.{column} {direction}, {alias}.posting_id {direction}"
+
+
+def encode_cursor(sort_by: str, row: Dict) -> str:
+    """마지막 행의 (정렬 키, posting_id)를 불투명 커서 문자열로 변환"""
+    sort_by = normalize_sort(sort_by)
+    value = row.get(_sort_key_column(sort_by))
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+
+    payload = json.dumps({'s': sort_by, 'k': value, 'id': row['posting_id']},
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[object, int]:
+    """커서 문자열을 (정렬 키, posting_id)로 복원 - 형식 오류 시 ValueError"""
+    sort_by = normalize_sort(sort_by)
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_key, value, posting_id = payload['s'], payload['k'], int(payload['id'])
+
+        if value is not None:
+            if sort_key == 'latest':
+                value = datetime.fromisoformat(value)
+            elif sort_key == 'deadline':
+                value = date.fromisoformat(value)
+            elif sort_key == RELEVANCE_SORT:
+                value = float(value)
+            else:
+                value = int(value)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if sort_key != sort_by:
+        raise ValueError("Cursor does not match sort order")
+    return value, posting_id
+
+
+def keyset_clause(sort_by: str, value, posting_id: int, alias: str = 'p') -> Tuple[str, List]:
+    """커서 이후 행만 조회하는 WHERE 조건
+
+    MySQL은 오름차순에서 NULL을 먼저, 내림차순에서 NULL을 나중에 정렬하므로
+    정렬 키가 NULL인 행도 같은 순서로 이어지도록 조건을 만든다.
+    """
+    column, direction = SORT_COLUMNS[normalize_sort(sort_by)]
+    col = f"{alias}.{column}"
+    pid = f"{alias}.posting_id"
+    op = '<' if direction == 'DESC' else '>'
+
+    if direction == 'ASC':
+        if value is None:
+            return f" AND (({col} IS NULL AND {pid} {op} %s) OR {col} IS NOT NULL)", [posting_id]
+        return f" AND ({col} {op} %s OR ({col} = %s AND {pid} {op} %s))", [value, value, posting_id]
+
+    if value is None:
+        return f" AND ({col} IS NULL AND {pid} {op} %s)", [posting_id]
+    return (f" AND ({col} {op} %s OR ({col} = %s AND {pid} {op} %s) OR {col} IS NULL)",
+            [value, value, posting_id])
@@ -0,0 +1,141 @@
+"""job_search 읽기 모델 - 공고당 한 행으로 회사/지역/기술스택/카테고리를 비정규화
+
+쓰기 경로는 커밋 전에 같은 트랜잭션에서 sync_job_search()를 호출해 행을 갱신한다.
+(원본의 파생 컬럼인 연봉 범위 salary_min/salary_max도 이때 다시 계산된다)
+전체 재구성: python -m app.jobs.read_model
+"""
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from app.jobs.salary import sync_salary_ranges
+
+# 이름 목록 구분자 (기술스택/카테고리 이름에 쉼표가 들어갈 수 있어 '|' 사용)
+NAME_SEPARATOR = '|'
+
+REBUILD_BATCH_SIZE = 1000
+
+JOB_SEARCH_COLUMNS = (
+    'posting_id', 'company_id', 'company_name', 'title',
+    'experience_level', 'education_level', 'employment_type', 'salary_info',
+    'salary_min', 'salary_max', 'location_id', 'city', 'district', 'deadline_date',
+    'view_count', 'unique_view_count', 'status', 'created_at', 'deleted_at',
+    'tech_stack_ids', 'tech_stack_names', 'category_ids', 'category_names'
+)
+
+_SELECT_SQL = f"""
+    SELECT
+        p.posting_id, p.company_id, c.name, p.title,
+        p.experience_level, p.education_level, p.employment_type, p.salary_info,
+        p.salary_min, p.salary_max, p.location_id, l.city, l.district, p.deadline_date,
+        p.view_count, p.unique_view_count, p.status, p.created_at, p.deleted_at,
+        (SELECT GROUP_CONCAT(pts.stack_id ORDER BY pts.stack_id)
+         FROM posting_tech_stacks pts WHERE pts.posting_id = p.posting_id),
+        (SELECT GROUP_CONCAT(ts.name ORDER BY ts.stack_id SEPARATOR '{NAME_SEPARATOR}')
+         FROM posting_tech_stacks pts JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
+         WHERE pts.posting_id = p.posting_id),
+        (SELECT GROUP_CONCAT(pc.category_id ORDER BY pc.category_id)
+         FROM posting_categories pc WHERE pc.posting_id = p.posting_id),
+        (SELECT GROUP_CONCAT(jc.name ORDER BY jc.category_id SEPARATOR '{NAME_SEPARATOR}')
+         FROM posting_categories pc JOIN job_categories jc ON pc.category_id = jc.category_id
+         WHERE pc.posting_id = p.posting_id)
+    FROM job_postings p
+    LEFT JOIN companies c ON p.company_id = c.company_id
+    LEFT JOIN locations l ON p.location_id = l.location_id
+"""
+
+
+def sync_job_search(cursor, posting_ids: Iterable[int]):
+    """공고 원본 기준으로 job_search 행 갱신 (호출한 쪽 트랜잭션에서 실행, 커밋하지 않음)
+
+    원본이 없어진 공고는 job_search에서도 삭제된다.
+    """
+    posting_ids = [posting_id for posting_id in dict.fromkeys(posting_ids) if posting_id]
+    if not posting_ids:
+        return
+
+    for start in range(0, len(posting_ids), REBUILD_BATCH_SIZE):
+        chunk = posting_ids[start:start + REBUILD_BATCH_SIZE]
+        id_list = ','.join(['%s'] * len(chunk))
+        sync_salary_ranges(cursor, chunk)
+        cursor.execute(f"DELETE FROM job_search WHERE posting_id IN ({id_list})", chunk)
+        cursor.execute(f"""
+            INSERT INTO job_search ({', '.join(JOB_SEARCH_COLUMNS)})
+            {_SELECT_SQL}
+            WHERE p.posting_id IN ({id_list})
+        """, chunk)
+
+
+def split_names(value: Optional[str]) -> List[str]:
+    return value.split(NAME_SEPARATOR) if value else []
+
+
+def split_ids(value: Optional[str]) -> List[int]:
+    return [int(x) for x in value.split(',')] if value else []
+
+
+def expand_row(row: Dict) -> Dict:
+    """job_search 행의 GROUP_CONCAT 컬럼을 목록으로 변환
+
+    tech_stacks/categories: 이름 목록, tech_stack_ids/category_ids: ID 목록
+    (조회한 컬럼만 변환)
+    """
+    for column in ('tech_stack_ids', 'category_ids'):
+        if column in row:
+            row[column] = split_ids(row[column])
+    for column, field in (('tech_stack_names', 'tech_stacks'), ('category_names', 'categories')):
+        if column in row:
+            row[field] = split_names(row.pop(column))
+    return row
+
+
+def rebuild_job_search(db, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """job_search 전체 재구성 - posting_id 구간별로 나눠 커밋"""
+    cursor = db.cursor()
+    rebuilt = 0
+
+    try:
+        # 원본이 없는 행 정리
+        cursor.execute("""
+            DELETE s FROM job_search s
+            LEFT JOIN job_postings p ON s.posting_id = p.posting_id
+            WHERE p.posting_id IS NULL
+        """)
+        db.commit()
+
+        last_id = 0
+        while True:
+            cursor.execute("""
+                SELECT posting_id FROM job_postings
+                WHERE posting_id > %s
+                ORDER BY posting_id
+                LIMIT %s
+            """, (last_id, batch_size))
+            posting_ids = [row[0] for row in cursor.fetchall()]
+            if not posting_ids:
+                break
+
+            sync_job_search(cursor, posting_ids)
+            db.commit()
+
+            rebuilt += len(posting_ids)
+            last_id = posting_ids[-1]
+            logging.info(f"job_search rebuilt: {rebuilt} postings")
+
+        return rebuilt
+
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+# CLI 실행을 위한 코드
+if __name__ == '__main__':
+    from app import create_app
+    from app.database import get_db
+
+    app = create_app()
+    with app.app_context():
+        count = rebuild_job_search(get_db())
+        print(f"job_search rebuild completed: {count} postings")
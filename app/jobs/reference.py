@@ -0,0 +1,160 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.database import get_db
+
+# 종류 → (테이블, ID 컬럼, 이름 컬럼)
+REFERENCE_TABLES = {
+    'tech_stacks': ('tech_stacks', 'stack_id', ('name',)),
+    'categories': ('job_categories', 'category_id', ('name',)),
+    'locations': ('locations', 'location_id', ('city', 'district'))
+}
+
+
+def name_values(kind: str, value) -> Tuple:
+    """이름 → 이름 컬럼 값 (앞뒤 공백 제거)
+
+    기술스택/카테고리는 이름 문자열, 지역은 {'city', 'district'} 또는 (city, district)
+    """
+    if kind == 'locations':
+        city, district = (value.get('city'), value.get('district')) if isinstance(value, dict) else value
+        return ((city or '').strip(), district.strip() if district and district.strip() else None)
+    return ((value or '').strip(),)
+
+
+def normalize_key(kind: str, value) -> Tuple:
+    """이름 → 조회 키 (컬럼 collation과 같이 대소문자 무시)"""
+    return tuple(part.lower() if part else part for part in name_values(kind, value))
+
+
+class ReferenceRegistry:
+    """기술스택/직무 카테고리/지역의 이름 → ID 메모리 맵
+
+    공고 쓰기 경로에서 이름마다 SELECT/INSERT 하던 것을 종류별 배치 한 번으로 처리한다.
+    맵에 없는 이름만 DB에서 확인하고, 없는 행은 다중 행 INSERT IGNORE 한 번으로 만든다.
+    호출한 쪽 트랜잭션이 롤백될 수 있으므로 이번에 만든 행은 맵에 넣지 않고
+    다음 조회 때(이미 있는 행으로 확인되면) 맵에 추가한다.
+    locations는 (city, district) 유일 키가 없어 동시에 같은 지역을 만들면 중복 행이 생길 수 있으며,
+    이때는 가장 작은 ID를 사용한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._maps: Dict[str, Dict[Tuple, int]] = {kind: {} for kind in REFERENCE_TABLES}
+        self._loaded_at: Optional[float] = None
+        # 다른 프로세스가 추가한 행을 반영하기 위한 주기적 재적재 (초)
+        self.max_age = int(os.getenv('SEARCH_INDEX_MAX_AGE', 600))
+
+    def ensure_loaded(self):
+        if self._loaded_at is None or time.time() - self._loaded_at > self.max_age:
+            self.load()
+
+    def load(self):
+        """세 테이블 전체 적재"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            maps = {}
+            for kind, (table, id_column, name_columns) in REFERENCE_TABLES.items():
+                cursor.execute(f"SELECT {id_column}, {', '.join(name_columns)} FROM {table} ORDER BY {id_column}")
+                maps[kind] = self._rows_to_map(kind, cursor.fetchall())
+        finally:
+            cursor.close()
+
+        with self._lock:
+            self._maps = maps
+            self._loaded_at = time.time()
+
+        logging.info("Reference registry loaded: " + ', '.join(f"{len(m)} {kind}" for kind, m in maps.items()))
+
+    def ids(self, kind: str, names: Iterable) -> List[int]:
+        """이름 목록 → 있는 ID 목록 (없는 이름은 제외, 메모리만 조회)"""
+        self.ensure_loaded()
+        with self._lock:
+            mapping = self._maps[kind]
+            found = (mapping.get(normalize_key(kind, name)) for name in names)
+            return list(dict.fromkeys(x for x in found if x is not None))
+
+    def resolve(self, cursor, kind: str, names: Iterable) -> Dict[Tuple, int]:
+        """이름 목록 → {조회 키: ID}, 없는 행은 만든다 (호출한 쪽 트랜잭션, 커밋하지 않음)"""
+        # 조회 키 → 입력한 표기 (새 행은 입력한 표기대로 만든다)
+        values: Dict[Tuple, Tuple] = {}
+        for name in names:
+            key = normalize_key(kind, name)
+            if key[0] and key not in values:
+                values[key] = name_values(kind, name)
+        keys = list(values)
+        if not keys:
+            return {}
+
+        self.ensure_loaded()
+        with self._lock:
+            resolved = {key: self._maps[kind][key] for key in keys if key in self._maps[kind]}
+
+        missing = [key for key in keys if key not in resolved]
+        if missing:
+            # 다른 워커가 만든 행 - 이미 커밋된 행이므로 맵에 추가
+            existing = self._select(cursor, kind, [values[key] for key in missing])
+            with self._lock:
+                self._maps[kind].update(existing)
+            resolved.update(existing)
+
+            created = [key for key in missing if key not in existing]
+            if created:
+                self._insert(cursor, kind, [values[key] for key in created])
+                resolved.update(self._select(cursor, kind, [values[key] for key in created]))
+
+        return resolved
+
+    def resolve_one(self, cursor, kind: str, name) -> Optional[int]:
+        return self.resolve(cursor, kind, [name]).get(normalize_key(kind, name))
+
+    @staticmethod
+    def _rows_to_map(kind: str, rows: List[Dict]) -> Dict[Tuple, int]:
+        """행 목록 → {조회 키: ID} (같은 키가 여러 행이면 가장 작은 ID)"""
+        _, id_column, name_columns = REFERENCE_TABLES[kind]
+        mapping: Dict[Tuple, int] = {}
+        for row in rows:
+            key = normalize_key(kind, tuple(row[column] for column in name_columns)
+                                if kind == 'locations' else row[name_columns[0]])
+            if key not in mapping or row[id_column] < mapping[key]:
+                mapping[key] = row[id_column]
+        return mapping
+
+    @staticmethod
+    def _select(cursor, kind: str, values: List[Tuple]) -> Dict[Tuple, int]:
+        """이름 컬럼 값 목록의 현재 행 (다른 트랜잭션이 방금 커밋한 행도 보이도록 잠금 읽기)"""
+        table, id_column, name_columns = REFERENCE_TABLES[kind]
+        if kind == 'locations':
+            condition = ' OR '.join(['(city = %s AND district <=> %s)'] * len(values))
+            params = [value for row_values in values for value in row_values]
+        else:
+            condition = f"name IN ({','.join(['%s'] * len(values))})"
+            params = [row_values[0] for row_values in values]
+
+        cursor.execute(f"""
+            SELECT {id_column}, {', '.join(name_columns)} FROM {table}
+            WHERE {condition}
+            LOCK IN SHARE MODE
+        """, params)
+        rows = [row if isinstance(row, dict) else dict(zip((id_column,) + name_columns, row))
+                for row in cursor.fetchall()]
+        return ReferenceRegistry._rows_to_map(kind, rows)
+
+    @staticmethod
+    def _insert(cursor, kind: str, values: List[Tuple]):
+        """없는 행을 다중 행 INSERT IGNORE 한 번으로 생성"""
+        table, _, name_columns = REFERENCE_TABLES[kind]
+        rows_sql = ', '.join([f"({', '.join(['%s'] * len(name_columns))})"] * len(values))
+        cursor.execute(f"""
+            INSERT IGNORE INTO {table} ({', '.join(name_columns)})
+            VALUES {rows_sql}
+        """, [value for row_values in values for value in row_values])
+
+
+# 싱글톤 인스턴스 생성
+reference_registry = ReferenceRegistry()
@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.database import get_db
+from app.config.location_config import LocationConfig
+from app.search import search_index
+
+# 앞 두 글자로 줄여지지 않는 도 이름 (전라북도 → 전북 등)
+_CITY_ALIASES = {
+    '전라북도': '전북', '전북특별자치도': '전북', '전라남도': '전남',
+    '경상북도': '경북', '경상남도': '경남', '충청북도': '충북', '충청남도': '충남'
+}
+
+# 시/도 전체를 뜻하는 하위 지역 표기
+_WHOLE_REGION = ('전체', '전지역')
+
+
+class RegionIndex:
+    """지역 필터(region) → locations.location_id 목록
+
+    LocationConfig의 지역 그룹(수도권 등), 시/도명(서울), 사람인 지역 코드(101000),
+    '시/도 구/군'(서울 강남구) 표기를 locations 행으로 미리 풀어 두고
+    목록 조회는 location_id IN (...) 한 번으로 처리한다.
+    locations 행은 새 지역이 붙은 공고가 생길 때(refresh)와 주기적으로 다시 읽는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._config = LocationConfig()
+        # 시/도 이름 → 사람인 지역 코드
+        self._city_codes: Dict[str, str] = {
+            city: code for cities in self._config.get_groups().values() for city, code in cities.items()
+        }
+        self._by_code: Dict[str, Set[int]] = {}
+        self._by_district: Dict[Tuple[str, str], Set[int]] = {}
+        self._known_ids: Set[int] = set()
+        self._loaded_at: Optional[float] = None
+
+    def ensure_loaded(self):
+        if self._loaded_at is None or time.time() - self._loaded_at > search_index.max_age:
+            self.load()
+
+    def load(self):
+        """locations 전체를 지역 코드별로 분류"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            cursor.execute("SELECT location_id, city, code, district FROM locations")
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        by_code: Dict[str, Set[int]] = {}
+        by_district: Dict[Tuple[str, str], Set[int]] = {}
+        for row in rows:
+            code = self.city_code(row['city'], row.get('code'))
+            if code is None:
+                continue
+            by_code.setdefault(code, set()).add(row['location_id'])
+            if row['district']:
+                by_district.setdefault((code, row['district']), set()).add(row['location_id'])
+
+        with self._lock:
+            self._by_code = by_code
+            self._by_district = by_district
+            self._known_ids = {row['location_id'] for row in rows}
+            self._loaded_at = time.time()
+
+        logging.info(f"Region index loaded: {len(rows)} locations")
+
+    def refresh(self, location_ids: Iterable[int]) -> bool:
+        """처음 보는 location_id가 있으면 locations 다시 적재 (공고 변경 후 호출) - 다시 적재했으면 True"""
+        if self._loaded_at is None:
+            return False
+        if any(location_id not in self._known_ids for location_id in location_ids if location_id):
+            self.load()
+            return True
+        return False
+
+    def city_code(self, city: Optional[str], code: Optional[str] = None) -> Optional[str]:
+        """locations.city(서울특별시, 경기도, 전라북도 ...) → 사람인 지역 코드"""
+        if code and code in self._city_codes.values():
+            return code
+        if not city:
+            return None
+        city = _CITY_ALIASES.get(city, city)
+        for name, city_code in self._city_codes.items():
+            if city.startswith(name):
+                return city_code
+        return None
+
+    def resolve(self, region: str) -> List[int]:
+        """지역 표기 하나 → location_id 목록 (알 수 없는 지역이면 ValueError)
+
+        '수도권', '서울', '서울 전체', '101000', '서울특별시', '서울 강남구'
+        """
+        parts = region.split()
+        if not parts:
+            raise ValueError("region is empty")
+        name, district = parts[0], ' '.join(parts[1:])
+        if district in _WHOLE_REGION:
+            district = ''
+
+        groups = self._config.get_groups()
+        if name in groups and not district:
+            codes = list(groups[name].values())
+        else:
+            code = self.city_code(name, name)
+            if code is None:
+                raise ValueError(f"Unknown region: {region}")
+            codes = [code]
+
+        self.ensure_loaded()
+        with self._lock:
+            if district:
+                return sorted(self._by_district.get((codes[0], district), ()))
+            return sorted(set().union(*(self._by_code.get(code, ()) for code in codes)))
+
+    def resolve_all(self, regions: Iterable[str]) -> List[int]:
+        """쉼표로 나눈 여러 지역 표기의 합집합"""
+        return sorted(set().union(*(self.resolve(region) for region in regions)))
+
+
+# 싱글톤 인스턴스 생성
+region_index = RegionIndex()
@@ -0,0 +1,308 @@
+import heapq
+import logging
+import math
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import redis
+
+from app.cache.redis_cache import cache
+from app.jobs.read_model import split_ids
+
+
+class RelatedEngine:
+    """관련 채용공고 사전 계산
+
+    기술스택 집합의 IDF 가중 Jaccard 유사도에 같은 회사/같은 카테고리 가산점을 더해
+    공고별 상위 TOP_K개를 related_postings 테이블에 저장한다. 상세 조회는 저장된
+    ID만 읽는다. 공고 변경은 dirty 집합에 쌓였다가 주기 작업이 증분 재계산한다.
+    유사도 계산용 스냅샷은 메모리에 두고 dirty 공고만 다시 읽으며,
+    다른 프로세스가 처리한 변경분은 SEARCH_INDEX_MAX_AGE마다 전체 재적재로 반영한다.
+    전체 재계산: python -m app.jobs.related
+    """
+
+    TOP_K = 10
+    COMPANY_BOOST = 0.3
+    CATEGORY_BOOST = 0.2
+    DIRTY_KEY = 'related:dirty'
+    WRITE_BATCH_SIZE = 500
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local_dirty: Set[int] = set()
+        self._snapshot: Optional['_Snapshot'] = None
+        self._snapshot_at: Optional[float] = None
+        self.refresh_interval = int(os.getenv('RELATED_REFRESH_INTERVAL', 60))
+        self.snapshot_max_age = int(os.getenv('SEARCH_INDEX_MAX_AGE', 600))
+
+    def mark_dirty(self, posting_ids: Iterable[int]):
+        """변경된 공고를 재계산 대기열에 추가 (쓰기 요청에서는 계산하지 않음)"""
+        posting_ids = list(posting_ids)
+        if not posting_ids:
+            return
+        try:
+            cache.redis_client.sadd(self.DIRTY_KEY, *posting_ids)
+            return
+        except redis.RedisError as e:
+            logging.warning(f"Related dirty queue error: {str(e)}")
+        with self._lock:
+            self._local_dirty.update(posting_ids)
+
+    def get_related(self, cursor, posting_id: int, limit: int = 5) -> List[Dict]:
+        """저장된 관련 공고 (활성 공고만, 점수 순)"""
+        cursor.execute("""
+            SELECT s.*
+            FROM related_postings r
+            JOIN job_search s ON r.related_id = s.posting_id
+            WHERE r.posting_id = %s AND s.status = 'active'
+            ORDER BY r.rank_no
+            LIMIT %s
+        """, (posting_id, limit))
+        return cursor.fetchall()
+
+    def rebuild(self, db) -> int:
+        """전체 활성 공고의 관련 공고 재계산"""
+        snapshot = self._load_snapshot(db)
+        self._write(db, {posting_id: snapshot.top_k(posting_id, self)
+                         for posting_id in snapshot.postings}, replace_all=True)
+        return len(snapshot.postings)
+
+    def refresh(self, db) -> int:
+        """dirty 공고와 그 영향을 받는 공고만 재계산"""
+        dirty = self._drain_dirty()
+        if not dirty:
+            return 0
+
+        try:
+            if self._snapshot is None or time.time() - self._snapshot_at > self.snapshot_max_age:
+                snapshot = self._load_snapshot(db)
+            else:
+                snapshot = self._snapshot
+                snapshot.update(db, dirty)
+
+            # 변경된 공고를 목록에 가진 공고 + 변경된 공고의 새 이웃도 순위가 바뀔 수 있음
+            affected = set(dirty)
+            cursor = db.cursor()
+            try:
+                id_list = ','.join(['%s'] * len(dirty))
+                cursor.execute(f"SELECT DISTINCT posting_id FROM related_postings WHERE related_id IN ({id_list})",
+                               list(dirty))
+                affected.update(row[0] for row in cursor.fetchall())
+            finally:
+                cursor.close()
+
+            results = {}
+            for posting_id in dirty:
+                results[posting_id] = snapshot.top_k(posting_id, self) if posting_id in snapshot.postings else []
+                affected.update(related_id for related_id, _ in results[posting_id])
+            for posting_id in affected - set(results):
+                results[posting_id] = snapshot.top_k(posting_id, self) if posting_id in snapshot.postings else []
+
+            self._write(db, results)
+            return len(results)
+
+        except Exception:
+            # 실패한 공고는 다음 실행에서 다시 계산 (스냅샷이 일부만 갱신됐을 수 있어 다시 적재)
+            self._snapshot = None
+            self.mark_dirty(dirty)
+            raise
+
+    def _load_snapshot(self, db) -> '_Snapshot':
+        self._snapshot = _Snapshot.load(db)
+        self._snapshot_at = time.time()
+        return self._snapshot
+
+    def _drain_dirty(self) -> Set[int]:
+        with self._lock:
+            dirty, self._local_dirty = self._local_dirty, set()
+        try:
+            pipe = cache.redis_client.pipeline()
+            pipe.smembers(self.DIRTY_KEY)
+            pipe.delete(self.DIRTY_KEY)
+            members, _ = pipe.execute()
+            dirty.update(int(x) for x in members)
+        except redis.RedisError as e:
+            logging.warning(f"Related dirty queue read error: {str(e)}")
+        return dirty
+
+    def _write(self, db, results: Dict[int, List[Tuple[int, float]]], replace_all: bool = False):
+        """공고별 관련 공고 교체 - 배치마다 해당 공고의 행 삭제와 삽입을 한 트랜잭션으로 커밋
+
+        읽는 쪽은 어떤 시점에도 공고별로 이전 목록이나 새 목록 중 하나를 본다.
+        replace_all이면 마지막에 results에 없는 공고(비활성/삭제)의 행을 지운다.
+        """
+        cursor = db.cursor()
+        try:
+            items = list(results.items())
+            for start in range(0, len(items), self.WRITE_BATCH_SIZE):
+                batch = items[start:start + self.WRITE_BATCH_SIZE]
+                source_ids = [posting_id for posting_id, _ in batch]
+                cursor.execute(
+                    f"DELETE FROM related_postings WHERE posting_id IN ({','.join(['%s'] * len(source_ids))})",
+                    source_ids
+                )
+                rows = [(posting_id, related_id, score, rank_no)
+                        for posting_id, related in batch
+                        for rank_no, (related_id, score) in enumerate(related, 1)]
+                if rows:
+                    cursor.executemany("""
+                        INSERT INTO related_postings (posting_id, related_id, score, rank_no)
+                        VALUES (%s, %s, %s, %s)
+                    """, rows)
+                db.commit()
+
+            if replace_all:
+                cursor.execute("SELECT DISTINCT posting_id FROM related_postings")
+                stale = [row[0] for row in cursor.fetchall() if row[0] not in results]
+                for start in range(0, len(stale), self.WRITE_BATCH_SIZE):
+                    batch = stale[start:start + self.WRITE_BATCH_SIZE]
+                    cursor.execute(
+                        f"DELETE FROM related_postings WHERE posting_id IN ({','.join(['%s'] * len(batch))})",
+                        batch
+                    )
+                    db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+class _Snapshot:
+    """유사도 계산용 활성 공고 스냅샷 (job_search 단일 테이블에서 적재)"""
+
+    FETCH_BATCH_SIZE = 1000
+
+    def __init__(self, postings: Dict[int, Dict]):
+        self.postings: Dict[int, Dict] = {}
+        self.by_stack: Dict[int, Set[int]] = {}
+        self.by_category: Dict[int, Set[int]] = {}
+        self.by_company: Dict[int, Set[int]] = {}
+        self.weights: Dict[int, float] = {}
+
+        for posting_id, posting in postings.items():
+            self._add(posting_id, posting)
+        self._update_weights()
+
+    @classmethod
+    def load(cls, db) -> '_Snapshot':
+        return cls(cls._fetch(db))
+
+    def update(self, db, posting_ids: Iterable[int]):
+        """변경된 공고만 다시 읽어 반영 (비활성/삭제된 공고는 제외)"""
+        posting_ids = list(posting_ids)
+        postings = self._fetch(db, posting_ids)
+        for posting_id in posting_ids:
+            self._remove(posting_id)
+            if posting_id in postings:
+                self._add(posting_id, postings[posting_id])
+        self._update_weights()
+
+    def _groups(self, posting: Dict):
+        yield self.by_stack, posting['stacks']
+        yield self.by_category, posting['categories']
+        yield self.by_company, (posting['company_id'],) if posting['company_id'] else ()
+
+    def _add(self, posting_id: int, posting: Dict):
+        self.postings[posting_id] = posting
+        for index, keys in self._groups(posting):
+            for key in keys:
+                index.setdefault(key, set()).add(posting_id)
+
+    def _remove(self, posting_id: int):
+        posting = self.postings.pop(posting_id, None)
+        if posting is None:
+            return
+        for index, keys in self._groups(posting):
+            for key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(posting_id)
+                    if not ids:
+                        del index[key]
+
+    def _update_weights(self):
+        # 흔한 기술스택일수록 낮은 가중치 (IDF)
+        total = max(len(self.postings), 1)
+        self.weights = {stack_id: math.log(1 + total / len(ids)) for stack_id, ids in self.by_stack.items()}
+
+    @classmethod
+    def _fetch(cls, db, posting_ids: Optional[List[int]] = None) -> Dict[int, Dict]:
+        """활성 공고 행 조회 (posting_ids가 없으면 전체)"""
+        if posting_ids is not None and not posting_ids:
+            return {}
+
+        cursor = db.cursor(dictionary=True)
+        try:
+            query = """
+                SELECT posting_id, company_id, tech_stack_ids, category_ids
+                FROM job_search
+                WHERE status = 'active'
+            """
+            batches = ([posting_ids[i:i + cls.FETCH_BATCH_SIZE]
+                        for i in range(0, len(posting_ids), cls.FETCH_BATCH_SIZE)]
+                       if posting_ids is not None else [None])
+            postings = {}
+            for batch in batches:
+                if batch is None:
+                    cursor.execute(query)
+                else:
+                    cursor.execute(query + f" AND posting_id IN ({','.join(['%s'] * len(batch))})", batch)
+                for row in cursor.fetchall():
+                    postings[row['posting_id']] = {
+                        'company_id': row['company_id'],
+                        'stacks': frozenset(split_ids(row['tech_stack_ids'])),
+                        'categories': frozenset(split_ids(row['category_ids']))
+                    }
+            return postings
+        finally:
+            cursor.close()
+
+    def score(self, a: Dict, b: Dict, engine: RelatedEngine) -> float:
+        union = a['stacks'] | b['stacks']
+        score = 0.0
+        if union:
+            intersection = a['stacks'] & b['stacks']
+            score = (sum(self.weights.get(s, 0) for s in intersection) /
+                     sum(self.weights.get(s, 0) for s in union))
+        if a['company_id'] and a['company_id'] == b['company_id']:
+            score += engine.COMPANY_BOOST
+        if a['categories'] & b['categories']:
+            score += engine.CATEGORY_BOOST
+        return score
+
+    def top_k(self, posting_id: int, engine: RelatedEngine) -> List[Tuple[int, float]]:
+        posting = self.postings[posting_id]
+
+        # 기술스택/카테고리/회사 중 하나라도 겹치는 공고만 후보
+        candidates: Set[int] = set()
+        for stack_id in posting['stacks']:
+            candidates.update(self.by_stack.get(stack_id, ()))
+        for category_id in posting['categories']:
+            candidates.update(self.by_category.get(category_id, ()))
+        if posting['company_id']:
+            candidates.update(self.by_company.get(posting['company_id'], ()))
+        candidates.discard(posting_id)
+
+        scored = ((candidate, self.score(posting, self.postings[candidate], engine)) for candidate in candidates)
+        # 동점이면 최신(큰 ID) 공고 우선
+        return [(candidate, round(score, 4))
+                for candidate, score in heapq.nlargest(engine.TOP_K, scored, key=lambda item: (item[1], item[0]))
+                if score > 0]
+
+
+# 싱글톤 인스턴스 생성
+related_engine = RelatedEngine()
+
+
+# CLI 실행을 위한 코드
+if __name__ == '__main__':
+    from app import create_app
+    from app.database import get_db
+
+    app = create_app()
+    with app.app_context():
+        count = related_engine.rebuild(get_db())
+        print(f"Related postings rebuilt: {count} postings")
@@ -1,48 +1,306 @@
-from flask import Blueprint, request, jsonify, make_response, g
+from flask import Blueprint, request, jsonify, make_response, g, Response, stream_with_context
 from app.jobs.models import JobPosting
+from app.jobs.counting import parse_count_mode
+from app.jobs.fields import parse_fields, LISTING_FIELDS, DETAIL_FIELDS, DEFAULT_LISTING_FIELDS
+from app.jobs.bulk import MAX_BULK_SIZE
+from app.jobs.export import (EXPORT_FORMATS, DEFAULT_EXPORT_FIELDS, parse_since, parse_after_id, iter_postings,
+                             stream_csv, stream_ndjson, export_slots)
+from app.jobs.unique_views import visitor_key
+from app.jobs.regions import region_index
+from app.auth.utils import verify_token
 from app.middleware.auth import login_required, company_required
 import logging
-from app.database import get_db
+from app.database import get_db, db_pool
+from app.jobs.events import notify_postings_changed, notify_postings_created
+from app.jobs.read_model import sync_job_search
+from app.jobs.tags import sync_tags
+from app.jobs.utils import changed_values
+from app.cache.posting_versions import posting_versions
+from app.common.http_cache import make_etag, is_not_modified, cache_headers, not_modified
 from app.config.location_config import LocationConfig
 from app.config.job_config import JobConfig
 
 jobs_bp = Blueprint('jobs', __name__, url_prefix='/jobs')
 
+# GET /jobs/batch 한 번에 조회할 수 있는 최대 공고 수
+MAX_BATCH_IDS = 100
+
+def parse_listing_filters(args):
+    """채용공고 목록/패싯 공통 검색 및 필터링 파라미터"""
+    filters = {}
+    if args.get('search'):
+        filters['search'] = args.get('search')
+    if args.get('location_id'):
+        filters['location_id'] = int(args.get('location_id'))
+    # 지역 그룹/시·도/사람인 코드 (쉼표로 여러 개) → location_id 목록, 알 수 없는 지역이면 ValueError
+    if args.get('region'):
+        filters['location_ids'] = region_index.resolve_all(
+            region for region in args.get('region').split(',') if region.strip())
+    if args.get('categories'):
+        filters['categories'] = [int(x) for x in args.get('categories').split(',')]
+    if args.get('tech_stacks'):
+        filters['tech_stacks'] = [int(x) for x in args.get('tech_stacks').split(',')]
+    # any: 하나라도 포함 (기본) / all: 모두 포함
+    if args.get('tech_stacks_mode') == 'all':
+        filters['tech_stacks_mode'] = 'all'
+    if args.get('exclude_tech_stacks'):
+        filters['exclude_tech_stacks'] = [int(x) for x in args.get('exclude_tech_stacks').split(',')]
+    if args.get('exclude_categories'):
+        filters['exclude_categories'] = [int(x) for x in args.get('exclude_categories').split(',')]
+    if args.get('experience_level'):
+        filters['experience_level'] = args.get('experience_level')
+    if args.get('employment_type'):
+        filters['employment_type'] = args.get('employment_type')
+    # 연봉 범위 (원/년)
+    for field in ('salary_min', 'salary_max'):
+        if args.get(field):
+            filters[field] = int(args.get(field))
+    return filters
+
+def current_visitor():
+    """상세 조회 방문자 키 - 유효한 토큰이 있으면 user_id, 없으면 IP + User-Agent"""
+    user_id = None
+    auth_header = request.headers.get('Authorization', '')
+    if auth_header.startswith('Bearer '):
+        try:
+            user_id = verify_token(auth_header.split(" ")[1]).get('user_id')
+        except Exception:
+            user_id = None
+    return visitor_key(user_id, request.remote_addr, request.headers.get('User-Agent'))
+
 @jobs_bp.route('', methods=['GET'])
 def get_job_postings():
     try:
         # 검색 및 필터링 파라미터
-        filters = {}
-        if request.args.get('search'):
-            filters['search'] = request.args.get('search')
-        if request.args.get('location_id'):
-            filters['location_id'] = int(request.args.get('location_id'))
-        if request.args.get('categories'):
-            filters['categories'] = [int(x) for x in request.args.get('categories').split(',')]
-        if request.args.get('tech_stacks'):
-            filters['tech_stacks'] = [int(x) for x in request.args.get('tech_stacks').split(',')]
-
-        # 페이지네이션
+        try:
+            filters = parse_listing_filters(request.args)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        # 페이지네이션 (cursor가 있으면 page 대신 키셋 페이지네이션)
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 10))
+        page_cursor = request.args.get('cursor')
 
         # 정렬
         sort_by = request.args.get('sort_by', 'latest')
 
-        result, error = JobPosting.search_postings(filters, sort_by, page, per_page)
+        # 전체 건수 집계 방식 (true/false/estimate)
+        try:
+            count_mode = parse_count_mode(request.args.get('count'))
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        # 응답 필드 (기본값은 본문을 제외한 목록 카드용 필드)
+        try:
+            fields = parse_fields(request.args.get('fields'), LISTING_FIELDS, DEFAULT_LISTING_FIELDS)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        # 조건부 요청 - 전체 공고 버전이 같으면 조회 없이 304
+        etag = make_etag(posting_versions.current())
+        if is_not_modified(etag):
+            return not_modified(etag)
+
+        result, error = JobPosting.search_postings(filters, sort_by, page, per_page, page_cursor,
+                                                   count_mode, fields)
         if error:
             return make_response(jsonify({
                 "status": "error",
                 "message": error
             }), 400)
 
+        return cache_headers(make_response(jsonify({
+            "status": "success",
+            "data": result
+        }), 200), etag)
+
+    except Exception as e:
+        logging.error(f"Job postings fetch error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@jobs_bp.route('/facets', methods=['GET'])
+def get_job_facets():
+    try:
+        try:
+            filters = parse_listing_filters(request.args)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+        limit = int(request.args.get('limit', 20))
+
+        result, error = JobPosting.get_facets(filters, limit)
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 500)
+
         return make_response(jsonify({
             "status": "success",
             "data": result
         }), 200)
 
     except Exception as e:
-        logging.error(f"Job postings fetch error: {str(e)}")
+        logging.error(f"Job facets fetch error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@jobs_bp.route('/suggest', methods=['GET'])
+def suggest_jobs():
+    """검색창 자동완성 (키 입력마다 호출 - MySQL 조회 없음)"""
+    try:
+        query = request.args.get('q', '').strip()
+        limit = int(request.args.get('limit', 5))
+
+        result, error = JobPosting.get_suggestions(query, limit)
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 500)
+
+        return make_response(jsonify({
+            "status": "success",
+            "data": result
+        }), 200)
+
+    except Exception as e:
+        logging.error(f"Job suggestion error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@jobs_bp.route('/export', methods=['GET'])
+def export_job_postings():
+    """활성 채용공고 전체를 NDJSON/CSV로 스트리밍 (since/after_id 이후 등록분만 증분 조회 가능)"""
+    try:
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in EXPORT_FORMATS:
+            return make_response(jsonify({
+                "status": "error",
+                "message": "format must be one of ndjson, csv"
+            }), 400)
+
+        try:
+            since = parse_since(request.args.get('since'))
+            after_id = parse_after_id(request.args.get('after_id'), since)
+            fields = parse_fields(request.args.get('fields'), LISTING_FIELDS, DEFAULT_EXPORT_FIELDS)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        # 진행 중인 내보내기가 많으면 커넥션을 잡기 전에 거절 (슬롯은 응답이 닫힐 때 반환)
+        if not export_slots.acquire(blocking=False):
+            return make_response(jsonify({
+                "status": "error",
+                "message": "Too many exports in progress, retry later"
+            }), 429)
+
+        def generate():
+            # 스트리밍 동안 다른 요청과 섞이지 않도록 전용 커넥션 사용
+            conn = db_pool.get_connection()
+            try:
+                rows = iter_postings(conn, fields, since, after_id)
+                if export_format == 'csv':
+                    yield from stream_csv(rows, fields)
+                else:
+                    yield from stream_ndjson(rows)
+            except Exception as e:
+                logging.error(f"Job postings export error: {str(e)}")
+                raise
+            finally:
+                conn.close()
+
+        try:
+            response = Response(
+                stream_with_context(generate()),
+                mimetype=EXPORT_FORMATS[export_format],
+                headers={"Content-Disposition": f"attachment; filename=jobs.{export_format}"}
+            )
+        except Exception:
+            export_slots.release()
+            raise
+        # 스트림을 끝까지 읽지 않고 연결이 끊겨도 WSGI 서버가 응답을 닫을 때 반환된다
+        response.call_on_close(export_slots.release)
+        return response
+
+    except Exception as e:
+        logging.error(f"Job postings export error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@jobs_bp.route('/batch', methods=['GET'])
+def get_job_postings_batch():
+    try:
+        try:
+            posting_ids = [int(x) for x in request.args.get('ids', '').split(',') if x.strip()]
+        except ValueError:
+            return make_response(jsonify({
+                "status": "error",
+                "message": "ids must be comma-separated integers"
+            }), 400)
+
+        # 중복 제거 (요청 순서 유지)
+        posting_ids = list(dict.fromkeys(posting_ids))
+        if not posting_ids:
+            return make_response(jsonify({
+                "status": "error",
+                "message": "ids is required"
+            }), 400)
+        if len(posting_ids) > MAX_BATCH_IDS:
+            return make_response(jsonify({
+                "status": "error",
+                "message": f"Up to {MAX_BATCH_IDS} ids are allowed"
+            }), 400)
+
+        try:
+            fields = parse_fields(request.args.get('fields'), LISTING_FIELDS, DEFAULT_LISTING_FIELDS)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        postings, error = JobPosting.get_postings_batch(posting_ids, fields)
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 500)
+
+        found = {posting['posting_id'] for posting in postings}
+        return make_response(jsonify({
+            "status": "success",
+            "data": {
+                "postings": postings,
+                "missing": [posting_id for posting_id in posting_ids if posting_id not in found]
+            }
+        }), 200)
+
+    except Exception as e:
+        logging.error(f"Job postings batch fetch error: {str(e)}")
         return make_response(jsonify({
             "status": "error",
             "message": str(e)
@@ -51,8 +309,21 @@ def get_job_postings():
 @jobs_bp.route('/<int:posting_id>', methods=['GET'])
 def get_job_posting(posting_id):
     try:
-        # 기존 상세 정보 조회
-        posting, error = JobPosting.get_posting(posting_id)
+        try:
+            fields = parse_fields(request.args.get('fields'), DETAIL_FIELDS)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        # 조건부 요청 - 공고 버전이 같으면 304 (재검증은 조회로 세지 않는다)
+        etag = make_etag(posting_versions.of(posting_id))
+        if is_not_modified(etag):
+            return not_modified(etag)
+
+        # 기존 상세 정보 조회 (고유 방문자 기록)
+        posting, error = JobPosting.get_posting(posting_id, visitor=current_visitor(), fields=fields)
         if error:
             return make_response(jsonify({
                 "status": "error",
@@ -62,13 +333,13 @@ def get_job_posting(posting_id):
         # 관련 공고 추천 추가
         related_jobs, _ = JobPosting.get_related_jobs(posting_id, limit=5)
 
-        return make_response(jsonify({
+        return cache_headers(make_response(jsonify({
             "status": "success",
             "data": {
                 "posting": posting,
                 "related_jobs": related_jobs
             }
-        }), 200)
+        }), 200), etag)
 
     except Exception as e:
         logging.error(f"Job posting fetch error: {str(e)}")
@@ -142,7 +413,9 @@ def create_job_posting():
                         VALUES (%s, %s)
                     """, (posting_id, tech_stack_id))
             
+            sync_job_search(cursor, [posting_id])
             db.commit()
+            notify_postings_created([posting_id])
             
             return make_response(jsonify({
                 "status": "success",
@@ -166,84 +439,99 @@ def create_job_posting():
             "message": str(e)
         }), 500)
 
+@jobs_bp.route('/bulk', methods=['POST'])
+@login_required
+def create_job_postings_bulk():
+    try:
+        data = request.get_json(silent=True) or {}
+        postings = data.get('postings')
+
+        if not isinstance(postings, list) or not postings:
+            return make_response(jsonify({
+                "status": "error",
+                "message": "postings must be a non-empty list"
+            }), 400)
+
+        if len(postings) > MAX_BULK_SIZE:
+            return make_response(jsonify({
+                "status": "error",
+                "message": f"Too many postings (max {MAX_BULK_SIZE})"
+            }), 400)
+
+        result, error = JobPosting.create_postings_bulk(g.user_id, postings)
+
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 500)
+
+        # 한 건도 저장하지 못했으면 400 (항목별 에러는 results에 포함)
+        return make_response(jsonify({
+            "status": "success" if result['created'] else "error",
+            "data": result
+        }), 201 if result['created'] else 400)
+
+    except Exception as e:
+        logging.error(f"Bulk job posting creation error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
 @jobs_bp.route('/<int:posting_id>', methods=['PUT'])
 @login_required
 def update_job_posting(posting_id):
     try:
         data = request.get_json()
         db = get_db()
-        cursor = db.cursor()
+        cursor = db.cursor(dictionary=True)
         
         try:
             # 해당 채용공고의 작성자 확인
             cursor.execute("""
-                SELECT jp.company_id 
+                SELECT jp.*
                 FROM job_postings jp
                 JOIN companies c ON jp.company_id = c.company_id
                 WHERE jp.posting_id = %s 
                 AND c.name = CONCAT('Company_', %s)
             """, (posting_id, g.user_id))
             
-            result = cursor.fetchone()
-            if not result:
+            current = cursor.fetchone()
+            if not current:
                 return make_response(jsonify({
                     "status": "error",
                     "message": "Permission denied or posting not found"
                 }), 403)
                 
-            # 채용공고 업데이트
-            cursor.execute("""
-                UPDATE job_postings SET
-                    title = %s,
-                    job_description = %s,
-                    experience_level = %s,
-                    education_level = %s,
-                    employment_type = %s,
-                    salary_info = %s,
-                    location_id = %s,
-                    deadline_date = %s
-                WHERE posting_id = %s
-            """, (
-                data['title'],
-                data['job_description'],
-                data.get('experience_level'),
-                data.get('education_level'),
-                data.get('employment_type'),
-                data.get('salary_info'),
-                data.get('location_id'),
-                data.get('deadline_date'),
-                posting_id
-            ))
-            
-            # 기존 카테고리 삭제
-            cursor.execute("""
-                DELETE FROM posting_categories 
-                WHERE posting_id = %s
-            """, (posting_id,))
-            
-            # 새 카테고리 연결
-            if 'categories' in data:
-                for category_id in data['categories']:
-                    cursor.execute("""
-                        INSERT INTO posting_categories (posting_id, category_id)
-                        VALUES (%s, %s)
-                    """, (posting_id, category_id))
-            
-            # 기존 기술 스택 삭제
-            cursor.execute("""
-                DELETE FROM job_tech_stacks 
-                WHERE posting_id = %s
-            """, (posting_id,))
+            # 채용공고 업데이트 (전체 교체 - 값이 바뀐 컬럼만 UPDATE)
+            updates = changed_values(current, {
+                'title': data['title'],
+                'job_description': data['job_description'],
+                'experience_level': data.get('experience_level'),
+                'education_level': data.get('education_level'),
+                'employment_type': data.get('employment_type'),
+                'salary_info': data.get('salary_info'),
+                'location_id': data.get('location_id'),
+                'deadline_date': data.get('deadline_date')
+            })
+            if updates:
+                cursor.execute(f"""
+                    UPDATE job_postings SET {', '.join(f"{field} = %s" for field in updates)}
+                    WHERE posting_id = %s
+                """, list(updates.values()) + [posting_id])
             
-            # 새 기술 스택 연결
-            if 'tech_stacks' in data:
-                for stack_id in data['tech_stacks']:
-                    cursor.execute("""
-                        INSERT INTO job_tech_stacks (posting_id, stack_id)
-                        VALUES (%s, %s)
-                    """, (posting_id, stack_id))
+            # 카테고리 / 기술 스택 연결 (요청에 없으면 모두 해제, 현재 연결과의 차이만 반영)
+            changed = bool(updates)
+            changed = sync_tags(cursor, posting_id, 'categories', data.get('categories') or []) or changed
+            changed = sync_tags(cursor, posting_id, 'tech_stacks', data.get('tech_stacks') or []) or changed
             
+            # 바뀐 것이 없으면 읽기 모델/색인/캐시를 건드리지 않는다
+            if changed:
+                sync_job_search(cursor, [posting_id])
             db.commit()
+            if changed:
+                notify_postings_changed([posting_id])
             
             return make_response(jsonify({
                 "status": "success",
@@ -298,7 +586,9 @@ def delete_job_posting(posting_id):
                 WHERE posting_id = %s
             """, (posting_id,))
             
+            sync_job_search(cursor, [posting_id])
             db.commit()
+            notify_postings_changed([posting_id])
             
             return make_response(jsonify({
                 "status": "success",
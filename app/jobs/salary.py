@@ -0,0 +1,215 @@
+"""급여 문자열(salary_info) → 연봉 범위(salary_min, salary_max, 원/년) 정규화
+
+쓰기 경로는 read_model.sync_job_search()에서 sync_salary_ranges()가 함께 호출된다.
+기존 공고 일괄 변환: python -m app.jobs.salary
+"""
+import logging
+import re
+from typing import Iterable, Optional, Tuple
+
+BACKFILL_BATCH_SIZE = 1000
+
+# 월 소정근로시간 (주 40시간 + 주휴)
+MONTHLY_WORK_HOURS = 209
+
+# 급여 기준별 연 환산 배수 (기준 표기가 없으면 연봉, 금액에 가장 가까운 표기를 쓰고 거리가 같으면 앞쪽 우선)
+_PERIOD_MULTIPLIERS = (
+    ('연봉', 1),
+    ('년', 1),
+    ('시급', MONTHLY_WORK_HOURS * 12),
+    ('일급', 22 * 12),
+    ('주급', 52),
+    ('월급', 12),
+    ('월', 12)
+)
+
+_UNITS = {'억': 100_000_000, '천만': 10_000_000, '백만': 1_000_000, '만': 10_000, '천': 1_000, '원': 1}
+
+_AMOUNT_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(억|천만|백만|만|천|원)?')
+# 금액 옆의 범위 기호만 범위로 본다 ('월~금 근무'는 범위가 아님)
+_RANGE_PATTERN = re.compile(r'(?<=[\d억만천원])\s*([~〜∼-])\s*|\s*([~〜∼-])\s*(?=\d)')
+_OPEN_RANGE_MARKS = '~〜∼'
+
+# 연봉 환산 결과가 이 범위를 벗어나면 잘못 파싱한 것으로 보고 버린다
+_MIN_ANNUAL = 1_000_000
+_MAX_ANNUAL = 2_000_000_000
+
+
+def _parse_amount(text: str, last: bool = False) -> Tuple[Optional[float], Optional[int]]:
+    """금액 표기 하나 → (금액, 마지막 단위) - '1억 2천만원', '3,000만원', '3000' 등
+
+    단위가 붙은 첫 숫자부터 읽고 ('주5일, 월 250만원'), 단위가 전혀 없으면 첫 숫자(last면 마지막 숫자)를 쓴다.
+    단위가 작아지는 동안만 이어 붙이고 ('1억 2천만'), 그 뒤의 숫자('주5일' 등)는 무시한다.
+    """
+    matches = _AMOUNT_PATTERN.findall(text)
+    if not matches:
+        return None, None
+    start = next((index for index, (_, number_unit) in enumerate(matches) if number_unit),
+                 len(matches) - 1 if last else 0)
+
+    total, unit = None, None
+    for number, number_unit in matches[start:]:
+        scale = _UNITS.get(number_unit)
+        if total is not None and (unit is None or scale is None or scale >= unit):
+            break
+        total = (total or 0) + float(number.replace(',', '')) * (scale or 1)
+        unit = scale
+    return total, unit
+
+
+def _period_multiplier(text: str) -> int:
+    """금액(단위가 붙은 첫 금액)에 가장 가까운 급여 기준 표기의 연 환산 배수
+
+    '월~금 근무, 연봉 3000만원', '연봉 4000만원 (월 330만원)'은 모두 연봉으로 본다.
+    """
+    amounts = list(_AMOUNT_PATTERN.finditer(text))
+    if not amounts:
+        return 1
+    anchor = next((match for match in amounts if match.group(2)), amounts[0])
+
+    best = None
+    for keyword, value in _PERIOD_MULTIPLIERS:
+        for found in re.finditer(keyword, text):
+            if found.end() <= anchor.start():
+                distance = anchor.start() - found.end()
+            else:
+                distance = max(found.start() - anchor.end(), 0)
+            if best is None or distance < best[0]:
+                best = (distance, value)
+    return best[1] if best else 1
+
+
+def _carry_unit(value: float, unit: Optional[int], other: float, other_unit: Optional[int]) -> float:
+    """범위 한쪽에 생략된 만 단위를 다른 쪽에서 가져온다 - '3천~4천만원'의 3천은 3천만"""
+    if unit is None:
+        # 단위가 아예 없으면 다른 쪽 단위를 따르고 ('3,000~4,000만원'), 둘 다 없으면 만원으로 본다
+        return value * (other_unit or (_UNITS['만'] if value < 100_000 else 1))
+    # 천 단위 그대로면 다른 쪽과 천 배 넘게 차이 나는 경우만 ('9천원~1만원'은 그대로)
+    if unit < _UNITS['만'] and other_unit and other_unit >= _UNITS['만'] and value * 1000 < other:
+        return value * _UNITS['만']
+    return value
+
+
+def parse_salary(text: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """급여 문자열 → (최소 연봉, 최대 연봉) 원 단위
+
+    - '3,000~4,000만원', '3천~4천만원' → (30000000, 40000000)
+    - '월 250만원' → (30000000, 30000000)
+    - '4000만원 이상', '4000만원~' → (40000000, None) / '3000만원 이하', '~3000만원' → (None, 30000000)
+    - '면접 후 결정', '회사내규에 따름' 등 금액이 없으면 (None, None)
+    """
+    if not text:
+        return None, None
+    text = text.strip()
+    multiplier = _period_multiplier(text)
+
+    separator = _RANGE_PATTERN.search(text)
+    if separator:
+        low, high = _parse_amount(text[:separator.start()], last=True), _parse_amount(text[separator.end():])
+    else:
+        low, high = _parse_amount(text), (None, None)
+    if low[0] is None and high[0] is None:
+        return None, None
+
+    if low[0] is not None and high[0] is not None:
+        values = [_carry_unit(*low, *high), _carry_unit(*high, *low)]
+    else:
+        value, unit = low if low[0] is not None else high
+        values = [_carry_unit(value, unit, value, None)]
+    values = [int(round(value * multiplier)) for value in values]
+
+    if any(not _MIN_ANNUAL <= value <= _MAX_ANNUAL for value in values):
+        return None, None
+
+    if len(values) == 2:
+        return min(values), max(values)
+    # 한쪽이 빈 '~' 범위는 열린 범위 ('4000만원~'은 이상, '~3000만원'은 이하)
+    if separator and (separator.group(1) or separator.group(2)) in _OPEN_RANGE_MARKS:
+        return (values[0], None) if low[0] is not None else (None, values[0])
+    if '이상' in text or '부터' in text:
+        return values[0], None
+    if '이하' in text or '까지' in text or '미만' in text:
+        return None, values[0]
+    return values[0], values[0]
+
+
+def _apply(cursor, ranges):
+    """(posting_id, salary_min, salary_max) 목록을 UPDATE ... CASE로 반영"""
+    if not ranges:
+        return
+    cases = ' '.join(['WHEN %s THEN %s'] * len(ranges))
+    id_list = ','.join(['%s'] * len(ranges))
+    params = [value for posting_id, salary_min, _ in ranges for value in (posting_id, salary_min)]
+    params.extend(value for posting_id, _, salary_max in ranges for value in (posting_id, salary_max))
+    params.extend(posting_id for posting_id, _, _ in ranges)
+    cursor.execute(f"""
+        UPDATE job_postings
+        SET salary_min = CASE posting_id {cases} END,
+            salary_max = CASE posting_id {cases} END
+        WHERE posting_id IN ({id_list})
+    """, params)
+
+
+def sync_salary_ranges(cursor, posting_ids: Iterable[int]):
+    """공고의 salary_info를 다시 파싱해 salary_min/salary_max 갱신 (호출한 쪽 트랜잭션, 커밋하지 않음)"""
+    posting_ids = list(posting_ids)
+    if not posting_ids:
+        return
+
+    cursor.execute(f"""
+        SELECT posting_id, salary_info FROM job_postings
+        WHERE posting_id IN ({','.join(['%s'] * len(posting_ids))})
+    """, posting_ids)
+    rows = [(row['posting_id'], row['salary_info']) if isinstance(row, dict) else tuple(row)
+            for row in cursor.fetchall()]
+    _apply(cursor, [(posting_id,) + parse_salary(salary_info) for posting_id, salary_info in rows])
+
+
+def backfill_salary_ranges(db) -> int:
+    """기존 공고 전체의 연봉 범위를 posting_id 순으로 배치 변환 (배치마다 커밋)
+
+    job_search의 같은 컬럼도 함께 갱신한다. 변환한 공고 수 반환.
+    """
+    cursor = db.cursor()
+    last_id, total = 0, 0
+    try:
+        while True:
+            cursor.execute("""
+                SELECT posting_id, salary_info FROM job_postings
+                WHERE posting_id > %s
+                ORDER BY posting_id
+                LIMIT %s
+            """, (last_id, BACKFILL_BATCH_SIZE))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            ids = [posting_id for posting_id, _ in rows]
+            _apply(cursor, [(posting_id,) + parse_salary(salary_info) for posting_id, salary_info in rows])
+            cursor.execute(f"""
+                UPDATE job_search s
+                JOIN job_postings p ON s.posting_id = p.posting_id
+                SET s.salary_min = p.salary_min, s.salary_max = p.salary_max
+                WHERE p.posting_id IN ({','.join(['%s'] * len(ids))})
+            """, ids)
+            db.commit()
+
+            last_id, total = ids[-1], total + len(rows)
+            logging.info(f"Salary backfill: {total} postings")
+        return total
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+# CLI 실행을 위한 코드
+if __name__ == '__main__':
+    from app import create_app
+    from app.database import get_db
+
+    app = create_app()
+    with app.app_context():
+        count = backfill_salary_ranges(get_db())
+        print(f"Salary ranges backfilled: {count} postings")
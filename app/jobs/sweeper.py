@@ -0,0 +1,158 @@
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+from app.jobs.events import notify_postings_changed
+from app.jobs.read_model import sync_job_search
+
+# job_postings → job_postings_archive 로 옮기는 컬럼
+ARCHIVE_COLUMNS = (
+    'posting_id', 'company_id', 'title', 'job_description',
+    'experience_level', 'education_level', 'employment_type',
+    'salary_info', 'salary_min', 'salary_max', 'location_id', 'deadline_date',
+    'view_count', 'unique_view_count', 'status', 'created_at', 'deleted_at'
+)
+
+# 보관 시 함께 지우는 공고 종속 테이블 (지원/북마크는 이력이므로 해당 공고는 옮기지 않음)
+DEPENDENT_TABLES = ('posting_tech_stacks', 'posting_categories', 'job_tech_stacks', 'job_search',
+                    'saved_search_matches')
+
+
+class PostingSweeper:
+    """마감 공고 정리 작업
+
+    1. 마감일이 지난 활성 공고를 'expired'로 변경 (BATCH_SIZE씩 나눠 커밋)
+    2. 삭제된 공고와 마감/비활성 후 ARCHIVE_AFTER_DAYS가 지난 공고를 job_postings_archive로 이동
+    변경분은 job_search와 인메모리 색인/캐시에 같은 경로(notify_postings_changed)로 반영된다.
+    수동 실행: python -m app.jobs.sweeper
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self):
+        self.interval = int(os.getenv('POSTING_SWEEP_INTERVAL', 3600))
+        self.archive_after_days = int(os.getenv('POSTING_ARCHIVE_AFTER_DAYS', 90))
+
+    def sweep(self, db) -> Tuple[int, int]:
+        """(만료 처리한 공고 수, 보관한 공고 수) 반환"""
+        return self.expire(db), self.archive(db)
+
+    def expire(self, db) -> int:
+        """마감일(deadline_date)이 지난 활성 공고를 'expired'로 변경"""
+        expired = 0
+        cursor = db.cursor()
+        try:
+            while True:
+                # (status, deadline_date, posting_id) 인덱스 범위 조회
+                cursor.execute("""
+                    SELECT posting_id FROM job_postings
+                    WHERE status = 'active' AND deadline_date < %s
+                    ORDER BY deadline_date, posting_id
+                    LIMIT %s
+                """, (date.today(), self.BATCH_SIZE))
+                posting_ids = [row[0] for row in cursor.fetchall()]
+                if not posting_ids:
+                    break
+
+                cursor.execute(f"""
+                    UPDATE job_postings SET status = 'expired'
+                    WHERE posting_id IN ({','.join(['%s'] * len(posting_ids))}) AND status = 'active'
+                """, posting_ids)
+                sync_job_search(cursor, posting_ids)
+                db.commit()
+                notify_postings_changed(posting_ids)
+
+                expired += len(posting_ids)
+                if len(posting_ids) < self.BATCH_SIZE:
+                    break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        if expired:
+            logging.info(f"Postings expired: {expired}")
+        return expired
+
+    def archive(self, db) -> int:
+        """삭제 공고와 오래된 마감/비활성 공고를 보관 테이블로 이동"""
+        cutoff = datetime.now() - timedelta(days=self.archive_after_days)
+        archived = 0
+        cursor = db.cursor()
+        try:
+            for condition, params in (("p.status = 'deleted'", []),
+                                      ("p.status = 'expired' AND p.deadline_date < %s", [cutoff.date()]),
+                                      ("p.status = 'inactive' AND p.deleted_at < %s", [cutoff])):
+                last_id = 0
+                while True:
+                    posting_ids = self._archive_candidates(cursor, condition, params, last_id)
+                    if not posting_ids:
+                        break
+                    self._move(cursor, posting_ids)
+                    db.commit()
+                    notify_postings_changed(posting_ids)
+
+                    archived += len(posting_ids)
+                    last_id = posting_ids[-1]
+                    if len(posting_ids) < self.BATCH_SIZE:
+                        break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        if archived:
+            logging.info(f"Postings archived: {archived}")
+        return archived
+
+    def _archive_candidates(self, cursor, condition: str, params: List, last_id: int) -> List[int]:
+        cursor.execute(f"""
+            SELECT p.posting_id FROM job_postings p
+            WHERE {condition} AND p.posting_id > %s
+            AND NOT EXISTS (SELECT 1 FROM applications a WHERE a.posting_id = p.posting_id)
+            AND NOT EXISTS (SELECT 1 FROM bookmarks b WHERE b.posting_id = p.posting_id)
+            ORDER BY p.posting_id
+            LIMIT %s
+        """, params + [last_id, self.BATCH_SIZE])
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _move(cursor, posting_ids: List[int]):
+        """공고 행을 보관 테이블로 복사한 뒤 원본과 종속 행 삭제 (호출한 쪽에서 커밋)"""
+        id_list = ','.join(['%s'] * len(posting_ids))
+        columns = ', '.join(ARCHIVE_COLUMNS)
+
+        cursor.execute(f"""
+            REPLACE INTO job_postings_archive ({columns}, tech_stack_ids, category_ids)
+            SELECT {', '.join(f'p.{column}' for column in ARCHIVE_COLUMNS)},
+                   s.tech_stack_ids, s.category_ids
+            FROM job_postings p
+            LEFT JOIN job_search s ON p.posting_id = s.posting_id
+            WHERE p.posting_id IN ({id_list})
+        """, posting_ids)
+
+        cursor.execute(f"""
+            DELETE FROM related_postings
+            WHERE posting_id IN ({id_list}) OR related_id IN ({id_list})
+        """, posting_ids + posting_ids)
+        for table in DEPENDENT_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE posting_id IN ({id_list})", posting_ids)
+        cursor.execute(f"DELETE FROM job_postings WHERE posting_id IN ({id_list})", posting_ids)
+
+
+# 싱글톤 인스턴스 생성
+posting_sweeper = PostingSweeper()
+
+
+# CLI 실행을 위한 코드
+if __name__ == '__main__':
+    from app import create_app
+    from app.database import get_db
+
+    app = create_app()
+    with app.app_context():
+        expired, archived = posting_sweeper.sweep(get_db())
+        print(f"Posting sweep completed: {expired} expired, {archived} archived")
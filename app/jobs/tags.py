@@ -0,0 +1,44 @@
+"""공고 ↔ 기술스택/카테고리 연결 행 갱신
+
+전체 삭제 후 재삽입 대신 현재 연결과의 차집합만 반영한다.
+(추가분은 다중 행 INSERT 한 번, 제거분은 DELETE ... IN 한 번)
+"""
+from typing import Iterable, List, Tuple
+
+# 종류 → (연결 테이블, ID 컬럼)
+TAG_TABLES = {
+    'tech_stacks': ('posting_tech_stacks', 'stack_id'),
+    'categories': ('posting_categories', 'category_id')
+}
+
+
+def diff_tags(current: Iterable[int], desired: Iterable[int]) -> Tuple[List[int], List[int]]:
+    """(추가할 ID, 제거할 ID) - 추가분은 요청 순서 유지"""
+    current = set(current)
+    desired = list(dict.fromkeys(desired))
+    added = [tag_id for tag_id in desired if tag_id not in current]
+    removed = sorted(current - set(desired))
+    return added, removed
+
+
+def sync_tags(cursor, posting_id: int, kind: str, tag_ids: Iterable[int]) -> bool:
+    """공고의 연결을 tag_ids와 같게 맞춤 (호출한 쪽 트랜잭션, 커밋하지 않음) - 바뀐 것이 있으면 True"""
+    table, column = TAG_TABLES[kind]
+
+    cursor.execute(f"SELECT {column} FROM {table} WHERE posting_id = %s", (posting_id,))
+    current = [row[column] if isinstance(row, dict) else row[0] for row in cursor.fetchall()]
+    added, removed = diff_tags(current, tag_ids)
+
+    if removed:
+        cursor.execute(f"""
+            DELETE FROM {table}
+            WHERE posting_id = %s AND {column} IN ({','.join(['%s'] * len(removed))})
+        """, [posting_id] + removed)
+
+    if added:
+        cursor.execute(f"""
+            INSERT INTO {table} (posting_id, {column})
+            VALUES {', '.join(['(%s, %s)'] * len(added))}
+        """, [value for tag_id in added for value in (posting_id, tag_id)])
+
+    return bool(added or removed)
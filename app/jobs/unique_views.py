@@ -0,0 +1,184 @@
+import hashlib
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+import redis
+
+from app.cache.redis_cache import cache
+
+
+def visitor_key(user_id: Optional[int] = None, ip: Optional[str] = None,
+                user_agent: Optional[str] = None) -> str:
+    """방문자 식별 키 - 로그인 사용자는 user_id, 비로그인은 IP + User-Agent 해시"""
+    if user_id:
+        return f"u:{user_id}"
+    digest = hashlib.sha1(f"{ip or ''}|{user_agent or ''}".encode()).hexdigest()
+    return f"a:{digest[:16]}"
+
+
+class UniqueViewCounter:
+    """공고별 고유 방문자 수 (HyperLogLog)
+
+    Redis PFADD로 공고별 누적 키와 일별 키(보관 기간 후 만료)에 방문자를 기록하고,
+    주기 작업이 누적 추정값을 job_postings/job_search.unique_view_count에 반영한다.
+    조회 요청마다 SQL 쓰기를 하지 않으며 공고당 메모리는 일정하다.
+    Redis 장애 중에는 방문자 키를 프로세스 내에 (MAX_LOCAL_VISITORS까지) 모아 두었다가
+    Redis가 돌아오면 그대로 PFADD해 합친다 (같은 방문자가 양쪽에서 두 번 세어지지 않음).
+    """
+
+    KEY_PREFIX = 'views:uv'
+    TOUCHED_KEY = 'views:uv:touched'
+    PROCESSING_KEY = 'views:uv:processing'
+    BATCH_SIZE = 500
+    MAX_LOCAL_VISITORS = 100000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (공고, 방문일) → Redis에 아직 기록하지 못한 방문자 키
+        self._local: Dict[Tuple[int, date], Set[str]] = {}
+        self._local_size = 0
+        self.retention_days = int(os.getenv('UNIQUE_VIEW_RETENTION_DAYS', 30))
+        self.materialize_interval = int(os.getenv('UNIQUE_VIEW_MATERIALIZE_INTERVAL', 300))
+
+    def _total_key(self, posting_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{posting_id}:total"
+
+    def _daily_key(self, posting_id: int, day: date) -> str:
+        return f"{self.KEY_PREFIX}:{posting_id}:{day.strftime('%Y%m%d')}"
+
+    def _add_commands(self, pipe, posting_id: int, day: date, visitors):
+        pipe.pfadd(self._total_key(posting_id), *visitors)
+        pipe.pfadd(self._daily_key(posting_id, day), *visitors)
+        pipe.expire(self._daily_key(posting_id, day), timedelta(days=self.retention_days + 1))
+        pipe.sadd(self.TOUCHED_KEY, posting_id)
+
+    def record(self, posting_id: int, visitor: str):
+        today = date.today()
+        try:
+            pipe = cache.redis_client.pipeline()
+            self._add_commands(pipe, posting_id, today, [visitor])
+            pipe.execute()
+            return
+        except redis.RedisError as e:
+            logging.warning(f"Unique view record error: {str(e)}")
+
+        with self._lock:
+            if self._local_size >= self.MAX_LOCAL_VISITORS:
+                return
+            visitors = self._local.setdefault((posting_id, today), set())
+            if visitor not in visitors:
+                visitors.add(visitor)
+                self._local_size += 1
+
+    def _replay_local(self) -> bool:
+        """장애 중 모아 둔 방문자를 Redis에 기록 - 남은 것이 없으면 True"""
+        with self._lock:
+            if not self._local:
+                return True
+            local, self._local, self._local_size = self._local, {}, 0
+
+        try:
+            pipe = cache.redis_client.pipeline()
+            for (posting_id, day), visitors in local.items():
+                self._add_commands(pipe, posting_id, day, visitors)
+            pipe.execute()
+            return True
+        except redis.RedisError as e:
+            logging.warning(f"Unique view replay error: {str(e)}")
+
+        # 다음 기회에 다시 기록
+        with self._lock:
+            for key, visitors in local.items():
+                self._local.setdefault(key, set()).update(visitors)
+            self._local_size = sum(len(visitors) for visitors in self._local.values())
+        return False
+
+    def count(self, posting_id: int, days: Optional[int] = None) -> int:
+        """고유 방문자 추정값 - days를 주면 최근 days일(오늘 포함) 기준"""
+        if days:
+            day_list = [date.today() - timedelta(days=i) for i in range(days)]
+            keys = [self._daily_key(posting_id, day) for day in day_list]
+        else:
+            day_list = None
+            keys = [self._total_key(posting_id)]
+
+        try:
+            if self._replay_local():
+                return cache.redis_client.pfcount(*keys)
+        except redis.RedisError as e:
+            logging.warning(f"Unique view count error: {str(e)}")
+
+        # Redis 장애 중 - 이 프로세스가 모아 둔 방문자만 (하한값)
+        with self._lock:
+            return len(set().union(*(visitors for (local_id, day), visitors in self._local.items()
+                                     if local_id == posting_id and (day_list is None or day in day_list))))
+
+    def materialize(self, db) -> int:
+        """방문이 기록된 공고의 누적 추정값을 unique_view_count 컬럼에 반영
+
+        Redis에 연결할 수 없으면 건너뛴다 (프로세스 내 값으로 누적값을 덮어쓰지 않도록).
+        """
+        if not self._replay_local():
+            return 0
+
+        try:
+            if not cache.redis_client.exists(self.PROCESSING_KEY):
+                try:
+                    cache.redis_client.rename(self.TOUCHED_KEY, self.PROCESSING_KEY)
+                except redis.ResponseError:
+                    pass
+            posting_ids = [int(x) for x in cache.redis_client.smembers(self.PROCESSING_KEY)]
+
+            for start in range(0, len(posting_ids), self.BATCH_SIZE):
+                batch = posting_ids[start:start + self.BATCH_SIZE]
+                self._apply(db, self._estimates(batch))
+
+            cache.redis_client.delete(self.PROCESSING_KEY)
+        except redis.RedisError as e:
+            logging.warning(f"Unique view materialize error: {str(e)}")
+            return 0
+
+        return len(posting_ids)
+
+    def _estimates(self, posting_ids: List[int]) -> Dict[int, int]:
+        pipe = cache.redis_client.pipeline()
+        for posting_id in posting_ids:
+            pipe.pfcount(self._total_key(posting_id))
+        return dict(zip(posting_ids, pipe.execute()))
+
+    @staticmethod
+    def _apply(db, estimates: Dict[int, int]):
+        """UPDATE ... CASE로 배치 반영 (원본과 읽기 모델을 같은 트랜잭션에서 갱신)
+
+        누적값은 줄어들지 않으므로 Redis 키가 유실돼 추정값이 작아져도 기존 값을 유지한다.
+        """
+        if not estimates:
+            return
+
+        cursor = db.cursor()
+        try:
+            cases = ' '.join(['WHEN %s THEN %s'] * len(estimates))
+            id_list = ','.join(['%s'] * len(estimates))
+            params = [value for item in estimates.items() for value in item]
+            params.extend(estimates)
+
+            for table in ('job_postings', 'job_search'):
+                cursor.execute(f"""
+                    UPDATE {table}
+                    SET unique_view_count = GREATEST(unique_view_count,
+                                                     CASE posting_id {cases} ELSE unique_view_count END)
+                    WHERE posting_id IN ({id_list})
+                """, params)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+# 싱글톤 인스턴스 생성
+unique_view_counter = UniqueViewCounter()
@@ -49,4 +49,15 @@ def prepare_job_filters(args: Dict) -> Dict:
     filters['sort_field'] = args.get('sort_field', 'created_at')
     filters['sort_order'] = args.get('sort_order', 'desc')
 
-    return filters 
\ No newline at end of file
+    return filters 
+def changed_values(current: Dict, updates: Dict) -> Dict:
+    """
+    Keep only the updates that differ from the current row
+    (날짜/숫자는 JSON 문자열과 비교할 수 있도록 문자열로 비교)
+    """
+    changed = {}
+    for field, value in updates.items():
+        old = current.get(field)
+        if (old is None) != (value is None) or (old is not None and str(old) != str(value)):
+            changed[field] = value
+    return changed
@@ -0,0 +1,150 @@
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List
+
+import redis
+
+from app.cache.redis_cache import cache
+
+
+class ViewCounter:
+    """상세 조회수 write-behind 버퍼
+
+    조회 요청은 Redis 해시에 HINCRBY만 하고(Redis 장애 시 프로세스 내 버퍼),
+    백그라운드 작업이 주기적으로 모아 UPDATE ... CASE 한 번으로 MySQL에 반영한다.
+    조회수를 읽을 때는 아직 반영되지 않은 증가분을 더해서 보여준다.
+    """
+
+    PENDING_KEY = 'views:pending'
+    # 반영 중인 증가분 (작업이 중간에 실패하면 다음 실행에서 이어서 반영)
+    FLUSHING_KEY = 'views:flushing'
+    LOCK_KEY = 'views:flush_lock'
+    FLUSH_BATCH_SIZE = 500
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local: Dict[int, int] = {}
+        self.flush_interval = int(os.getenv('VIEW_FLUSH_INTERVAL', 10))
+
+    def increment(self, posting_id: int, amount: int = 1):
+        try:
+            cache.redis_client.hincrby(self.PENDING_KEY, posting_id, amount)
+            return
+        except redis.RedisError as e:
+            logging.warning(f"View counter write error: {str(e)}")
+        self._add_local({posting_id: amount})
+
+    def pending(self, posting_ids: Iterable[int]) -> Dict[int, int]:
+        """아직 MySQL에 반영되지 않은 공고별 조회수 증가분"""
+        posting_ids = list(posting_ids)
+        if not posting_ids:
+            return {}
+
+        with self._lock:
+            deltas = {posting_id: self._local.get(posting_id, 0) for posting_id in posting_ids}
+
+        try:
+            pipe = cache.redis_client.pipeline()
+            pipe.hmget(self.PENDING_KEY, posting_ids)
+            pipe.hmget(self.FLUSHING_KEY, posting_ids)
+            for values in pipe.execute():
+                for posting_id, value in zip(posting_ids, values):
+                    if value:
+                        deltas[posting_id] += int(value)
+        except redis.RedisError as e:
+            logging.warning(f"View counter read error: {str(e)}")
+
+        return {posting_id: delta for posting_id, delta in deltas.items() if delta}
+
+    def merge(self, rows: List[Dict]) -> List[Dict]:
+        """조회 결과의 view_count에 반영 대기 중인 증가분 합산 (view_count를 조회한 행만)"""
+        rows_with_count = [row for row in rows if 'view_count' in row]
+        if not rows_with_count:
+            return rows
+        deltas = self.pending(row['posting_id'] for row in rows_with_count)
+        for row in rows_with_count:
+            if row['posting_id'] in deltas:
+                row['view_count'] = (row.get('view_count') or 0) + deltas[row['posting_id']]
+        return rows
+
+    def flush(self, db) -> int:
+        """모인 증가분을 job_postings/job_search에 일괄 반영 - 반영한 공고 수 반환"""
+        flushed = self._flush_local(db)
+
+        try:
+            # 여러 워커 프로세스가 같은 증가분을 중복 반영하지 않도록 잠금
+            if not cache.redis_client.set(self.LOCK_KEY, 1, nx=True, ex=max(self.flush_interval * 6, 60)):
+                return flushed
+        except redis.RedisError as e:
+            logging.warning(f"View counter flush lock error: {str(e)}")
+            return flushed
+
+        try:
+            if not cache.redis_client.exists(self.FLUSHING_KEY):
+                try:
+                    cache.redis_client.rename(self.PENDING_KEY, self.FLUSHING_KEY)
+                except redis.ResponseError:
+                    # 반영할 증가분 없음
+                    return flushed
+
+            deltas = {int(k): int(v) for k, v in cache.redis_client.hgetall(self.FLUSHING_KEY).items() if int(v)}
+            self._apply(db, deltas)
+            cache.redis_client.delete(self.FLUSHING_KEY)
+            return flushed + len(deltas)
+        finally:
+            try:
+                cache.redis_client.delete(self.LOCK_KEY)
+            except redis.RedisError as e:
+                logging.warning(f"View counter flush unlock error: {str(e)}")
+
+    def _flush_local(self, db) -> int:
+        with self._lock:
+            deltas, self._local = self._local, {}
+        if not deltas:
+            return 0
+
+        try:
+            self._apply(db, deltas)
+        except Exception:
+            # 실패한 증가분은 버퍼로 되돌려 다음 실행에서 다시 반영
+            self._add_local(deltas)
+            raise
+        return len(deltas)
+
+    def _add_local(self, deltas: Dict[int, int]):
+        with self._lock:
+            for posting_id, amount in deltas.items():
+                self._local[posting_id] = self._local.get(posting_id, 0) + amount
+
+    def _apply(self, db, deltas: Dict[int, int]):
+        """UPDATE ... CASE로 배치 반영 (원본과 읽기 모델을 같은 트랜잭션에서 갱신)"""
+        if not deltas:
+            return
+
+        cursor = db.cursor()
+        try:
+            items = list(deltas.items())
+            for start in range(0, len(items), self.FLUSH_BATCH_SIZE):
+                batch = items[start:start + self.FLUSH_BATCH_SIZE]
+                cases = ' '.join(['WHEN %s THEN %s'] * len(batch))
+                id_list = ','.join(['%s'] * len(batch))
+                params = [value for item in batch for value in item]
+                params.extend(posting_id for posting_id, _ in batch)
+
+                for table in ('job_postings', 'job_search'):
+                    cursor.execute(f"""
+                        UPDATE {table}
+                        SET view_count = view_count + CASE posting_id {cases} ELSE 0 END
+                        WHERE posting_id IN ({id_list})
+                    """, params)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+# 싱글톤 인스턴스 생성
+view_counter = ViewCounter()
@@ -0,0 +1,168 @@
+from app.database import get_db
+from app.jobs.read_model import split_names
+from app.search.percolator import percolator
+import json
+import logging
+
+class SavedSearch:
+    # 사용자당 저장할 수 있는 검색 수
+    MAX_PER_USER = 20
+
+    @staticmethod
+    def create(user_id: int, name: str, filters: dict):
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            cursor.execute("""
+                SELECT COUNT(*) as total FROM saved_searches WHERE user_id = %s
+            """, (user_id,))
+            if cursor.fetchone()['total'] >= SavedSearch.MAX_PER_USER:
+                return None, f"Saved search limit ({SavedSearch.MAX_PER_USER}) exceeded"
+
+            cursor.execute("""
+                INSERT INTO saved_searches (user_id, name, filters)
+                VALUES (%s, %s, %s)
+            """, (user_id, name, json.dumps(filters, ensure_ascii=False)))
+
+            saved_search_id = cursor.lastrowid
+            db.commit()
+
+            # 이후 들어오는 새 공고부터 대조
+            percolator.add(saved_search_id, filters)
+            return {"saved_search_id": saved_search_id}, None
+
+        except Exception as e:
+            db.rollback()
+            logging.error(f"Saved search creation error: {str(e)}")
+            return None, str(e)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def get_user_searches(user_id: int):
+        """저장된 검색 목록 - 마지막 확인 이후 일치한 새 공고 수 포함"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            cursor.execute("""
+                SELECT
+                    ss.saved_search_id, ss.name, ss.filters,
+                    ss.last_checked_at, ss.created_at,
+                    (SELECT COUNT(*) FROM saved_search_matches m
+                     WHERE m.saved_search_id = ss.saved_search_id
+                     AND m.matched_at > ss.last_checked_at) as new_match_count
+                FROM saved_searches ss
+                WHERE ss.user_id = %s
+                ORDER BY ss.created_at DESC
+            """, (user_id,))
+
+            searches = cursor.fetchall()
+            for search in searches:
+                search['filters'] = json.loads(search['filters'])
+            return searches, None
+
+        except Exception as e:
+            logging.error(f"Saved searches fetch error: {str(e)}")
+            return None, str(e)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def delete(user_id: int, saved_search_id: int):
+        db = get_db()
+        cursor = db.cursor()
+
+        try:
+            cursor.execute("""
+                DELETE FROM saved_searches
+                WHERE saved_search_id = %s AND user_id = %s
+            """, (saved_search_id, user_id))
+
+            if cursor.rowcount == 0:
+                return "Saved search not found"
+
+            cursor.execute("""
+                DELETE FROM saved_search_matches WHERE saved_search_id = %s
+            """, (saved_search_id,))
+            db.commit()
+
+            percolator.remove(saved_search_id)
+            return None
+
+        except Exception as e:
+            db.rollback()
+            logging.error(f"Saved search deletion error: {str(e)}")
+            return str(e)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def get_matches(user_id: int, saved_search_id: int, page: int = 1, per_page: int = 10):
+        """저장된 검색과 일치한 새 공고 (최근 일치 순) - 조회 시 마지막 확인 시각 갱신"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            cursor.execute("""
+                SELECT saved_search_id FROM saved_searches
+                WHERE saved_search_id = %s AND user_id = %s
+            """, (saved_search_id, user_id))
+
+            if not cursor.fetchone():
+                return None, "Saved search not found"
+
+            cursor.execute("""
+                SELECT
+                    m.matched_at,
+                    s.posting_id,
+                    s.title,
+                    s.experience_level,
+                    s.employment_type,
+                    s.salary_info,
+                    s.deadline_date,
+                    s.company_id,
+                    s.company_name,
+                    s.city,
+                    s.district,
+                    s.tech_stack_names as tech_stacks
+                FROM saved_search_matches m
+                JOIN job_search s ON m.posting_id = s.posting_id
+                WHERE m.saved_search_id = %s AND s.status = 'active'
+                ORDER BY m.matched_at DESC, m.posting_id DESC
+                LIMIT %s OFFSET %s
+            """, (saved_search_id, per_page, (page - 1) * per_page))
+
+            postings = cursor.fetchall()
+            for posting in postings:
+                posting['tech_stacks'] = split_names(posting['tech_stacks'])
+
+            cursor.execute("""
+                SELECT COUNT(*) as total
+                FROM saved_search_matches m
+                JOIN job_search s ON m.posting_id = s.posting_id
+                WHERE m.saved_search_id = %s AND s.status = 'active'
+            """, (saved_search_id,))
+            total = cursor.fetchone()['total']
+
+            cursor.execute("""
+                UPDATE saved_searches SET last_checked_at = CURRENT_TIMESTAMP
+                WHERE saved_search_id = %s
+            """, (saved_search_id,))
+            db.commit()
+
+            return {
+                'postings': postings,
+                'total': total,
+                'page': page,
+                'per_page': per_page,
+                'total_pages': (total + per_page - 1) // per_page
+            }, None
+
+        except Exception as e:
+            db.rollback()
+            logging.error(f"Saved search matches fetch error: {str(e)}")
+            return None, str(e)
+        finally:
+            cursor.close()
@@ -0,0 +1,133 @@
+from flask import Blueprint, request, jsonify, make_response, g
+from app.saved_searches.models import SavedSearch
+from app.jobs.routes import parse_listing_filters
+from app.middleware.auth import login_required
+import logging
+
+saved_searches_bp = Blueprint('saved_searches', __name__, url_prefix='/saved-searches')
+
+@saved_searches_bp.route('', methods=['POST'])
+@login_required
+def create_saved_search():
+    try:
+        data = request.get_json() or {}
+
+        if not data.get('name') or not isinstance(data.get('filters'), dict):
+            return make_response(jsonify({
+                "status": "error",
+                "message": "name and filters are required"
+            }), 400)
+
+        # GET /jobs와 같은 파라미터 (목록 값은 쉼표로 이어 붙임)
+        args = {
+            key: ','.join(str(v) for v in value) if isinstance(value, list) else str(value)
+            for key, value in data['filters'].items() if value is not None
+        }
+        try:
+            filters = parse_listing_filters(args)
+        except ValueError as e:
+            return make_response(jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400)
+
+        if not filters:
+            return make_response(jsonify({
+                "status": "error",
+                "message": "At least one filter is required"
+            }), 400)
+
+        result, error = SavedSearch.create(g.user_id, data['name'][:100], filters)
+
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 400)
+
+        return make_response(jsonify({
+            "status": "success",
+            "data": result
+        }), 201)
+
+    except Exception as e:
+        logging.error(f"Saved search creation error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@saved_searches_bp.route('', methods=['GET'])
+@login_required
+def get_saved_searches():
+    try:
+        searches, error = SavedSearch.get_user_searches(g.user_id)
+
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 400)
+
+        return make_response(jsonify({
+            "status": "success",
+            "data": {"saved_searches": searches}
+        }), 200)
+
+    except Exception as e:
+        logging.error(f"Saved searches fetch error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@saved_searches_bp.route('/<int:saved_search_id>', methods=['DELETE'])
+@login_required
+def delete_saved_search(saved_search_id):
+    try:
+        error = SavedSearch.delete(g.user_id, saved_search_id)
+
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 404 if error == "Saved search not found" else 400)
+
+        return make_response(jsonify({
+            "status": "success",
+            "message": "Saved search deleted successfully"
+        }), 200)
+
+    except Exception as e:
+        logging.error(f"Saved search deletion error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
+
+@saved_searches_bp.route('/<int:saved_search_id>/matches', methods=['GET'])
+@login_required
+def get_saved_search_matches(saved_search_id):
+    try:
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', 10))
+
+        result, error = SavedSearch.get_matches(g.user_id, saved_search_id, page, per_page)
+
+        if error:
+            return make_response(jsonify({
+                "status": "error",
+                "message": error
+            }), 404 if error == "Saved search not found" else 400)
+
+        return make_response(jsonify({
+            "status": "success",
+            "data": result
+        }), 200)
+
+    except Exception as e:
+        logging.error(f"Saved search matches fetch error: {str(e)}")
+        return make_response(jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500)
@@ -0,0 +1,17 @@
+# 채용공고 검색용 인메모리 인덱스
+from .tokenizer import tokenize, hangul_phrases
+from .inverted_index import search_index
+from .bitmap import Bitmap
+from .bitmap_index import bitmap_index
+from .facets import facet_index
+from .suggest import suggest_index
+
+__all__ = [
+    'tokenize',
+    'hangul_phrases',
+    'search_index',
+    'Bitmap',
+    'bitmap_index',
+    'facet_index',
+    'suggest_index'
+]
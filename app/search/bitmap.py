@@ -0,0 +1,190 @@
+from array import array
+from typing import Dict, Iterable, Iterator, Union
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python 3.9 이하
+    def popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+# 컨테이너 하나가 담는 값의 범위 (하위 16비트)
+CONTAINER_BITS = 16
+LOW_MASK = (1 << CONTAINER_BITS) - 1
+# 이 개수를 넘으면 정렬 배열 대신 65536비트 비트맵으로 저장
+ARRAY_MAX = 4096
+
+# 희소: 정렬된 array('H') / 밀집: 65536비트 정수
+Container = Union[array, int]
+
+
+def _bits_to_array(bits: int) -> array:
+    values = array('H')
+    while bits:
+        lowest = bits & -bits
+        values.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return values
+
+
+def _array_to_bits(values: Iterable[int]) -> int:
+    buffer = bytearray(1 << (CONTAINER_BITS - 3))
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def _cardinality(container: Container) -> int:
+    return popcount(container) if isinstance(container, int) else len(container)
+
+
+def _optimize(container: Container) -> Container:
+    """크기에 맞는 컨테이너 형태로 변환 (빈 컨테이너는 그대로 반환)"""
+    if isinstance(container, int):
+        if popcount(container) <= ARRAY_MAX:
+            return _bits_to_array(container)
+        return container
+    if len(container) > ARRAY_MAX:
+        return _array_to_bits(container)
+    return container
+
+
+def _and(a: Container, b: Container) -> Container:
+    if isinstance(a, int) and isinstance(b, int):
+        return _optimize(a & b)
+    if isinstance(a, int):
+        a, b = b, a
+    if isinstance(b, int):
+        return array('H', (v for v in a if b >> v & 1))
+    return array('H', sorted(set(a).intersection(b)))
+
+
+def _or(a: Container, b: Container) -> Container:
+    if isinstance(a, int) or isinstance(b, int):
+        a_bits = a if isinstance(a, int) else _array_to_bits(a)
+        b_bits = b if isinstance(b, int) else _array_to_bits(b)
+        return a_bits | b_bits
+    return _optimize(array('H', sorted(set(a).union(b))))
+
+
+def _andnot(a: Container, b: Container) -> Container:
+    if isinstance(a, int):
+        b_bits = b if isinstance(b, int) else _array_to_bits(b)
+        return _optimize(a & ~b_bits)
+    if isinstance(b, int):
+        return array('H', (v for v in a if not b >> v & 1))
+    return array('H', sorted(set(a).difference(b)))
+
+
+class Bitmap:
+    """posting_id 집합용 압축 비트맵 (Roaring 방식)
+
+    상위 16비트별로 컨테이너를 나누고, 원소가 적은 컨테이너는 정렬 배열(2바이트/원소),
+    많은 컨테이너는 65536비트 비트맵(8KB)으로 저장한다.
+    """
+
+    __slots__ = ('_containers',)
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._containers: Dict[int, Container] = {}
+        grouped: Dict[int, list] = {}
+        for value in values:
+            grouped.setdefault(value >> CONTAINER_BITS, []).append(value & LOW_MASK)
+        for high, lows in grouped.items():
+            self._containers[high] = _optimize(array('H', sorted(set(lows))))
+
+    @classmethod
+    def _from_containers(cls, containers: Dict[int, Container]) -> 'Bitmap':
+        bitmap = cls()
+        bitmap._containers = {high: c for high, c in containers.items() if _cardinality(c)}
+        return bitmap
+
+    def add(self, value: int):
+        high, low = value >> CONTAINER_BITS, value & LOW_MASK
+        container = self._containers.get(high)
+        if container is None:
+            self._containers[high] = array('H', [low])
+        elif isinstance(container, int):
+            self._containers[high] = container | (1 << low)
+        else:
+            lo, hi = 0, len(container)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if container[mid] < low:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == len(container) or container[lo] != low:
+                # 컨테이너는 연산 결과끼리 공유될 수 있으므로 제자리 수정하지 않는다
+                self._containers[high] = _optimize(container[:lo] + array('H', [low]) + container[lo:])
+
+    def discard(self, value: int):
+        high, low = value >> CONTAINER_BITS, value & LOW_MASK
+        container = self._containers.get(high)
+        if container is None:
+            return
+        if isinstance(container, int):
+            container = _optimize(container & ~(1 << low))
+        elif low in container:
+            container = array('H', (v for v in container if v != low))
+        if _cardinality(container):
+            self._containers[high] = container
+        else:
+            del self._containers[high]
+
+    def __contains__(self, value: int) -> bool:
+        container = self._containers.get(value >> CONTAINER_BITS)
+        if container is None:
+            return False
+        low = value & LOW_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        return low in container
+
+    def __len__(self) -> int:
+        return sum(_cardinality(c) for c in self._containers.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._containers)
+
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            base = high << CONTAINER_BITS
+            values = _bits_to_array(container) if isinstance(container, int) else container
+            for low in values:
+                yield base | low
+
+    def __and__(self, other: 'Bitmap') -> 'Bitmap':
+        small, large = sorted((self._containers, other._containers), key=len)
+        return Bitmap._from_containers({
+            high: _and(container, large[high])
+            for high, container in small.items() if high in large
+        })
+
+    def __or__(self, other: 'Bitmap') -> 'Bitmap':
+        containers = dict(self._containers)
+        for high, container in other._containers.items():
+            containers[high] = _or(containers[high], container) if high in containers else container
+        return Bitmap._from_containers(containers)
+
+    def __sub__(self, other: 'Bitmap') -> 'Bitmap':
+        return Bitmap._from_containers({
+            high: _andnot(container, other._containers[high]) if high in other._containers else container
+            for high, container in self._containers.items()
+        })
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Bitmap) and list(self) == list(other)
+
+    def copy(self) -> 'Bitmap':
+        return Bitmap._from_containers(dict(self._containers))
+
+    def __repr__(self) -> str:
+        return f"Bitmap(cardinality={len(self)})"
+
+    @staticmethod
+    def union_all(bitmaps: Iterable['Bitmap']) -> 'Bitmap':
+        result = Bitmap()
+        for bitmap in bitmaps:
+            result = result | bitmap
+        return result
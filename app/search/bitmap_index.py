@@ -0,0 +1,262 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from app.database import get_db
+from app.cache.posting_versions import posting_versions
+from .bitmap import Bitmap
+
+
+def as_list(value) -> list:
+    if value is None or value == '' or value == []:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+class BitmapIndex:
+    """필드 값별 posting_id 압축 비트맵 색인
+
+    posting_tech_stacks, posting_categories, job_postings에서 적재하며
+    (삭제되지 않은 공고 대상) 기술스택/카테고리/지역/상태/경력/고용형태 조건을
+    조인 없이 AND / OR / NOT 비트맵 연산으로 계산한다.
+    """
+
+    FIELDS = ('tech_stacks', 'categories', 'location_id', 'status', 'experience_level', 'employment_type')
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._bitmaps: Dict[str, Dict[object, Bitmap]] = {field: {} for field in self.FIELDS}
+        self._values: Dict[int, Dict[str, tuple]] = {}
+        self._loaded_at: Optional[float] = None
+        # 색인이 반영한 공고 전체 버전 (posting_versions) - 다른 워커의 변경 여부 확인용
+        self._version: Optional[str] = None
+        # 다른 워커 프로세스의 변경분을 반영하기 위한 주기적 재구성 (초, 스케줄러 작업)
+        self.max_age = int(os.getenv('SEARCH_INDEX_MAX_AGE', 600))
+
+    @property
+    def loaded(self) -> bool:
+        """이 프로세스에서 색인을 적재했는지 (적재 전에는 refresh/values_for가 아무것도 하지 않음)"""
+        return self._loaded_at is not None
+
+    def ensure_loaded(self):
+        """처음 사용할 때만 적재 (주기적 재구성은 요청 밖의 스케줄러 작업이 load 호출)"""
+        if self._loaded_at is None:
+            self.load()
+
+    def is_current(self) -> bool:
+        """다른 워커의 공고 변경 없이 색인이 최신인지 (버전을 알 수 없으면 최신이 아닌 것으로 본다)"""
+        return self._version is not None and posting_versions.current() == self._version
+
+    def advance(self, version: Optional[str]):
+        """이 프로세스가 변경분을 반영하고 올린 버전 기록 - 그 사이 다른 워커가 올린 버전이 없을 때만"""
+        with self._lock:
+            if version is not None and self._version is not None and int(version) == int(self._version) + 1:
+                self._version = version
+
+    def load(self):
+        """전체 공고로 비트맵 재구성 (조회 중인 색인은 완성된 새 색인으로 교체)"""
+        # 적재 중에 바뀐 공고는 다음 재구성까지 최신이 아닌 것으로 보이도록 버전을 먼저 읽는다
+        version = posting_versions.current()
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            values = self._fetch_values(cursor)
+        finally:
+            cursor.close()
+
+        members: Dict[str, Dict[object, List[int]]] = {field: {} for field in self.FIELDS}
+        for posting_id, posting_values in values.items():
+            for field, field_values in posting_values.items():
+                for value in field_values:
+                    members[field].setdefault(value, []).append(posting_id)
+
+        bitmaps = {
+            field: {value: Bitmap(ids) for value, ids in field_members.items()}
+            for field, field_members in members.items()
+        }
+
+        with self._lock:
+            self._bitmaps = bitmaps
+            self._values = values
+            self._version = version
+            self._loaded_at = time.time()
+
+        logging.info(f"Bitmap index loaded: {len(values)} postings")
+
+    def refresh(self, posting_ids: Iterable[int]):
+        """변경된 공고의 값만 다시 반영"""
+        posting_ids = list(posting_ids)
+        if not posting_ids or self._loaded_at is None:
+            return
+
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            values = self._fetch_values(cursor, posting_ids)
+        finally:
+            cursor.close()
+
+        with self._lock:
+            for posting_id in posting_ids:
+                self._remove(posting_id)
+                if posting_id in values:
+                    self._add(posting_id, values[posting_id])
+
+    def get(self, field: str, value) -> Bitmap:
+        self.ensure_loaded()
+        return self._bitmaps[field].get(value, Bitmap())
+
+    def bitmaps(self, field: str) -> Dict[object, Bitmap]:
+        """필드의 값 → 비트맵 (스냅샷)"""
+        self.ensure_loaded()
+        with self._lock:
+            return dict(self._bitmaps[field])
+
+    def any_of(self, field: str, values) -> Bitmap:
+        """OR - 값 중 하나라도 가진 공고"""
+        self.ensure_loaded()
+        with self._lock:
+            return Bitmap.union_all(self._bitmaps[field].get(v, Bitmap()) for v in as_list(values))
+
+    def all_of(self, field: str, values) -> Bitmap:
+        """AND - 모든 값을 가진 공고"""
+        self.ensure_loaded()
+        with self._lock:
+            bitmaps = sorted((self._bitmaps[field].get(v, Bitmap()) for v in as_list(values)), key=len)
+            if not bitmaps:
+                return Bitmap()
+            result = bitmaps[0]
+            for bitmap in bitmaps[1:]:
+                result = result & bitmap
+            return result
+
+    def values_for(self, posting_id: int) -> Dict[str, tuple]:
+        """공고 하나의 필드별 색인 값 (색인되지 않은 공고는 빈 dict)"""
+        return self._values.get(posting_id, {})
+
+    def filter_bitmaps(self, filters: Optional[Dict]) -> Dict[str, Bitmap]:
+        """목록 필터 → 조건 그룹별 비트맵 (지정되지 않은 그룹은 생략)
+
+        - tech_stacks: tech_stacks_mode가 all이면 AND, 아니면 OR / exclude_tech_stacks는 NOT
+        - categories: OR / exclude_categories는 NOT
+        - location_id, experience_level, employment_type: 값 목록 OR
+        - location_ids: region 필터의 location_id 목록 OR (location_id 조건과 AND)
+        NOT 조건은 활성 공고 전체에서 제외한 비트맵으로 표현한다.
+        """
+        filters = filters or {}
+        self.ensure_loaded()
+
+        with self._lock:
+            active = self._bitmaps['status'].get('active', Bitmap())
+            groups: Dict[str, Bitmap] = {}
+
+            for field, exclude_key in (('tech_stacks', 'exclude_tech_stacks'),
+                                       ('categories', 'exclude_categories')):
+                bitmap = None
+                if as_list(filters.get(field)):
+                    if field == 'tech_stacks' and filters.get('tech_stacks_mode') == 'all':
+                        bitmap = self.all_of(field, filters[field])
+                    else:
+                        bitmap = self.any_of(field, filters[field])
+                if as_list(filters.get(exclude_key)):
+                    bitmap = (bitmap if bitmap is not None else active) - self.any_of(field, filters[exclude_key])
+                if bitmap is not None:
+                    groups[field] = bitmap
+
+            for field in ('location_id', 'experience_level', 'employment_type'):
+                if as_list(filters.get(field)):
+                    groups[field] = self.any_of(field, filters[field])
+
+            # region 필터를 풀어 놓은 location_id 목록 (빈 목록이면 일치하는 공고 없음)
+            if filters.get('location_ids') is not None:
+                bitmap = self.any_of('location_id', filters['location_ids'])
+                groups['location_id'] = groups['location_id'] & bitmap if 'location_id' in groups else bitmap
+
+            return groups
+
+    def match(self, filters: Optional[Dict]) -> Bitmap:
+        """필터 조건을 모두 만족하는 활성 공고 비트맵"""
+        self.ensure_loaded()
+        with self._lock:
+            result = self._bitmaps['status'].get('active', Bitmap())
+            for bitmap in sorted(self.filter_bitmaps(filters).values(), key=len):
+                result = result & bitmap
+            return result
+
+    # 조회 중인 스냅샷이 바뀌지 않도록 비트맵은 복사 후 수정해 교체한다
+    def _add(self, posting_id: int, posting_values: Dict[str, tuple]):
+        self._values[posting_id] = posting_values
+        for field, field_values in posting_values.items():
+            for value in field_values:
+                bitmap = self._bitmaps[field].get(value)
+                bitmap = bitmap.copy() if bitmap is not None else Bitmap()
+                bitmap.add(posting_id)
+                self._bitmaps[field][value] = bitmap
+
+    def _remove(self, posting_id: int):
+        posting_values = self._values.pop(posting_id, None)
+        if posting_values is None:
+            return
+        for field, field_values in posting_values.items():
+            for value in field_values:
+                bitmap = self._bitmaps[field].get(value)
+                if bitmap is None:
+                    continue
+                bitmap = bitmap.copy()
+                bitmap.discard(posting_id)
+                if bitmap:
+                    self._bitmaps[field][value] = bitmap
+                else:
+                    del self._bitmaps[field][value]
+
+    @staticmethod
+    def _fetch_values(cursor, posting_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, tuple]]:
+        """공고별 색인 값 조회 (posting_ids가 없으면 삭제되지 않은 전체 공고)"""
+        id_filter, params = "", []
+        if posting_ids:
+            id_filter = f" AND p.posting_id IN ({','.join(['%s'] * len(posting_ids))})"
+            params = posting_ids
+
+        cursor.execute(f"""
+            SELECT p.posting_id, p.status, p.location_id, p.experience_level, p.employment_type
+            FROM job_postings p
+            WHERE p.status != 'deleted'{id_filter}
+        """, params)
+
+        values: Dict[int, Dict[str, list]] = {}
+        for row in cursor.fetchall():
+            values[row['posting_id']] = {
+                'tech_stacks': [],
+                'categories': [],
+                'location_id': [row['location_id']] if row['location_id'] else [],
+                'status': [row['status']] if row['status'] else [],
+                'experience_level': [row['experience_level']] if row['experience_level'] else [],
+                'employment_type': [row['employment_type']] if row['employment_type'] else []
+            }
+
+        for field, table, column in (('tech_stacks', 'posting_tech_stacks', 'stack_id'),
+                                     ('categories', 'posting_categories', 'category_id')):
+            cursor.execute(f"""
+                SELECT t.posting_id, t.{column} as value
+                FROM {table} t
+                JOIN job_postings p ON t.posting_id = p.posting_id
+                WHERE p.status != 'deleted'{id_filter}
+            """, params)
+            for row in cursor.fetchall():
+                if row['posting_id'] in values:
+                    values[row['posting_id']][field].append(row['value'])
+
+        return {
+            posting_id: {field: tuple(field_values) for field, field_values in posting_values.items()}
+            for posting_id, posting_values in values.items()
+        }
+
+
+# 싱글톤 인스턴스 생성
+bitmap_index = BitmapIndex()
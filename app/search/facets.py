@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.database import get_db
+from .bitmap import Bitmap
+from .bitmap_index import bitmap_index
+
+# 이름이 있는 패싯 → (ID 컬럼, 조회 쿼리)
+LABEL_SOURCES = {
+    'tech_stacks': ('stack_id', "SELECT stack_id, name FROM tech_stacks"),
+    'categories': ('category_id', "SELECT category_id, name FROM job_categories"),
+    'location_id': ('location_id', "SELECT location_id, city, district FROM locations")
+}
+
+
+class FacetIndex:
+    """패싯 값별 공고 수 집계
+
+    bitmap_index의 (필드, 값) → 비트맵을 현재 필터 조건의 비트맵과 AND 후
+    원소 수로 값별 건수를 구한다. 패싯마다 GROUP BY 쿼리를 실행하지 않는다.
+    """
+
+    FACETS = ('tech_stacks', 'categories', 'location_id', 'experience_level', 'employment_type')
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._labels: Dict[str, Dict[object, str]] = {facet: {} for facet in self.FACETS}
+        self._loaded_at: Optional[float] = None
+
+    def ensure_loaded(self):
+        if self._loaded_at is None or time.time() - self._loaded_at > bitmap_index.max_age:
+            self.load()
+
+    def load(self):
+        """기술스택/카테고리/지역 이름 적재"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            labels = self._fetch_labels(cursor)
+        finally:
+            cursor.close()
+
+        with self._lock:
+            self._labels = labels
+            self._loaded_at = time.time()
+
+    def refresh(self, posting_ids: Iterable[int]):
+        """변경된 공고가 참조하는 기술스택/카테고리/지역 중 이름을 모르는 것만 조회
+
+        (비트맵은 bitmap_index가 먼저 갱신하므로 그 값을 사용, 이름 변경은 주기적 재적재로 반영)
+        """
+        if self._loaded_at is None:
+            return
+
+        missing: Dict[str, Set] = {facet: set() for facet in LABEL_SOURCES}
+        with self._lock:
+            for posting_id in posting_ids:
+                values = bitmap_index.values_for(posting_id)
+                for facet, ids in missing.items():
+                    ids.update(value for value in values.get(facet, ()) if value not in self._labels[facet])
+        if not any(missing.values()):
+            return
+
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            labels = self._fetch_labels(cursor, missing)
+        finally:
+            cursor.close()
+
+        with self._lock:
+            for facet, facet_labels in labels.items():
+                self._labels[facet] = {**self._labels[facet], **facet_labels}
+
+    def counts(self, filters: Optional[Dict] = None, candidate_ids: Optional[Set[int]] = None,
+               limit: int = 20) -> Dict:
+        """현재 필터 조건에서의 패싯 값별 공고 수
+
+        다중 선택을 위해 각 패싯의 건수는 해당 패싯 자신의 필터를 제외하고 계산한다.
+        candidate_ids: 키워드 검색 후보 (없으면 전체)
+        """
+        self.ensure_loaded()
+        filters = filters or {}
+
+        base = bitmap_index.get('status', 'active')
+        if candidate_ids is not None:
+            base = base & Bitmap(candidate_ids)
+
+        facet_filters = bitmap_index.filter_bitmaps(filters)
+
+        matched = base
+        for bitmap in facet_filters.values():
+            matched = matched & bitmap
+
+        facets = {}
+        for facet in self.FACETS:
+            scope = base
+            for other, bitmap in facet_filters.items():
+                if other != facet:
+                    scope = scope & bitmap
+
+            buckets = []
+            for value, bitmap in bitmap_index.bitmaps(facet).items():
+                count = len(scope & bitmap)
+                if count:
+                    buckets.append({
+                        'value': value,
+                        'label': self._labels[facet].get(value, value),
+                        'count': count
+                    })
+            buckets.sort(key=lambda bucket: (-bucket['count'], str(bucket['value'])))
+            facets[facet] = buckets[:limit]
+
+        return {'total': len(matched), 'facets': facets}
+
+    @staticmethod
+    def _fetch_labels(cursor, ids: Optional[Dict[str, Set]] = None) -> Dict[str, Dict[object, str]]:
+        """패싯별 값 → 이름 (ids를 주면 해당 ID만 조회)"""
+        labels: Dict[str, Dict[object, str]] = {facet: {} for facet in FacetIndex.FACETS}
+
+        for facet, (id_column, query) in LABEL_SOURCES.items():
+            params: List = []
+            if ids is not None:
+                params = sorted(ids.get(facet, ()))
+                if not params:
+                    continue
+                query += f" WHERE {id_column} IN ({','.join(['%s'] * len(params))})"
+            cursor.execute(query, params)
+
+            for row in cursor.fetchall():
+                if facet == 'location_id':
+                    label = f"{row['city']} {row['district']}" if row['district'] else row['city']
+                else:
+                    label = row['name']
+                labels[facet][row[id_column]] = label
+        return labels
+
+
+# 싱글톤 인스턴스 생성
+facet_index = FacetIndex()
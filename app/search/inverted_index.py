@@ -0,0 +1,256 @@
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.database import get_db
+from .tokenizer import tokenize, is_hangul
+
+
+class SearchIndex:
+    """job_postings 제목/본문에 대한 역색인
+
+    활성 공고만 색인하며, 검색어를 토큰으로 나눈 뒤 모든 토큰을 포함하는
+    posting_id 후보 집합을 돌려준다. SQL은 후보 ID만 조회하면 된다.
+    관련도 정렬을 위해 공고별 제목/본문 토큰 빈도와 필드 길이 합계를 함께 유지하고
+    (공고 추가/삭제 시 증분 갱신) 후보 집합에 BM25 점수를 매긴다.
+    """
+
+    LOAD_BATCH_SIZE = 1000
+
+    # BM25 파라미터 - 필드별 정규화 빈도를 가중 합산 (BM25F)
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    TITLE_BOOST = 2.0
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Set[int]] = {}
+        # posting_id → (제목 토큰 빈도, 본문 토큰 빈도)
+        self._doc_terms: Dict[int, Tuple[Counter, Counter]] = {}
+        # 색인된 전체 공고의 (제목 길이 합, 본문 길이 합) - 평균 길이 계산용
+        self._field_lengths = [0, 0]
+        self._sorted_terms: Optional[List[str]] = None
+        self._loaded_at: Optional[float] = None
+        # 다른 워커 프로세스의 변경분을 반영하기 위한 주기적 재색인 (초, 스케줄러 작업)
+        self.max_age = int(os.getenv('SEARCH_INDEX_MAX_AGE', 600))
+
+    def ensure_loaded(self):
+        """처음 사용할 때만 색인 (주기적 재색인은 요청 밖의 스케줄러 작업이 load 호출)"""
+        if self._loaded_at is None:
+            self.load()
+
+    def load(self):
+        """활성 채용공고 전체로 색인 재구성 (조회 중인 색인은 완성된 새 색인으로 교체)"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            cursor.execute("""
+                SELECT posting_id, title, job_description
+                FROM job_postings
+                WHERE status = 'active'
+            """)
+
+            postings: Dict[str, Set[int]] = {}
+            doc_terms: Dict[int, Tuple[Counter, Counter]] = {}
+            field_lengths = [0, 0]
+            while True:
+                rows = cursor.fetchmany(self.LOAD_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    terms = self._document_terms(row['title'], row['job_description'])
+                    doc_terms[row['posting_id']] = terms
+                    for i, field_terms in enumerate(terms):
+                        field_lengths[i] += sum(field_terms.values())
+                    for token in terms[0].keys() | terms[1].keys():
+                        postings.setdefault(token, set()).add(row['posting_id'])
+
+            with self._lock:
+                self._postings = postings
+                self._doc_terms = doc_terms
+                self._field_lengths = field_lengths
+                self._sorted_terms = None
+                self._loaded_at = time.time()
+
+            logging.info(f"Search index loaded: {len(doc_terms)} postings, {len(postings)} terms")
+        finally:
+            cursor.close()
+
+    def refresh(self, posting_ids: Iterable[int]):
+        """변경된 공고만 다시 색인 (비활성/삭제 공고는 제거)"""
+        posting_ids = list(posting_ids)
+        if not posting_ids or self._loaded_at is None:
+            return
+
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            rows = []
+            for i in range(0, len(posting_ids), self.LOAD_BATCH_SIZE):
+                chunk = posting_ids[i:i + self.LOAD_BATCH_SIZE]
+                cursor.execute(f"""
+                    SELECT posting_id, title, job_description
+                    FROM job_postings
+                    WHERE posting_id IN ({','.join(['%s'] * len(chunk))})
+                    AND status = 'active'
+                """, chunk)
+                rows.extend(cursor.fetchall())
+        finally:
+            cursor.close()
+
+        with self._lock:
+            for posting_id in posting_ids:
+                self.remove(posting_id)
+            for row in rows:
+                self.add(row['posting_id'], row['title'], row['job_description'])
+
+    def add(self, posting_id: int, title: str, description: str):
+        terms = self._document_terms(title, description)
+        with self._lock:
+            self.remove(posting_id)
+            self._doc_terms[posting_id] = terms
+            for i, field_terms in enumerate(terms):
+                self._field_lengths[i] += sum(field_terms.values())
+            for token in terms[0].keys() | terms[1].keys():
+                if token not in self._postings:
+                    self._postings[token] = set()
+                    self._sorted_terms = None
+                self._postings[token].add(posting_id)
+
+    def remove(self, posting_id: int):
+        with self._lock:
+            terms = self._doc_terms.pop(posting_id, None)
+            if terms is None:
+                return
+            for i, field_terms in enumerate(terms):
+                self._field_lengths[i] -= sum(field_terms.values())
+            for token in terms[0].keys() | terms[1].keys():
+                ids = self._postings.get(token)
+                if ids is None:
+                    continue
+                ids.discard(posting_id)
+                if not ids:
+                    del self._postings[token]
+                    self._sorted_terms = None
+
+    def candidates(self, query: str) -> Optional[Set[int]]:
+        """검색어의 모든 토큰을 포함하는 posting_id 집합
+
+        색인할 토큰이 없는 검색어(기호만 있는 경우 등)는 None을 반환하며,
+        이때 호출 측은 기존 LIKE 검색으로 대체한다.
+        3음절 이상 한글 구간은 2-gram이 모두 있어도 연속하지 않을 수 있으므로 결과는 상위 집합이며,
+        호출 측이 hangul_phrases로 본문을 확인한다 (listing.build_where).
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return None
+
+        self.ensure_loaded()
+
+        with self._lock:
+            result: Optional[Set[int]] = None
+            # 작은 집합부터 교집합을 구해 중간 결과를 최소화
+            for ids in sorted((self._match_token(t) for t in query_tokens), key=len):
+                result = set(ids) if result is None else result & ids
+                if not result:
+                    return set()
+            return result
+
+    def rank(self, query: str, posting_ids: Iterable[int]) -> List[Tuple[int, float]]:
+        """후보 공고를 BM25 점수 내림차순으로 정렬한 (posting_id, 점수) 목록
+
+        동점이면 최신(큰 ID) 공고가 앞에 온다. 색인에 없는 공고는 점수 0으로 뒤에 붙는다.
+        """
+        scores = self.scores(query, posting_ids)
+        return sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+    def scores(self, query: str, posting_ids: Iterable[int]) -> Dict[int, float]:
+        """후보 공고별 BM25 점수
+
+        검색 토큰마다 후보 조회와 같은 규칙으로 일치하는 색인어의 빈도를 합산하고,
+        제목/본문 빈도를 필드 평균 길이로 정규화한 뒤 제목에 TITLE_BOOST를 곱해 더한다.
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        self.ensure_loaded()
+
+        with self._lock:
+            total = len(self._doc_terms)
+            scores = {posting_id: 0.0 for posting_id in posting_ids}
+            if not total or not query_tokens:
+                return scores
+
+            avg_lengths = [max(length / total, 1.0) for length in self._field_lengths]
+            k1, b = self.BM25_K1, self.BM25_B
+
+            # 검색 토큰별 (일치 색인어, IDF)
+            weighted_tokens = []
+            for token in query_tokens:
+                matched_terms = self._matching_terms(token)
+                if matched_terms:
+                    df = len(set().union(*(self._postings[term] for term in matched_terms)))
+                    weighted_tokens.append((matched_terms, math.log(1 + (total - df + 0.5) / (df + 0.5))))
+
+            for posting_id in scores:
+                terms = self._doc_terms.get(posting_id)
+                if terms is None:
+                    continue
+                norms = [boost / (1 - b + b * sum(field_terms.values()) / avg_length)
+                         for field_terms, avg_length, boost in zip(terms, avg_lengths, (self.TITLE_BOOST, 1.0))]
+
+                score = 0.0
+                for matched_terms, idf in weighted_tokens:
+                    weighted_tf = sum(norm * sum(field_terms.get(term, 0) for term in matched_terms)
+                                      for field_terms, norm in zip(terms, norms))
+                    if weighted_tf:
+                        score += idf * weighted_tf / (k1 + weighted_tf)
+                scores[posting_id] = score
+
+            return scores
+
+    def _matching_terms(self, token: str) -> List[str]:
+        """검색 토큰 하나에 일치하는 색인어 목록
+
+        - 영문/숫자: 접두어 일치 (java → java, javascript)
+        - 한 글자 한글: 해당 글자를 포함하는 모든 2-gram
+        - 그 외 한글 2-gram: 정확히 일치
+        """
+        if is_hangul(token):
+            if len(token) > 1:
+                return [token] if token in self._postings else []
+            return [term for term in self._postings if token in term]
+
+        terms = self._terms()
+        start = bisect.bisect_left(terms, token)
+        end = bisect.bisect_left(terms, token + '\uffff', lo=start)
+        return terms[start:end]
+
+    def _match_token(self, token: str) -> Set[int]:
+        """검색 토큰 하나에 해당하는 posting_id 집합"""
+        matched_terms = self._matching_terms(token)
+        if len(matched_terms) == 1:
+            return self._postings[matched_terms[0]]
+        return set().union(*(self._postings[term] for term in matched_terms))
+
+    def _terms(self) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(t for t in self._postings if not is_hangul(t))
+        return self._sorted_terms
+
+    @staticmethod
+    def _document_terms(title: str, description: str) -> Tuple[Counter, Counter]:
+        return Counter(tokenize(title or '')), Counter(tokenize(description or ''))
+
+    @property
+    def size(self) -> int:
+        return len(self._doc_terms)
+
+
+# 싱글톤 인스턴스 생성
+search_index = SearchIndex()
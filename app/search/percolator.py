@@ -0,0 +1,278 @@
+import json
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.database import get_db
+from .tokenizer import tokenize, is_hangul, hangul_phrases
+from .bitmap_index import as_list
+
+
+def _term_keys(term: str) -> Set[str]:
+    """색인어 하나에 일치하는 검색 토큰 전체 (SearchIndex._matching_terms의 역방향)
+
+    - 영문/숫자: 모든 접두어 (java → j, ja, jav, java)
+    - 한글: 색인어 자신과 포함된 각 글자
+    """
+    if is_hangul(term):
+        return {term, *term}
+    return {term[:i] for i in range(1, len(term) + 1)}
+
+
+class Percolator:
+    """저장된 검색(saved_searches)에 새 공고를 역으로 대조하는 색인
+
+    저장된 검색마다 조건 하나(기술스택 → 카테고리 → 검색어 토큰 → 지역 → 경력 → 고용형태 순)를
+    골라 그 값을 키로 등록해 두고, 새 공고는 자신의 값으로 만든 키에 걸린 검색만 전체 조건을
+    확인한다. 대조 비용은 새 공고 수에 비례하고 저장된 검색 수 × 공고 수와는 무관하다.
+    (연봉 조건만 있거나 조건이 없는 검색은 모든 새 공고와 대조)
+    일치 결과는 saved_search_matches에 기록한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # saved_search_id → (필터, 검색어 토큰)
+        self._searches: Dict[int, Tuple[Dict, List[str]]] = {}
+        # (조건 종류, 값) → saved_search_id 집합
+        self._index: Dict[Tuple[str, object], Set[int]] = {}
+        # 등록할 조건이 없는 검색
+        self._unanchored: Set[int] = set()
+        # 마지막으로 읽은 saved_search_id (다른 워커에서 생성된 검색은 이보다 큰 ID로 읽어 온다)
+        self._last_id = 0
+        self._loaded_at: Optional[float] = None
+
+    def ensure_loaded(self):
+        if self._loaded_at is None:
+            self.load()
+
+    def load(self):
+        """저장된 검색 전체로 색인 재구성"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            cursor.execute("SELECT saved_search_id, filters FROM saved_searches")
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        with self._lock:
+            self._searches, self._index, self._unanchored = {}, {}, set()
+            for row in rows:
+                self._add(row['saved_search_id'], json.loads(row['filters']))
+            self._last_id = max((row['saved_search_id'] for row in rows), default=0)
+            self._loaded_at = time.time()
+
+        logging.info(f"Percolator loaded: {len(rows)} saved searches")
+
+    def refresh(self, cursor):
+        """다른 워커에서 생성/삭제된 저장된 검색 반영 (대조 전에 호출)
+
+        새 검색은 마지막으로 읽은 ID 이후만 추가로 읽고, 삭제로 검색 수가 어긋나면 전체를 다시 읽는다.
+        """
+        cursor.execute("SELECT COUNT(*) AS total, MAX(saved_search_id) AS last_id FROM saved_searches")
+        stats = cursor.fetchone()
+        if (stats['last_id'] or 0) > self._last_id:
+            cursor.execute("""
+                SELECT saved_search_id, filters FROM saved_searches
+                WHERE saved_search_id > %s
+            """, (self._last_id,))
+            rows = cursor.fetchall()
+            with self._lock:
+                for row in rows:
+                    self._remove(row['saved_search_id'])
+                    self._add(row['saved_search_id'], json.loads(row['filters']))
+                    self._last_id = max(self._last_id, row['saved_search_id'])
+        if stats['total'] != len(self._searches):
+            self.load()
+
+    def add(self, saved_search_id: int, filters: Dict):
+        """저장된 검색 등록 (생성 후 호출, 다른 워커는 refresh로 반영)"""
+        if self._loaded_at is None:
+            return
+        with self._lock:
+            self._remove(saved_search_id)
+            self._add(saved_search_id, filters)
+
+    def remove(self, saved_search_id: int):
+        with self._lock:
+            self._remove(saved_search_id)
+
+    def percolate(self, posting_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """새 공고와 일치하는 저장된 검색 → 공고 ID 목록 (saved_search_matches에 기록)"""
+        posting_ids = [posting_id for posting_id in dict.fromkeys(posting_ids) if posting_id]
+        if not posting_ids:
+            return {}
+
+        self.ensure_loaded()
+
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            self.refresh(cursor)
+            postings = self._fetch_postings(cursor, posting_ids)
+
+            matches: Dict[int, List[int]] = {}
+            with self._lock:
+                for posting in postings:
+                    for saved_search_id in self._candidates(posting):
+                        filters, tokens = self._searches[saved_search_id]
+                        if self.matches(filters, tokens, posting):
+                            matches.setdefault(saved_search_id, []).append(posting['posting_id'])
+
+            rows = [(saved_search_id, posting_id)
+                    for saved_search_id, matched_ids in matches.items() for posting_id in matched_ids]
+            if rows:
+                cursor.executemany("""
+                    INSERT IGNORE INTO saved_search_matches (saved_search_id, posting_id)
+                    VALUES (%s, %s)
+                """, rows)
+                db.commit()
+                logging.info(f"Percolated {len(postings)} postings: {len(rows)} saved search matches")
+            return matches
+
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def matches(filters: Dict, tokens: List[str], posting: Dict) -> bool:
+        """공고 하나가 목록 조회(build_where)와 같은 기준으로 필터를 만족하는지"""
+        stacks, categories = posting['tech_stacks'], posting['categories']
+
+        required_stacks = set(as_list(filters.get('tech_stacks')))
+        if required_stacks:
+            if filters.get('tech_stacks_mode') == 'all':
+                if not required_stacks <= stacks:
+                    return False
+            elif not required_stacks & stacks:
+                return False
+        required_categories = set(as_list(filters.get('categories')))
+        if required_categories and not required_categories & categories:
+            return False
+        if set(as_list(filters.get('exclude_tech_stacks'))) & stacks:
+            return False
+        if set(as_list(filters.get('exclude_categories'))) & categories:
+            return False
+
+        if filters.get('location_id') and posting['location_id'] != filters['location_id']:
+            return False
+        if filters.get('location_ids') is not None and posting['location_id'] not in filters['location_ids']:
+            return False
+        for field in ('experience_level', 'employment_type'):
+            if filters.get(field) and posting[field] != filters[field]:
+                return False
+
+        # 연봉 범위를 알 수 없는 공고는 SQL 비교(NULL)와 같이 제외
+        if filters.get('salary_min') and (posting['salary_min'] is None
+                                          or posting['salary_min'] < filters['salary_min']):
+            return False
+        if filters.get('salary_max') and (posting['salary_max'] is None
+                                          or posting['salary_max'] > filters['salary_max']):
+            return False
+
+        if filters.get('search'):
+            if tokens:
+                # 3음절 이상 한글 구간은 목록 조회와 같이 본문에 그대로 있어야 한다
+                return (all(token in posting['keys'] for token in tokens)
+                        and all(any(phrase in text for text in posting['texts'])
+                                for phrase in hangul_phrases(filters['search'])))
+            # 색인할 토큰이 없는 검색어는 LIKE 검색과 같이 부분 문자열 비교
+            search = filters['search'].lower()
+            return any(search in text for text in posting['texts'])
+        return True
+
+    def _candidates(self, posting: Dict) -> Set[int]:
+        """공고 값으로 만든 키에 등록된 검색 + 조건 없는 검색"""
+        keys = [('tech_stacks', value) for value in posting['tech_stacks']]
+        keys.extend(('categories', value) for value in posting['categories'])
+        keys.extend(('search', key) for key in posting['keys'])
+        keys.extend((field, posting[field]) for field in ('location_id', 'experience_level', 'employment_type'))
+
+        candidates = set(self._unanchored)
+        for key in keys:
+            candidates.update(self._index.get(key, ()))
+        return candidates
+
+    @staticmethod
+    def _anchor_keys(filters: Dict, tokens: List[str]) -> List[Tuple[str, object]]:
+        """검색을 등록할 키 - 일치하는 공고가 반드시 가진 값 중 하나의 조건"""
+        stacks = as_list(filters.get('tech_stacks'))
+        if stacks:
+            # all: 아무 기술스택 하나만 있어도 필요조건 / any: 기술스택 중 하나
+            if filters.get('tech_stacks_mode') == 'all':
+                return [('tech_stacks', stacks[0])]
+            return [('tech_stacks', value) for value in stacks]
+        if as_list(filters.get('categories')):
+            return [('categories', value) for value in as_list(filters['categories'])]
+        if tokens:
+            # 가장 긴 토큰이 일치하는 공고가 가장 적다
+            return [('search', max(tokens, key=len))]
+        if filters.get('location_id'):
+            return [('location_id', filters['location_id'])]
+        if filters.get('location_ids') is not None:
+            return [('location_id', value) for value in filters['location_ids']]
+        for field in ('experience_level', 'employment_type'):
+            if filters.get(field):
+                return [(field, filters[field])]
+        return []
+
+    def _add(self, saved_search_id: int, filters: Dict):
+        tokens = list(dict.fromkeys(tokenize(filters.get('search') or '')))
+        self._searches[saved_search_id] = (filters, tokens)
+        keys = self._anchor_keys(filters, tokens)
+        if not keys and filters.get('location_ids') != []:
+            # (일치하는 지역이 없는 region 조건은 어떤 공고와도 일치하지 않으므로 제외)
+            self._unanchored.add(saved_search_id)
+        for key in keys:
+            self._index.setdefault(key, set()).add(saved_search_id)
+
+    def _remove(self, saved_search_id: int):
+        entry = self._searches.pop(saved_search_id, None)
+        self._unanchored.discard(saved_search_id)
+        if entry is None:
+            return
+        for key in self._anchor_keys(*entry):
+            ids = self._index.get(key)
+            if ids is not None:
+                ids.discard(saved_search_id)
+                if not ids:
+                    del self._index[key]
+
+    @staticmethod
+    def _fetch_postings(cursor, posting_ids: List[int]) -> List[Dict]:
+        """대조에 필요한 활성 공고 값 (job_search의 기술스택/카테고리 ID 사용)"""
+        cursor.execute(f"""
+            SELECT p.posting_id, p.title, p.job_description, p.location_id,
+                   p.experience_level, p.employment_type, p.salary_min, p.salary_max,
+                   s.tech_stack_ids, s.category_ids
+            FROM job_postings p
+            LEFT JOIN job_search s ON p.posting_id = s.posting_id
+            WHERE p.posting_id IN ({','.join(['%s'] * len(posting_ids))})
+            AND p.status = 'active'
+        """, posting_ids)
+
+        postings = []
+        for row in cursor.fetchall():
+            terms = set(tokenize(row['title'] or '')) | set(tokenize(row['job_description'] or ''))
+            postings.append({
+                'posting_id': row['posting_id'],
+                'tech_stacks': {int(x) for x in row['tech_stack_ids'].split(',')} if row['tech_stack_ids'] else set(),
+                'categories': {int(x) for x in row['category_ids'].split(',')} if row['category_ids'] else set(),
+                'location_id': row['location_id'],
+                'experience_level': row['experience_level'],
+                'employment_type': row['employment_type'],
+                'salary_min': row['salary_min'],
+                'salary_max': row['salary_max'],
+                'keys': set().union(*(_term_keys(term) for term in terms)),
+                'texts': ((row['title'] or '').lower(), (row['job_description'] or '').lower())
+            })
+        return postings
+
+
+# 싱글톤 인스턴스 생성
+percolator = Percolator()
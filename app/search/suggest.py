@@ -0,0 +1,244 @@
+import bisect
+import heapq
+import logging
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.database import get_db
+from .tokenizer import to_jamo
+from .inverted_index import search_index
+
+# 단어 구분 기호 (C++, C#, Node.js 등 기술스택 이름의 기호는 유지)
+_SEPARATOR_PATTERN = re.compile(r'[\s\[\]()<>{}/,|·~_-]+')
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in _SEPARATOR_PATTERN.split((text or '').lower()) if word]
+
+
+class _PrefixTable:
+    """한 종류(제목/회사/기술스택)의 자동완성 항목
+
+    라벨의 각 단어 시작 위치부터 자모로 분해한 문자열을 키로 정렬 배열에 보관하고
+    (중간 단어로도 검색되도록) 접두어 범위는 이진 탐색으로 찾는다.
+    """
+
+    # 키 최대 길이 (자모 수) - 긴 제목의 메모리 사용량 제한
+    MAX_KEY_LENGTH = 40
+
+    def __init__(self):
+        self.keys: List[Tuple[str, object]] = []
+        self.labels: Dict[object, str] = {}
+        self.counts: Dict[object, int] = {}
+        self.weights: Dict[object, int] = {}
+
+    @classmethod
+    def key_of(cls, text: str) -> str:
+        return to_jamo(' '.join(_words(text)))[:cls.MAX_KEY_LENGTH]
+
+    @classmethod
+    def entry_keys(cls, label: str) -> List[str]:
+        words = _words(label)
+        return list(dict.fromkeys(cls.key_of(' '.join(words[i:])) for i in range(len(words))))
+
+    def add(self, entry, label: str, weight: int, build: bool = False):
+        """공고 하나의 기여분 추가
+
+        build=True면 정렬을 미루고 키를 뒤에 붙인다 (전체 적재 후 sort_keys() 호출).
+        """
+        self.counts[entry] = self.counts.get(entry, 0) + 1
+        self.weights[entry] = self.weights.get(entry, 0) + weight
+        if entry in self.labels:
+            return
+
+        self.labels[entry] = label
+        for key in self.entry_keys(label):
+            if build:
+                self.keys.append((key, entry))
+            else:
+                bisect.insort(self.keys, (key, entry))
+
+    def remove(self, entry, weight: int):
+        """공고 하나의 기여분 제거 (마지막 공고가 빠지면 항목 삭제)"""
+        if entry not in self.counts:
+            return
+        self.counts[entry] -= 1
+        self.weights[entry] -= weight
+        if self.counts[entry] > 0:
+            return
+
+        label = self.labels.pop(entry)
+        del self.counts[entry], self.weights[entry]
+        for key in self.entry_keys(label):
+            i = bisect.bisect_left(self.keys, (key, entry))
+            if i < len(self.keys) and self.keys[i] == (key, entry):
+                del self.keys[i]
+
+    def sort_keys(self):
+        self.keys.sort()
+
+    def top(self, prefix: str, limit: int) -> List[object]:
+        """접두어로 시작하는 항목 중 인기순(가중치, 공고 수) 상위 limit개"""
+        start = bisect.bisect_left(self.keys, (prefix,))
+        end = bisect.bisect_left(self.keys, (prefix + '\uffff',), lo=start)
+        entries = {entry for _, entry in self.keys[start:end]}
+        return heapq.nsmallest(limit, entries,
+                               key=lambda e: (-self.weights[e], -self.counts[e], self.labels[e]))
+
+
+class SuggestIndex:
+    """검색어 자동완성 (공고 제목 / 회사명 / 기술스택명)
+
+    활성 공고로 종류별 정렬 배열을 만들어 두고 입력마다 이진 탐색만 하므로
+    MySQL을 조회하지 않는다. 한글은 자모 단위로 비교해 입력 중인 글자도 일치한다.
+    제목은 조회수 합, 회사/기술스택은 활성 공고 수 순으로 정렬하며
+    접두어별 상위 결과는 항목이 바뀔 때까지 캐시한다.
+    """
+
+    KINDS = ('titles', 'companies', 'tech_stacks')
+    # 응답 항목의 ID 필드 (제목은 ID 없음)
+    ID_FIELDS = {'companies': 'company_id', 'tech_stacks': 'stack_id'}
+    MAX_LIMIT = 20
+    CACHE_SIZE = 4096
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tables: Dict[str, _PrefixTable] = {kind: _PrefixTable() for kind in self.KINDS}
+        # posting_id → [(종류, 항목, 라벨, 가중치)] - 공고 변경 시 기존 기여분 제거용
+        self._contributions: Dict[int, List[Tuple[str, object, str, int]]] = {}
+        self._cache: Dict[Tuple[str, str], List[object]] = {}
+        self._loaded_at: Optional[float] = None
+
+    def ensure_loaded(self):
+        if self._loaded_at is None or time.time() - self._loaded_at > search_index.max_age:
+            self.load()
+
+    def load(self):
+        """활성 공고 전체로 자동완성 항목 재구성 (크롤링 후/주기적으로 호출)"""
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            rows = self._fetch_rows(cursor)
+        finally:
+            cursor.close()
+
+        tables = {kind: _PrefixTable() for kind in self.KINDS}
+        contributions = {}
+        for row in rows:
+            contributions[row['posting_id']] = self._row_contributions(row)
+            for kind, entry, label, weight in contributions[row['posting_id']]:
+                tables[kind].add(entry, label, weight, build=True)
+        for table in tables.values():
+            table.sort_keys()
+
+        with self._lock:
+            self._tables = tables
+            self._contributions = contributions
+            self._cache = {}
+            self._loaded_at = time.time()
+
+        counts = ', '.join(f"{len(tables[kind].labels)} {kind}" for kind in self.KINDS)
+        logging.info(f"Suggest index loaded: {counts}")
+
+    def refresh(self, posting_ids: Iterable[int]):
+        """변경된 공고의 기여분만 다시 반영"""
+        posting_ids = list(posting_ids)
+        if not posting_ids or self._loaded_at is None:
+            return
+
+        db = get_db()
+        cursor = db.cursor(dictionary=True)
+
+        try:
+            rows = self._fetch_rows(cursor, posting_ids)
+        finally:
+            cursor.close()
+
+        with self._lock:
+            for posting_id in posting_ids:
+                for kind, entry, label, weight in self._contributions.pop(posting_id, ()):
+                    self._tables[kind].remove(entry, weight)
+                    self._invalidate(kind, label)
+            for row in rows:
+                self._contributions[row['posting_id']] = self._row_contributions(row)
+                for kind, entry, label, weight in self._contributions[row['posting_id']]:
+                    self._tables[kind].add(entry, label, weight)
+                    self._invalidate(kind, label)
+
+    def suggest(self, query: str, limit: int = 5) -> Dict[str, List[Dict]]:
+        """입력 접두어의 종류별 자동완성 후보"""
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        prefix = _PrefixTable.key_of(query)
+        if not prefix:
+            return {kind: [] for kind in self.KINDS}
+
+        self.ensure_loaded()
+
+        with self._lock:
+            result = {}
+            for kind in self.KINDS:
+                table = self._tables[kind]
+                entries = self._cache.get((kind, prefix))
+                if entries is None:
+                    entries = table.top(prefix, self.MAX_LIMIT)
+                    if len(self._cache) >= self.CACHE_SIZE:
+                        self._cache.clear()
+                    self._cache[(kind, prefix)] = entries
+
+                items = []
+                for entry in entries[:limit]:
+                    item = {'text': table.labels[entry], 'count': table.counts[entry]}
+                    if kind in self.ID_FIELDS:
+                        item[self.ID_FIELDS[kind]] = entry
+                    items.append(item)
+                result[kind] = items
+            return result
+
+    def _invalidate(self, kind: str, label: str):
+        """바뀐 항목의 키가 일치하는 접두어 캐시 삭제 (순위/공고 수가 달라짐)"""
+        if not self._cache:
+            return
+        keys = _PrefixTable.entry_keys(label)
+        stale = [cache_key for cache_key in self._cache
+                 if cache_key[0] == kind and any(key.startswith(cache_key[1]) for key in keys)]
+        for cache_key in stale:
+            del self._cache[cache_key]
+
+    @staticmethod
+    def _row_contributions(row: Dict) -> List[Tuple[str, object, str, int]]:
+        """공고 한 건이 각 항목에 더하는 값 - 제목은 조회수, 회사/기술스택은 공고 1건"""
+        contributions = []
+        if row['title']:
+            contributions.append(('titles', ' '.join(_words(row['title'])), row['title'],
+                                  row['view_count'] or 0))
+        if row['company_id'] and row['company_name']:
+            contributions.append(('companies', row['company_id'], row['company_name'], 1))
+
+        # job_search의 GROUP_CONCAT 컬럼 (ID와 이름이 stack_id 순으로 정렬되어 있음)
+        stack_ids = [int(x) for x in row['tech_stack_ids'].split(',')] if row['tech_stack_ids'] else []
+        stack_names = row['tech_stack_names'].split('|') if row['tech_stack_names'] else []
+        for stack_id, name in zip(stack_ids, stack_names):
+            contributions.append(('tech_stacks', stack_id, name, 1))
+        return contributions
+
+    @staticmethod
+    def _fetch_rows(cursor, posting_ids: Optional[List[int]] = None) -> List[Dict]:
+        id_filter, params = "", []
+        if posting_ids:
+            id_filter = f" AND posting_id IN ({','.join(['%s'] * len(posting_ids))})"
+            params = posting_ids
+
+        cursor.execute(f"""
+            SELECT posting_id, title, company_id, company_name, view_count,
+                   tech_stack_ids, tech_stack_names
+            FROM job_search
+            WHERE status = 'active'{id_filter}
+        """, params)
+        return cursor.fetchall()
+
+
+# 싱글톤 인스턴스 생성
+suggest_index = SuggestIndex()
@@ -0,0 +1,67 @@
+import re
+from typing import List
+
+# 한글 음절 구간과 영문/숫자 구간을 분리
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+
+def is_hangul(token: str) -> bool:
+    return '가' <= token[0] <= '힣'
+
+
+def tokenize(text: str) -> List[str]:
+    """검색용 토큰 추출
+
+    - 영문/숫자: 공백·기호 기준 단어 단위 (소문자)
+    - 한글: 형태소 분석 없이 음절 2-gram (한 글자 구간은 그대로)
+    """
+    if not text:
+        return []
+
+    tokens = []
+    for run in _TOKEN_PATTERN.findall(text.lower()):
+        if not is_hangul(run) or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def hangul_phrases(text: str) -> List[str]:
+    """2-gram 색인만으로는 일치를 확인할 수 없는 3음절 이상 한글 구간
+
+    '개발자'의 2-gram(개발, 발자)은 '개발 ... 발자국'에도 모두 있으므로,
+    역색인 후보는 본문에 이 구간이 그대로 있는지 따로 확인해야 한다.
+    """
+    if not text:
+        return []
+    return [run for run in _TOKEN_PATTERN.findall(text.lower()) if is_hangul(run) and len(run) > 2]
+
+
+# 한글 음절 → 호환 자모 분해 (초성 19, 중성 21, 종성 28)
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+              'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+# 겹모음/겹받침은 입력 순서대로 낱자로 분해 (ㅘ → ㅗㅏ, ㄳ → ㄱㅅ)
+_COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ'
+}
+
+
+def to_jamo(text: str) -> str:
+    """한글을 자판 입력 순서의 자모열로 분해 (그 외 문자는 그대로)
+
+    입력 중인 글자도 접두어로 일치하도록 한다 (예: '갭' → 'ㄱㅐㅂ'은 '개발' → 'ㄱㅐㅂㅏㄹ'의 접두어).
+    """
+    result = []
+    for char in text:
+        if '가' <= char <= '힣':
+            code = ord(char) - ord('가')
+            jamo = _CHOSEONG[code // 588] + _JUNGSEONG[(code % 588) // 28] + _JONGSEONG[code % 28]
+            result.extend(_COMPOUND_JAMO.get(j, j) for j in jamo)
+        else:
+            result.append(_COMPOUND_JAMO.get(char, char))
+    return ''.join(result)
@@ -0,0 +1,54 @@
+-- 채용공고 읽기 모델 (공고당 한 행, 회사/지역/기술스택/카테고리 비정규화)
+-- 쓰기 경로에서 app.jobs.read_model.sync_job_search()로 갱신
+CREATE TABLE IF NOT EXISTS job_search (
+    posting_id INT PRIMARY KEY,
+    company_id INT,
+    company_name VARCHAR(255),
+    title VARCHAR(255) NOT NULL,
+    experience_level VARCHAR(50),
+    education_level VARCHAR(50),
+    employment_type VARCHAR(50),
+    salary_info VARCHAR(100),
+    location_id INT,
+    city VARCHAR(100),
+    district VARCHAR(100),
+    deadline_date DATE,
+    view_count INT DEFAULT 0,
+    status VARCHAR(20),
+    created_at TIMESTAMP NULL,
+    deleted_at TIMESTAMP NULL,
+    tech_stack_ids VARCHAR(1000),
+    tech_stack_names TEXT,
+    category_ids VARCHAR(1000),
+    category_names TEXT,
+    -- 내보내기(app.jobs.export)의 created_at, posting_id 순 조회용
+    -- (목록 정렬/페이지는 job_postings 인덱스를 사용하고 job_search는 기본 키로만 읽음)
+    INDEX idx_job_search_latest (status, created_at, posting_id)
+);
+
+-- 초기 적재 (이후 전체 재구성: python -m app.jobs.read_model)
+INSERT IGNORE INTO job_search (
+    posting_id, company_id, company_name, title,
+    experience_level, education_level, employment_type, salary_info,
+    location_id, city, district, deadline_date,
+    view_count, status, created_at, deleted_at,
+    tech_stack_ids, tech_stack_names, category_ids, category_names
+)
+SELECT
+    p.posting_id, p.company_id, c.name, p.title,
+    p.experience_level, p.education_level, p.employment_type, p.salary_info,
+    p.location_id, l.city, l.district, p.deadline_date,
+    p.view_count, p.status, p.created_at, p.deleted_at,
+    (SELECT GROUP_CONCAT(pts.stack_id ORDER BY pts.stack_id)
+     FROM posting_tech_stacks pts WHERE pts.posting_id = p.posting_id),
+    (SELECT GROUP_CONCAT(ts.name ORDER BY ts.stack_id SEPARATOR '|')
+     FROM posting_tech_stacks pts JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
+     WHERE pts.posting_id = p.posting_id),
+    (SELECT GROUP_CONCAT(pc.category_id ORDER BY pc.category_id)
+     FROM posting_categories pc WHERE pc.posting_id = p.posting_id),
+    (SELECT GROUP_CONCAT(jc.name ORDER BY jc.category_id SEPARATOR '|')
+     FROM posting_categories pc JOIN job_categories jc ON pc.category_id = jc.category_id
+     WHERE pc.posting_id = p.posting_id)
+FROM job_postings p
+LEFT JOIN companies c ON p.company_id = c.company_id
+LEFT JOIN locations l ON p.location_id = l.location_id;
@@ -0,0 +1,10 @@
+-- 키셋(커서) 페이지네이션용 정렬 인덱스
+-- (status, 정렬 키, posting_id) 순서로 정렬과 커서 조건을 모두 인덱스로 처리
+CREATE INDEX idx_job_postings_latest
+ON job_postings(status, created_at, posting_id);
+
+CREATE INDEX idx_job_postings_views
+ON job_postings(status, view_count, posting_id);
+
+CREATE INDEX idx_job_postings_deadline
+ON job_postings(status, deadline_date, posting_id);
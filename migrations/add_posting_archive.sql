@@ -0,0 +1,31 @@
+-- 마감 후 오래 지난 공고 / 삭제된 공고 보관 테이블 (job_postings를 활성 데이터 위주로 작게 유지)
+-- app.jobs.sweeper가 주기적으로 옮긴다 (지원/북마크 이력이 있는 공고는 옮기지 않음)
+CREATE TABLE IF NOT EXISTS job_postings_archive (
+    posting_id INT PRIMARY KEY,
+    company_id INT,
+    title VARCHAR(255) NOT NULL,
+    job_description TEXT NOT NULL,
+    experience_level VARCHAR(50),
+    education_level VARCHAR(50),
+    employment_type VARCHAR(50),
+    salary_info VARCHAR(100),
+    salary_min INT NULL,
+    salary_max INT NULL,
+    location_id INT,
+    deadline_date DATE,
+    view_count INT DEFAULT 0,
+    unique_view_count INT DEFAULT 0,
+    status VARCHAR(20),
+    created_at TIMESTAMP NULL,
+    deleted_at TIMESTAMP NULL,
+    -- 보관 시점의 기술스택/카테고리 ID (쉼표 구분)
+    tech_stack_ids VARCHAR(1000),
+    category_ids VARCHAR(1000),
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_job_postings_archive_company (company_id),
+    INDEX idx_job_postings_archive_archived (archived_at)
+);
+
+-- 마감/비활성 공고 보관 대상 조회용
+CREATE INDEX idx_job_postings_status_deleted
+ON job_postings(status, deleted_at, posting_id);
@@ -0,0 +1,11 @@
+-- 관련 채용공고 사전 계산 결과 (공고별 상위 K개, rank_no 순)
+-- 전체 재계산: python -m app.jobs.related
+CREATE TABLE IF NOT EXISTS related_postings (
+    posting_id INT NOT NULL,
+    related_id INT NOT NULL,
+    score FLOAT NOT NULL,
+    rank_no TINYINT NOT NULL,
+    PRIMARY KEY (posting_id, related_id),
+    INDEX idx_related_postings_rank (posting_id, rank_no),
+    INDEX idx_related_postings_related (related_id)
+);
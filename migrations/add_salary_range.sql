@@ -0,0 +1,17 @@
+-- 급여 문자열(salary_info)을 정규화한 연봉 범위 (원/년, 금액이 없으면 NULL)
+-- 쓰기 경로에서 app.jobs.read_model.sync_job_search()가 함께 갱신
+-- 기존 공고 변환: python -m app.jobs.salary
+ALTER TABLE job_postings
+ADD COLUMN salary_min INT NULL,
+ADD COLUMN salary_max INT NULL;
+
+ALTER TABLE job_search
+ADD COLUMN salary_min INT NULL,
+ADD COLUMN salary_max INT NULL;
+
+-- 연봉 필터(범위 조건)와 'salary' 정렬용
+CREATE INDEX idx_job_postings_salary_min
+ON job_postings(status, salary_min, posting_id);
+
+CREATE INDEX idx_job_postings_salary_max
+ON job_postings(status, salary_max, posting_id);
@@ -0,0 +1,20 @@
+-- 사용자별 저장된 검색 (filters: GET /jobs 목록 필터를 파싱한 JSON, region은 location_ids로 풀어 저장)
+CREATE TABLE IF NOT EXISTS saved_searches (
+    saved_search_id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    filters JSON NOT NULL,
+    last_checked_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_saved_searches_user (user_id)
+);
+
+-- 새 공고 중 저장된 검색과 일치한 공고 (app.search.percolator가 기록)
+CREATE TABLE IF NOT EXISTS saved_search_matches (
+    saved_search_id INT NOT NULL,
+    posting_id INT NOT NULL,
+    matched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (saved_search_id, posting_id),
+    INDEX idx_saved_search_matches_recent (saved_search_id, matched_at),
+    INDEX idx_saved_search_matches_posting (posting_id)
+);
@@ -0,0 +1,9 @@
+-- 고유 방문자 수 (HyperLogLog 추정값을 주기적으로 반영, 'views' 정렬에 사용)
+ALTER TABLE job_postings
+ADD COLUMN unique_view_count INT NOT NULL DEFAULT 0;
+
+ALTER TABLE job_search
+ADD COLUMN unique_view_count INT NOT NULL DEFAULT 0;
+
+CREATE INDEX idx_job_postings_unique_views
+ON job_postings(status, unique_view_count, posting_id);
@@ -0,0 +1,3 @@
+-- 'views' 정렬은 unique_view_count(idx_job_postings_unique_views)를 사용하므로
+-- view_count 정렬 인덱스는 조회수 반영(UPDATE)마다 갱신 비용만 발생
+ALTER TABLE job_postings DROP INDEX idx_job_postings_views;
@@ -0,0 +1,7 @@
+-- job_search에서 사용하지 않는 인덱스 삭제 (쓰기마다 갱신 비용만 발생)
+-- 목록 정렬/페이지는 job_postings 인덱스를 사용하고, 'views' 정렬 컬럼은 unique_view_count
+ALTER TABLE job_search DROP INDEX idx_job_search_views;
+
+ALTER TABLE job_search DROP INDEX idx_job_search_deadline;
+
+ALTER TABLE job_search DROP INDEX idx_job_search_company;
@@ -1,5 +1,20 @@
 import mysql.connector
 import os
+import sys
+
+# 실행 순서대로 나열
+MIGRATION_FILES = [
+    'migrations/add_indexes.sql',
+    'migrations/add_keyset_indexes.sql',
+    'migrations/add_job_search.sql',
+    'migrations/add_unique_view_count.sql',
+    'migrations/add_related_postings.sql',
+    'migrations/add_salary_range.sql',
+    'migrations/add_posting_archive.sql',
+    'migrations/add_saved_searches.sql',
+    'migrations/drop_unused_job_search_indexes.sql',
+    'migrations/drop_unused_job_postings_views_index.sql',
+]
 
 def get_db_connection():
     return mysql.connector.connect(
@@ -10,31 +25,68 @@ def get_db_connection():
         port=int(os.getenv('DB_PORT', '13102'))
     )
 
-def run_migration():
+# 적용한 마이그레이션 기록 (파일 경로당 한 행)
+HISTORY_TABLE = 'schema_migrations'
+
+# 이미 적용된 변경으로 보고 넘어가는 에러 (1060: 중복 컬럼, 1061: 중복 인덱스 이름, 1091: 없는 인덱스 삭제)
+# - 기록 테이블이 생기기 전에 마이그레이션을 실행한 DB나, 처음부터 해당 인덱스가 없는 DB에서 실행할 때
+ALREADY_APPLIED_ERRORS = (1060, 1061, 1091)
+
+def applied_migrations(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {HISTORY_TABLE} (
+            filename VARCHAR(255) PRIMARY KEY,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute(f"SELECT filename FROM {HISTORY_TABLE}")
+    return {row[0] for row in cursor.fetchall()}
+
+def run_migration(files=None):
+    """아직 적용하지 않은 파일만 순서대로 실행 - 실패하면 그 파일에서 멈춤"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
     try:
-        # 인덱스 SQL 파일 읽기
-        with open('migrations/add_indexes.sql', 'r') as file:
-            sql_commands = file.read().split(';')
-            
-        # 각 명령어 실행
-        for command in sql_commands:
-            if command.strip():
-                cursor.execute(command)
-                print(f"Executed: {command[:50]}...")
+        applied = applied_migrations(cursor)
+        pending = [path for path in files or MIGRATION_FILES if path not in applied]
+        if not pending:
+            print("No pending migrations")
+            return True
+
+        for path in pending:
+            # SQL 파일 읽기
+            with open(path, 'r', encoding='utf-8') as file:
+                sql_commands = file.read().split(';')
+                
+            # 각 명령어 실행
+            for command in sql_commands:
+                if not command.strip():
+                    continue
+                try:
+                    cursor.execute(command)
+                    print(f"Executed: {command[:50]}...")
+                except mysql.connector.Error as e:
+                    if e.errno not in ALREADY_APPLIED_ERRORS:
+                        raise
+                    print(f"Skipped (already applied): {command[:50]}...")
+
+            cursor.execute(f"INSERT INTO {HISTORY_TABLE} (filename) VALUES (%s)", (path,))
+            conn.commit()
+            print(f"Applied: {path}")
         
-        conn.commit()
         print("Migration completed successfully")
+        return True
         
     except Exception as e:
         conn.rollback()
         print(f"Migration failed: {str(e)}")
+        return False
         
     finally:
         cursor.close()
         conn.close()
 
 if __name__ == "__main__":
-    run_migration() 
\ No newline at end of file
+    # 특정 파일만 실행: python migrations/migrate.py migrations/xxx.sql (적용 기록이 없는 경우만)
+    sys.exit(0 if run_migration(sys.argv[1:] or None) else 1) 
\ No newline at end of file
@@ -0,0 +1,97 @@
+import random
+from app.search.bitmap import Bitmap, ARRAY_MAX
+
+def test_bitmap_basic():
+    """압축 비트맵 추가/삭제/포함 테스트"""
+    bitmap = Bitmap([5, 1, 70000, 5])
+    assert list(bitmap) == [1, 5, 70000]
+    assert len(bitmap) == 3
+    assert 70000 in bitmap and 2 not in bitmap
+
+    bitmap.add(2)
+    bitmap.discard(70000)
+    assert list(bitmap) == [1, 2, 5]
+
+    bitmap.discard(1)
+    bitmap.discard(2)
+    bitmap.discard(5)
+    assert not bitmap
+
+def test_bitmap_operations():
+    """AND / OR / NOT(차집합) 연산 테스트 - 희소/밀집 컨테이너 혼합"""
+    rng = random.Random(42)
+    dense = set(rng.sample(range(0, 65536), ARRAY_MAX * 2))
+    sparse = set(rng.sample(range(0, 200000), 3000))
+
+    a, b = Bitmap(dense), Bitmap(sparse)
+    assert set(a & b) == dense & sparse
+    assert set(a | b) == dense | sparse
+    assert set(a - b) == dense - sparse
+    assert set(b - a) == sparse - dense
+    assert len(a | b) == len(dense | sparse)
+
+def test_bitmap_container_conversion():
+    """밀집 컨테이너가 원소 삭제 후 다시 배열로 전환되는지 테스트"""
+    values = list(range(ARRAY_MAX + 10))
+    bitmap = Bitmap(values)
+    for value in values[:20]:
+        bitmap.discard(value)
+    assert list(bitmap) == values[20:]
+
+def test_bitmap_results_are_independent():
+    """연산 결과가 원본 비트맵 변경의 영향을 받지 않는지 테스트"""
+    a = Bitmap([1, 2, 3])
+    union = a | Bitmap([10])
+    a.add(4)
+    a.discard(1)
+    assert list(union) == [1, 2, 3, 10]
+
+def test_bitmap_index_filters():
+    """기술스택 AND/OR/NOT 및 필드 조건 조합 테스트"""
+    from app.search.bitmap_index import BitmapIndex
+
+    index = BitmapIndex()
+    index._loaded_at = float('inf')
+    postings = {
+        1: {'tech_stacks': (1, 2), 'categories': (10,), 'status': ('active',), 'location_id': (100,)},
+        2: {'tech_stacks': (1,), 'categories': (11,), 'status': ('active',), 'location_id': (200,)},
+        3: {'tech_stacks': (1, 2, 3), 'categories': (10,), 'status': ('active',), 'location_id': (100,)},
+        4: {'tech_stacks': (1, 2), 'categories': (10,), 'status': ('closed',), 'location_id': (100,)},
+    }
+    for posting_id, values in postings.items():
+        index._add(posting_id, values)
+
+    assert list(index.match({'tech_stacks': [2, 3]})) == [1, 3]
+    assert list(index.match({'tech_stacks': [2, 3], 'tech_stacks_mode': 'all'})) == [3]
+    assert list(index.match({'exclude_tech_stacks': [3]})) == [1, 2]
+    assert list(index.match({'tech_stacks': [1], 'categories': [10], 'location_id': 100})) == [1, 3]
+
+    index._remove(3)
+    assert list(index.match({'tech_stacks': [2]})) == [1]
+
+def test_bitmap_index_version(monkeypatch):
+    """다른 워커가 공고 버전을 올리면 최신이 아닌 것으로 보고, 자신이 올린 버전만 따라가는지 테스트"""
+    import importlib
+    # app.search의 bitmap_index(싱글톤)와 이름이 겹치므로 모듈은 import_module로 가져온다
+    bitmap_index_module = importlib.import_module('app.search.bitmap_index')
+    from app.search.bitmap_index import BitmapIndex
+
+    versions = {'current': '5'}
+    monkeypatch.setattr(bitmap_index_module.posting_versions, 'current', lambda: versions['current'])
+    index = BitmapIndex()
+    assert not index.is_current()
+
+    index._version = '5'
+    assert index.is_current()
+
+    # 이 프로세스가 변경을 반영하고 올린 버전
+    versions['current'] = '6'
+    index.advance('6')
+    assert index.is_current()
+
+    # 그 사이 다른 워커가 올린 버전이 있으면 따라가지 않는다
+    versions['current'] = '8'
+    index.advance('8')
+    assert not index.is_current()
+    index.advance(None)
+    assert index._version == '6'
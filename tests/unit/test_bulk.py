@@ -0,0 +1,73 @@
+from datetime import date
+
+from app.jobs.bulk import validate_item, validate_items, referenced_ids, insert_postings
+
+KNOWN = {'locations': {1}, 'categories': {10, 11}, 'tech_stacks': {100}}
+
+
+def test_validate_item():
+    """공고 항목 형식 검증 테스트"""
+    posting, error = validate_item({'title': ' 백엔드 ', 'job_description': '설명',
+                                    'deadline_date': '2025-01-31', 'tech_stacks': [100, 100]})
+    assert error is None
+    assert posting['title'] == '백엔드'
+    assert posting['deadline_date'] == date(2025, 1, 31)
+    assert posting['tech_stacks'] == [100]
+    assert posting['categories'] == [] and posting['location_id'] is None
+
+    assert validate_item({'job_description': '설명'})[1] == "Missing required field: title"
+    assert validate_item({'title': 'a', 'job_description': 'b', 'deadline_date': '01/31'})[1] == \
+        "deadline_date must be YYYY-MM-DD"
+    assert validate_item({'title': 'a', 'job_description': 'b', 'categories': ['x']})[1] == \
+        "categories must be a list of integers"
+    assert validate_item({'title': 'a' * 256, 'job_description': 'b'})[1] == "title is too long (max 255)"
+    assert validate_item('posting')[1] == "Item must be an object"
+
+
+def test_validate_items_checks_references():
+    """존재하지 않는 지역/카테고리/기술스택을 참조한 항목만 에러로 분류되는지 테스트"""
+    items = [
+        {'title': 'a', 'job_description': 'b', 'location_id': 1, 'categories': [10]},
+        {'title': 'a', 'job_description': 'b', 'location_id': 2},
+        {'title': 'a', 'job_description': 'b', 'tech_stacks': [100, 101]},
+        {'title': 'a'}
+    ]
+    assert referenced_ids(items) == {'locations': {1, 2}, 'categories': {10}, 'tech_stacks': {100, 101}}
+
+    valid, errors = validate_items(items, KNOWN)
+    assert [index for index, _ in valid] == [0]
+    assert errors == {
+        1: "Unknown location_id: 2",
+        2: "Unknown tech_stacks: 101",
+        3: "Missing required field: job_description"
+    }
+
+
+class FakeCursor:
+    def __init__(self, first_id):
+        self.first_id = first_id
+        self.executed = []
+        self.many = []
+
+    def execute(self, query, params=()):
+        self.executed.append(query)
+
+    def executemany(self, query, rows):
+        self.many.append((' '.join(query.split()), rows))
+        self.lastrowid = self.first_id
+
+
+def test_insert_postings_links_consecutive_ids():
+    """공고 N개를 INSERT 한 번으로 저장하고 연속 ID로 기술스택/카테고리 연결을 일괄 저장하는지 테스트"""
+    postings = [validate_item({'title': 'a', 'job_description': 'b', 'categories': [10, 11]})[0],
+                validate_item({'title': 'c', 'job_description': 'd', 'tech_stacks': [100]})[0],
+                validate_item({'title': 'e', 'job_description': 'f'})[0]]
+    cursor = FakeCursor(first_id=50)
+
+    assert insert_postings(cursor, 7, postings) == [50, 51, 52]
+    assert cursor.executed == []
+    assert len(cursor.many) == 3
+    assert cursor.many[0][0].startswith('INSERT INTO job_postings')
+    assert [row[:3] for row in cursor.many[0][1]] == [(7, 'a', 'b'), (7, 'c', 'd'), (7, 'e', 'f')]
+    assert cursor.many[1][1] == [(50, 10), (50, 11)]
+    assert cursor.many[2][1] == [(51, 100)]
@@ -0,0 +1,45 @@
+import gzip
+
+from flask import Flask, Response
+
+from app.common import compression
+from app.common.compression import compress_response
+
+app = Flask(__name__)
+BODY = b'{"title": "backend"}' * 200
+
+
+def test_gzip_above_threshold(monkeypatch):
+    """임계값 이상 JSON 응답만 gzip으로 압축되는지 테스트"""
+    monkeypatch.setattr(compression, 'brotli', None)
+    with app.test_request_context('/jobs', headers={'Accept-Encoding': 'gzip, deflate'}):
+        response = compress_response(Response(BODY, mimetype='application/json'))
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert gzip.decompress(response.get_data()) == BODY
+        assert int(response.headers['Content-Length']) < len(BODY)
+
+        small = compress_response(Response(b'{}', mimetype='application/json'))
+        assert 'Content-Encoding' not in small.headers
+
+        image = compress_response(Response(BODY, mimetype='image/png'))
+        assert 'Content-Encoding' not in image.headers
+
+
+def test_negotiation(monkeypatch):
+    """Accept-Encoding이 없거나 q=0이면 압축하지 않는지 테스트"""
+    monkeypatch.setattr(compression, 'brotli', None)
+    for header in ('identity', 'gzip;q=0', 'br'):
+        with app.test_request_context('/jobs', headers={'Accept-Encoding': header}):
+            response = compress_response(Response(BODY, mimetype='application/json'))
+            assert 'Content-Encoding' not in response.headers
+
+
+def test_streamed_response(monkeypatch):
+    """스트리밍 응답은 청크 단위로 압축되는지 테스트"""
+    monkeypatch.setattr(compression, 'brotli', None)
+    with app.test_request_context('/jobs/export', headers={'Accept-Encoding': 'gzip'}):
+        response = compress_response(Response((line for line in ['{"a": 1}\n'] * 100),
+                                              mimetype='application/x-ndjson'))
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(b''.join(response.response)) == b'{"a": 1}\n' * 100
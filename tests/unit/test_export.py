@@ -0,0 +1,67 @@
+import json
+from datetime import date, datetime
+
+import pytest
+from app.jobs.export import parse_since, parse_after_id, iter_postings, stream_csv, stream_ndjson
+
+ROWS = [
+    {'posting_id': 1, 'title': '백엔드', 'created_at': datetime(2024, 12, 1, 9, 30), 'tech_stacks': ['Python', 'Flask']},
+    {'posting_id': 2, 'title': 'Data, ML', 'created_at': date(2024, 12, 2), 'tech_stacks': []},
+]
+
+def test_stream_ndjson():
+    """NDJSON 한 줄당 한 공고, 날짜는 ISO 형식"""
+    lines = ''.join(stream_ndjson(iter(ROWS))).splitlines()
+    assert len(lines) == 2
+    first = json.loads(lines[0])
+    assert first['created_at'] == '2024-12-01T09:30:00'
+    assert first['tech_stacks'] == ['Python', 'Flask']
+
+def test_stream_csv():
+    """CSV 헤더/목록 필드 '|' 연결 테스트"""
+    text = ''.join(stream_csv(iter(ROWS), ('posting_id', 'title', 'tech_stacks')))
+    assert text.splitlines() == ['posting_id,title,tech_stacks', '1,백엔드,Python|Flask', '2,"Data, ML",']
+
+def test_parse_since():
+    assert parse_since('2024-12-01') == datetime(2024, 12, 1)
+    assert parse_since('2024-12-01T09:00:00Z') == datetime(2024, 12, 1, 9)
+    assert parse_since(None) is None
+    with pytest.raises(ValueError):
+        parse_since('yesterday')
+
+def test_parse_after_id():
+    assert parse_after_id('15', datetime(2024, 12, 1)) == 15
+    assert parse_after_id(None, None) is None
+    with pytest.raises(ValueError):
+        parse_after_id('15', None)
+    with pytest.raises(ValueError):
+        parse_after_id('x', datetime(2024, 12, 1))
+
+class FakeConn:
+    unread_result = False
+
+    def __init__(self):
+        self.queries = []
+
+    def cursor(self, **kwargs):
+        conn = self
+        class Cursor:
+            def execute(self, query, params):
+                conn.queries.append((' '.join(query.split()), params))
+            def fetchmany(self, size):
+                return []
+            def close(self):
+                pass
+        return Cursor()
+
+def test_iter_postings_resume_conditions():
+    """since는 같은 시각을 포함하고, after_id가 있으면 (created_at, posting_id) 키셋으로 이어 받는지 테스트"""
+    since = datetime(2024, 12, 1, 9, 30)
+    conn = FakeConn()
+    list(iter_postings(conn, ('title',), since))
+    list(iter_postings(conn, ('title',), since, 15))
+
+    (inclusive, params), (keyset, keyset_params) = conn.queries
+    assert "s.created_at >= %s" in inclusive and params == [since]
+    assert "(s.created_at > %s OR (s.created_at = %s AND s.posting_id > %s))" in keyset
+    assert keyset_params == [since, since, 15]
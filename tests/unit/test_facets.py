@@ -0,0 +1,50 @@
+from app.search import facets as facets_module
+from app.search.facets import FacetIndex
+
+class FakeCursor:
+    def __init__(self):
+        self.queries = []
+        self.rows = []
+
+    def execute(self, query, params=None):
+        self.queries.append((query, list(params or [])))
+        if 'tech_stacks' in query:
+            self.rows = [{'stack_id': v, 'name': f"stack{v}"} for v in params]
+        else:
+            self.rows = [{'location_id': v, 'city': '서울', 'district': None} for v in params]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+class FakeDb:
+    def __init__(self):
+        self.cursor_obj = FakeCursor()
+
+    def cursor(self, dictionary=False):
+        return self.cursor_obj
+
+class FakeBitmapIndex:
+    def values_for(self, posting_id):
+        return {1: {'tech_stacks': (1, 2), 'location_id': (7,)}}.get(posting_id, {})
+
+def test_refresh_fetches_only_unknown_labels(monkeypatch):
+    """변경된 공고가 참조하는 값 중 이름을 모르는 것만 조회하는지 테스트"""
+    db = FakeDb()
+    monkeypatch.setattr(facets_module, 'get_db', lambda: db)
+    monkeypatch.setattr(facets_module, 'bitmap_index', FakeBitmapIndex())
+
+    index = FacetIndex()
+    index._loaded_at = 1.0
+    index._labels['tech_stacks'] = {1: 'Python'}
+
+    index.refresh([1, 2])
+    assert [params for _, params in db.cursor_obj.queries] == [[2], [7]]
+    assert index._labels['tech_stacks'] == {1: 'Python', 2: 'stack2'}
+    assert index._labels['location_id'] == {7: '서울'}
+
+    db.cursor_obj.queries.clear()
+    index.refresh([1])
+    assert db.cursor_obj.queries == []
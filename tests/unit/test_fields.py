@@ -0,0 +1,24 @@
+import pytest
+from app.jobs.fields import (parse_fields, select_columns, LISTING_FIELDS, DETAIL_FIELDS,
+                             DEFAULT_LISTING_FIELDS)
+
+def test_parse_fields():
+    """fields 파라미터 화이트리스트 검증 테스트"""
+    assert parse_fields(None, LISTING_FIELDS, DEFAULT_LISTING_FIELDS) == DEFAULT_LISTING_FIELDS
+    assert parse_fields("title, tech_stacks,title", LISTING_FIELDS) == ('posting_id', 'title', 'tech_stacks')
+    with pytest.raises(ValueError):
+        parse_fields("title,password", LISTING_FIELDS)
+    with pytest.raises(ValueError):
+        parse_fields("company_description", LISTING_FIELDS)
+
+def test_select_columns():
+    """요청 필드에 필요한 컬럼/조인만 조회하는지 테스트"""
+    columns, join_postings, join_companies = select_columns(DEFAULT_LISTING_FIELDS)
+    assert 'job_description' not in columns and not join_postings and not join_companies
+
+    columns, join_postings, join_companies = select_columns(('posting_id', 'job_description', 'company_description'))
+    assert columns == 's.posting_id, p.job_description, c.description as company_description'
+    assert join_postings and join_companies
+
+    columns, _, _ = select_columns(DETAIL_FIELDS)
+    assert 'recent_unique_view_count' not in columns
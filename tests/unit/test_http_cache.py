@@ -0,0 +1,48 @@
+from flask import Flask
+
+from app.common import http_cache
+from app.common.http_cache import make_etag, is_not_modified, cache_headers, not_modified
+
+app = Flask(__name__)
+
+
+def test_make_etag():
+    """버전/URL이 같으면 같은 ETag, 버전을 모르면 None인지 테스트"""
+    with app.test_request_context('/jobs?page=2'):
+        etag = make_etag('3')
+        assert etag == make_etag('3')
+        assert etag != make_etag('4')
+        assert make_etag(None) is None
+    with app.test_request_context('/jobs?page=3'):
+        assert make_etag('3') != etag
+
+
+def test_etag_window(monkeypatch):
+    """버전이 같아도 시간 구간이 바뀌면 ETag가 바뀌는지 테스트"""
+    monkeypatch.setattr(http_cache, 'ETAG_WINDOW', 300)
+    with app.test_request_context('/jobs/1'):
+        monkeypatch.setattr(http_cache.time, 'time', lambda: 1000.0)
+        first = make_etag('1')
+        monkeypatch.setattr(http_cache.time, 'time', lambda: 1100.0)
+        assert make_etag('1') == first
+        monkeypatch.setattr(http_cache.time, 'time', lambda: 1300.0)
+        assert make_etag('1') != first
+
+
+def test_conditional_response():
+    """If-None-Match 약한 비교와 304/캐시 헤더 테스트"""
+    with app.test_request_context('/jobs', headers={'If-None-Match': 'W/"abc", "def"'}):
+        assert is_not_modified('abc')
+        assert is_not_modified('def')
+        assert not is_not_modified('xyz')
+        assert not is_not_modified(None)
+
+        response = not_modified('abc', max_age=30)
+        assert response.status_code == 304
+        assert response.headers['ETag'] == 'W/"abc"'
+        assert response.headers['Cache-Control'] in ('public, max-age=30', 'max-age=30, public')
+
+    with app.test_request_context('/jobs'):
+        assert not is_not_modified('abc')
+        response = cache_headers(app.make_response(('{}', 200)), None)
+        assert 'ETag' not in response.headers and 'Cache-Control' not in response.headers
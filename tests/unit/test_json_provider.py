@@ -0,0 +1,57 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date as werkzeug_http_date
+
+from app.common import json_provider
+from app.common.json_provider import FastJSONProvider, dumps, http_date
+
+DATA = {
+    'posting_id': 1,
+    'title': '백엔드',
+    'salary_min': Decimal('3000.50'),
+    'created_at': datetime(2024, 12, 1, 9, 30),
+    'deadline_date': date(2024, 12, 31),
+    'counts': {3: 1},
+    'tech_stacks': ['Python']
+}
+
+
+def test_provider_matches_default_output():
+    """기본 provider와 같은 값(HTTP 날짜, Decimal 문자열, 키 정렬)으로 직렬화되는지 테스트"""
+    app = Flask(__name__)
+    expected = DefaultJSONProvider(app).dumps(DATA)
+    provider = FastJSONProvider(app)
+
+    assert json.loads(provider.dumps(DATA)) == json.loads(expected)
+    assert list(json.loads(provider.dumps(DATA))) == sorted(DATA)
+    assert json.loads(provider.dumps(DATA))['created_at'] == 'Sun, 01 Dec 2024 09:30:00 GMT'
+    assert provider.loads(provider.dumps(DATA))['salary_min'] == '3000.50'
+
+    with app.app_context():
+        response = provider.response(DATA)
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.get_data()) == json.loads(expected)
+
+
+def test_http_date():
+    """werkzeug http_date와 같은 문자열인지 테스트"""
+    values = [datetime(2024, 2, 29, 23, 59, 59, 999999), date(2025, 1, 1),
+              datetime(2024, 12, 1, 9, 30, tzinfo=timezone(timedelta(hours=9)))]
+    for value in values:
+        assert http_date(value) == werkzeug_http_date(value)
+
+
+def test_dumps_fallback(monkeypatch):
+    """orjson이 없거나 처리할 수 없는 값이면 표준 json으로 같은 결과를 내는지 테스트"""
+    default = lambda value: value.isoformat() if isinstance(value, (datetime, date)) else str(value)
+    fast = dumps(DATA, default=default, iso_datetime=True)
+
+    monkeypatch.setattr(json_provider, 'orjson', None)
+    assert json.loads(dumps(DATA, default=default)) == json.loads(fast)
+
+    monkeypatch.undo()
+    assert json.loads(dumps({'id': 2 ** 70})) == {'id': 2 ** 70}
@@ -0,0 +1,58 @@
+from app.jobs import listing
+from app.jobs.listing import build_where
+
+class FakeSearchIndex:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def candidates(self, query):
+        return self.ids
+
+def test_search_candidates_as_id_list(monkeypatch):
+    """검색 후보가 적으면 posting_id IN 목록으로 조회하는지 테스트"""
+    monkeypatch.setattr(listing, 'search_index', FakeSearchIndex({1, 2}))
+    where_sql, params = build_where({'search': 'python'})
+    assert "p.posting_id IN (%s,%s)" in where_sql and "LIKE" not in where_sql
+    assert sorted(params) == [1, 2]
+
+def test_search_candidates_over_limit_use_like(monkeypatch):
+    """짧은 접두어처럼 후보가 MAX_ID_FILTER를 넘으면 LIKE로 대체하는지 테스트"""
+    monkeypatch.setattr(listing, 'MAX_ID_FILTER', 3)
+    monkeypatch.setattr(listing, 'search_index', FakeSearchIndex(set(range(10))))
+    where_sql, params = build_where({'search': 'a'})
+    assert "posting_id IN" not in where_sql
+    assert "p.title LIKE %s OR p.job_description LIKE %s" in where_sql
+    assert params == ['%a%', '%a%']
+
+class FakeBitmapIndex:
+    def __init__(self, ids, current):
+        self.ids, self.current = ids, current
+
+    def is_current(self):
+        return self.current
+
+    def match(self, filters):
+        return self.ids
+
+def test_tag_filters_use_bitmap_only_when_current(monkeypatch):
+    """비트맵 색인이 최신이면 ID 목록, 다른 워커의 변경이 남아 있으면 세미조인으로 조회하는지 테스트"""
+    monkeypatch.setattr(listing, 'bitmap_index', FakeBitmapIndex({3, 4}, current=True))
+    where_sql, params = build_where({'tech_stacks': [1]})
+    assert "p.posting_id IN (%s,%s)" in where_sql and "posting_tech_stacks" not in where_sql
+
+    monkeypatch.setattr(listing, 'bitmap_index', FakeBitmapIndex({3, 4}, current=False))
+    where_sql, params = build_where({'tech_stacks': [1]})
+    assert "SELECT t.posting_id FROM posting_tech_stacks t" in where_sql
+    assert params == [1]
+
+def test_hangul_phrase_candidates_checked_with_like(monkeypatch):
+    """3음절 이상 한글 검색어는 2-gram 후보를 구간 LIKE로 다시 확인하는지 테스트"""
+    monkeypatch.setattr(listing, 'search_index', FakeSearchIndex({1, 2}))
+    where_sql, params = build_where({'search': 'python 개발자'})
+    assert "p.posting_id IN (%s,%s)" in where_sql
+    assert "(p.title LIKE %s OR p.job_description LIKE %s)" in where_sql
+    assert params == ['%개발자%', '%개발자%', 1, 2]
+
+    # 2음절 이하와 영문 토큰은 색인 일치가 곧 부분 문자열 일치
+    where_sql, _ = build_where({'search': 'python 개발'})
+    assert "LIKE" not in where_sql
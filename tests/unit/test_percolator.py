@@ -0,0 +1,158 @@
+import json
+
+import pytest
+import app.search.percolator as percolator_module
+from app.search.percolator import Percolator
+
+
+def row(posting_id, title, description='', stacks=(), categories=(), location_id=None,
+        experience_level=None, salary=(None, None)):
+    return {
+        'posting_id': posting_id,
+        'title': title,
+        'job_description': description,
+        'location_id': location_id,
+        'experience_level': experience_level,
+        'employment_type': None,
+        'salary_min': salary[0],
+        'salary_max': salary[1],
+        'tech_stack_ids': ','.join(str(stack_id) for stack_id in stacks) or None,
+        'category_ids': ','.join(str(category_id) for category_id in categories) or None
+    }
+
+
+ROWS = [
+    row(1, "백엔드 개발자", "Python Django 서버 개발", stacks=[1, 2], location_id=10, salary=(40000000, 50000000)),
+    row(2, "프론트엔드 개발자", "JavaScript React", stacks=[3], categories=[7], location_id=20),
+    row(3, "데이터 엔지니어", "Spark 파이프라인", stacks=[1], location_id=10, experience_level='신입'),
+    # '개발자'의 2-gram(개발, 발자)은 모두 있지만 연속하지 않음
+    row(4, "개발 리드", "발자국 분석", location_id=30)
+]
+
+
+class FakeDB:
+    """saved_searches 테이블(searches)과 대조 결과 기록만 흉내 낸다"""
+    def __init__(self, searches):
+        self.searches = dict(searches)
+        self.inserted = []
+        self.commits = 0
+
+    def cursor(self, **kwargs):
+        db = self
+        class Cursor:
+            def execute(self, query, params=()):
+                self.params = params
+            def fetchone(self):
+                return {'total': len(db.searches), 'last_id': max(db.searches, default=None)}
+            def fetchall(self):
+                return [{'saved_search_id': saved_search_id, 'filters': json.dumps(filters)}
+                        for saved_search_id, filters in db.searches.items() if saved_search_id > self.params[0]]
+            def executemany(self, query, rows):
+                db.inserted.extend(rows)
+            def close(self):
+                pass
+        return Cursor()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+SEARCHES = {
+    101: {'tech_stacks': [1]},
+    102: {'tech_stacks': [1, 2], 'tech_stacks_mode': 'all'},
+    103: {'search': 'pyth'},
+    104: {'search': '개발'},
+    100: {'search': '개발자'},
+    105: {'categories': [7], 'exclude_tech_stacks': [3]},
+    106: {'location_ids': [10, 11], 'experience_level': '신입'},
+    107: {'salary_min': 45000000},
+    108: {'salary_min': 40000000, 'salary_max': 60000000},
+    109: {'location_ids': []}
+}
+
+
+@pytest.fixture
+def percolator(monkeypatch):
+    percolator = Percolator()
+    db = FakeDB(SEARCHES)
+    # DB 대신 고정 행/저장된 검색 사용
+    monkeypatch.setattr(percolator_module, 'get_db', lambda: db)
+    monkeypatch.setattr(percolator, '_fetch_postings',
+                        lambda cursor, ids: Percolator._fetch_postings(FixedRows(ids), ids))
+    percolator.loads = 0
+    monkeypatch.setattr(percolator, 'load', lambda: setattr(percolator, 'loads', percolator.loads + 1))
+    for saved_search_id, filters in SEARCHES.items():
+        percolator._add(saved_search_id, filters)
+    percolator._last_id = max(SEARCHES)
+    percolator._loaded_at = 0.0
+    percolator.db = db
+    return percolator
+
+
+class FixedRows:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def execute(self, query, params=()):
+        pass
+
+    def fetchall(self):
+        return [r for r in ROWS if r['posting_id'] in self.ids]
+
+
+def test_percolate_matches_listing_filters(percolator):
+    """새 공고가 목록 필터와 같은 기준으로 저장된 검색에 대조되는지 테스트"""
+    matches = percolator.percolate([1, 2, 3])
+    assert matches == {
+        100: [1, 2],
+        101: [1, 3],
+        102: [1],
+        103: [1],
+        104: [1, 2],
+        106: [3],
+        108: [1]
+    }
+    assert sorted(percolator.db.inserted) == sorted(
+        (saved_search_id, posting_id) for saved_search_id, ids in matches.items() for posting_id in ids)
+    assert percolator.db.commits == 1
+
+
+def test_candidates_only_anchored_searches(percolator):
+    """공고 값으로 걸리는 검색만 후보가 되는지 테스트 (연봉 조건만 있는 검색은 항상 후보)"""
+    posting = Percolator._fetch_postings(FixedRows([2]), [2])[0]
+    candidates = percolator._candidates(posting)
+    assert 101 not in candidates and 102 not in candidates and 106 not in candidates
+    assert {104, 105, 107} <= candidates
+    assert 109 not in candidates
+
+
+def test_remove_saved_search(percolator):
+    """삭제한 검색은 더 이상 대조되지 않는지 테스트"""
+    percolator.remove(101)
+    percolator.remove(107)
+    assert 101 not in percolator.percolate([1])
+    assert all(101 not in ids for ids in percolator._index.values())
+    assert 107 not in percolator._unanchored
+
+
+def test_refresh_picks_up_searches_from_other_workers(percolator):
+    """색인을 읽은 뒤 다른 워커에서 생성된 검색도 다음 새 공고부터 대조되는지 테스트"""
+    percolator.db.searches[110] = {'tech_stacks': [3]}
+    assert percolator.percolate([2])[110] == [2]
+    assert percolator._last_id == 110
+    assert percolator.loads == 0
+
+    # 다른 워커에서 삭제되어 수가 어긋나면 전체를 다시 읽는다
+    del percolator.db.searches[101]
+    percolator.percolate([2])
+    assert percolator.loads == 1
+
+
+def test_hangul_phrase_must_appear_in_text(percolator):
+    """2-gram이 모두 있어도 3음절 이상 구간이 본문에 없으면 일치하지 않는지 테스트"""
+    matches = percolator.percolate([1, 2, 4])
+    assert matches[100] == [1, 2]
+    assert matches[104] == [1, 2, 4]
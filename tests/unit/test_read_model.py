@@ -0,0 +1,15 @@
+from app.jobs.read_model import expand_row
+
+def test_expand_row():
+    """job_search 행의 ID/이름 목록 컬럼 변환 테스트"""
+    row = expand_row({
+        'posting_id': 1,
+        'tech_stack_ids': '3,7',
+        'tech_stack_names': 'Python|C, C++',
+        'category_ids': None,
+        'category_names': None
+    })
+    assert row['tech_stack_ids'] == [3, 7]
+    assert row['tech_stacks'] == ['Python', 'C, C++']
+    assert row['category_ids'] == [] and row['categories'] == []
+    assert 'tech_stack_names' not in row and 'category_names' not in row
@@ -0,0 +1,57 @@
+import pytest
+from app.jobs.reference import ReferenceRegistry, normalize_key
+
+
+class FakeCursor:
+    """tech_stacks 테이블 하나를 흉내 내는 커서 (대소문자 무시 이름 비교)"""
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, query, params=()):
+        query = ' '.join(query.split())
+        self.queries.append(query)
+        if query.startswith('INSERT IGNORE'):
+            for name in params:
+                if all(row['name'].lower() != name.lower() for row in self.rows):
+                    self.rows.append({'stack_id': len(self.rows) + 1, 'name': name})
+            self.result = []
+        else:
+            names = {name.lower() for name in params}
+            self.result = [row for row in self.rows if row['name'].lower() in names]
+
+    def fetchall(self):
+        return self.result
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = ReferenceRegistry()
+    monkeypatch.setattr(registry, 'load', lambda: None)
+    registry._maps['tech_stacks'] = {('python',): 1}
+    registry._loaded_at = float('inf')
+    return registry
+
+
+def test_normalize_key():
+    """이름/지역 조회 키 정규화 테스트"""
+    assert normalize_key('tech_stacks', ' Python ') == ('python',)
+    assert normalize_key('locations', {'city': '서울', 'district': ' '}) == ('서울', None)
+    assert normalize_key('locations', ('서울', '강남구')) == ('서울', '강남구')
+
+
+def test_resolve_batches_missing_names(registry):
+    """맵에 없는 이름만 조회 한 번 + INSERT IGNORE 한 번으로 처리하는지 테스트"""
+    cursor = FakeCursor([{'stack_id': 1, 'name': 'Python'}, {'stack_id': 2, 'name': 'Java'}])
+
+    resolved = registry.resolve(cursor, 'tech_stacks', ['PYTHON', 'java', 'Go', 'Rust', 'go'])
+    assert resolved == {('python',): 1, ('java',): 2, ('go',): 3, ('rust',): 4}
+    assert [q.split()[0] for q in cursor.queries] == ['SELECT', 'INSERT', 'SELECT']
+    assert cursor.rows[2]['name'] == 'Go'
+
+    # 이미 있던 행만 맵에 추가 (이번 트랜잭션에서 만든 행은 커밋 전이므로 제외)
+    assert registry.ids('tech_stacks', ['java', 'go', 'kotlin']) == [2]
+
+    cursor.queries.clear()
+    assert registry.resolve(cursor, 'tech_stacks', ['Python', 'Java']) == {('python',): 1, ('java',): 2}
+    assert cursor.queries == []
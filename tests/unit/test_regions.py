@@ -0,0 +1,44 @@
+import pytest
+from app.jobs import regions
+from app.jobs.regions import RegionIndex
+
+LOCATIONS = [
+    {'location_id': 1, 'city': '서울특별시', 'code': None, 'district': '강남구'},
+    {'location_id': 2, 'city': '서울', 'code': None, 'district': '마포구'},
+    {'location_id': 3, 'city': '경기도', 'code': None, 'district': '성남시'},
+    {'location_id': 4, 'city': '인천광역시', 'code': None, 'district': None},
+    {'location_id': 5, 'city': '전라북도', 'code': None, 'district': '전주시'},
+    {'location_id': 6, 'city': '부산', 'code': '106000', 'district': None}
+]
+
+class FakeDB:
+    def cursor(self, **kwargs):
+        class Cursor:
+            def execute(self, query, params=()):
+                pass
+            def fetchall(self):
+                return LOCATIONS
+            def close(self):
+                pass
+        return Cursor()
+
+@pytest.fixture
+def index(monkeypatch):
+    monkeypatch.setattr(regions, 'get_db', FakeDB)
+    return RegionIndex()
+
+def test_resolve_region(index):
+    """지역 그룹/시·도/코드/구·군 표기 → location_id 목록 테스트"""
+    assert index.resolve("수도권") == [1, 2, 3, 4]
+    assert index.resolve("서울 전체") == [1, 2]
+    assert index.resolve("서울특별시") == [1, 2]
+    assert index.resolve("102000") == [3]
+    assert index.resolve("서울 강남구") == [1]
+    assert index.resolve("전북") == [5]
+    assert index.resolve("대구") == []
+    assert index.resolve_all(["부산", "인천"]) == [4, 6]
+
+def test_resolve_unknown_region(index):
+    """알 수 없는 지역 표기 테스트"""
+    with pytest.raises(ValueError):
+        index.resolve("화성")
@@ -0,0 +1,60 @@
+from app.jobs.related import RelatedEngine, _Snapshot
+
+def posting(company_id, stacks, categories=()):
+    return {'company_id': company_id, 'stacks': frozenset(stacks), 'categories': frozenset(categories)}
+
+def test_related_ranking():
+    """희소 기술스택 일치 > 흔한 기술스택 일치, 같은 회사/카테고리 가산점 테스트"""
+    engine = RelatedEngine()
+    snapshot = _Snapshot({
+        1: posting(10, [1, 2]),
+        2: posting(20, [1]),          # 흔한 기술스택만 일치
+        3: posting(30, [2]),          # 희소 기술스택 일치
+        4: posting(10, [9]),          # 같은 회사
+        5: posting(40, [1], [7]),
+        6: posting(50, [8]),          # 겹치는 것 없음
+        7: posting(60, [1], [7]),
+    })
+
+    ranked = [posting_id for posting_id, _ in snapshot.top_k(1, engine)]
+    assert ranked.index(3) < ranked.index(2)
+    assert 4 in ranked and 6 not in ranked
+    assert 1 not in ranked
+
+    # 같은 카테고리 가산점
+    assert snapshot.top_k(5, engine)[0][0] == 7
+
+class FakeDb:
+    """job_search 활성 공고 행을 돌려주는 DB"""
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, dictionary=False):
+        db = self
+        class Cursor:
+            def execute(self, query, params=None):
+                self.result = [row for row in db.rows if params is None or row['posting_id'] in params]
+            def fetchall(self):
+                return self.result
+            def close(self):
+                pass
+        return Cursor()
+
+def row(posting_id, company_id, stacks, categories=''):
+    return {'posting_id': posting_id, 'company_id': company_id, 'tech_stack_ids': stacks, 'category_ids': categories}
+
+def test_snapshot_update_matches_reload():
+    """변경된 공고만 반영한 스냅샷이 전체 재적재와 같은지 테스트"""
+    db = FakeDb([row(1, 10, '1,2'), row(2, 20, '1'), row(3, 30, '2', '7')])
+    snapshot = _Snapshot.load(db)
+
+    # 2는 비활성화, 3은 기술스택 변경, 4는 새 공고
+    db.rows = [row(1, 10, '1,2'), row(3, 30, '1,3', '7'), row(4, 10, '3')]
+    snapshot.update(db, [2, 3, 4])
+
+    reloaded = _Snapshot.load(db)
+    assert snapshot.postings == reloaded.postings
+    assert snapshot.by_stack == reloaded.by_stack
+    assert snapshot.by_company == reloaded.by_company
+    assert snapshot.weights == reloaded.weights
+    assert snapshot.top_k(1, RelatedEngine()) == reloaded.top_k(1, RelatedEngine())
@@ -0,0 +1,36 @@
+from app.jobs.salary import parse_salary
+
+def test_parse_salary_range():
+    """연봉 범위/단위 생략/억 단위 파싱 테스트"""
+    assert parse_salary("3,000~4,000만원") == (30000000, 40000000)
+    assert parse_salary("연봉 3000 - 4000만원") == (30000000, 40000000)
+    assert parse_salary("1억 2천만원") == (120000000, 120000000)
+    assert parse_salary("3,200만원 (주5일)") == (32000000, 32000000)
+
+def test_parse_salary_period_and_bounds():
+    """월급/시급 연 환산, 이상/이하 테스트"""
+    assert parse_salary("월 250만원") == (30000000, 30000000)
+    assert parse_salary("시급 10,000원") == (25080000, 25080000)
+    assert parse_salary("4000만원 이상") == (40000000, None)
+    assert parse_salary("3000만원 이하") == (None, 30000000)
+
+def test_parse_salary_nearest_period():
+    """금액에 가장 가까운 급여 기준 표기를 쓰는지 테스트"""
+    assert parse_salary("월~금 근무, 연봉 3000만원") == (30000000, 30000000)
+    assert parse_salary("연봉 4000만원 (월 330만원)") == (40000000, 40000000)
+    assert parse_salary("주5일 근무, 월 250만원") == (30000000, 30000000)
+
+def test_parse_salary_open_and_mixed_ranges():
+    """열린 범위('~')와 범위 양쪽 단위 전파 테스트"""
+    assert parse_salary("3000만원~") == (30000000, None)
+    assert parse_salary("~4000만원") == (None, 40000000)
+    assert parse_salary("3천~4천만원") == (30000000, 40000000)
+    assert parse_salary("3천만~4천") == (30000000, 40000000)
+    assert parse_salary("3천~5000만원") == (30000000, 50000000)
+    assert parse_salary("시급 9천원~1만원") == (22572000, 25080000)
+
+def test_parse_salary_unknown():
+    """금액이 없는 문구 테스트"""
+    assert parse_salary("면접 후 결정") == (None, None)
+    assert parse_salary("회사내규에 따름") == (None, None)
+    assert parse_salary(None) == (None, None)
@@ -0,0 +1,98 @@
+from datetime import datetime
+from decimal import Decimal
+
+from app.cache import search_cache as search_cache_module
+from app.cache.search_cache import SearchResultCache
+
+class FakeRedis:
+    """문자열/집합 명령만 지원하는 메모리 Redis"""
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        redis_client = self
+        class Pipeline:
+            def __init__(self):
+                self.results = []
+            def __getattr__(self, name):
+                def command(*args):
+                    self.results.append(getattr(redis_client, name)(*args))
+                return command
+            def execute(self):
+                return self.results
+        return Pipeline()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, pattern):
+        prefix = pattern.rstrip('*')
+        return [key for key in list(self.data) if key.startswith(prefix)]
+
+def make_cache(monkeypatch):
+    monkeypatch.setattr(search_cache_module.cache, 'redis_client', FakeRedis(), raising=False)
+    return SearchResultCache()
+
+def test_filter_tags():
+    """필터 조건별 태그 생성 테스트 - 태그 필터가 없으면 'all'"""
+    assert SearchResultCache.filter_tags(None) == {'all'}
+    assert SearchResultCache.filter_tags({'search': 'python', 'salary_min': 30000000}) == {'all'}
+    assert SearchResultCache.filter_tags({'tech_stacks': [3, 1], 'categories': 2, 'exclude_tech_stacks': [5]}) == \
+        {'stack:1', 'stack:3', 'category:2'}
+    assert SearchResultCache.filter_tags({'location_ids': []}) == {'region'}
+
+def test_round_trip(monkeypatch):
+    """날짜/Decimal 값이 포함된 결과 저장 후 조회 테스트"""
+    cache = make_cache(monkeypatch)
+    result = {'postings': [{'posting_id': 1, 'created_at': datetime(2024, 1, 2, 3, 4, 5),
+                            'score': Decimal('1.5')}], 'total': 1}
+    cache.set('sig', result, {'tech_stacks': [1]})
+
+    cached = cache.get('sig')
+    assert cached['postings'][0]['created_at'] == datetime(2024, 1, 2, 3, 4, 5)
+    assert cached['postings'][0]['score'] == '1.5'
+    assert cache.get('other') is None
+
+def test_invalidate_by_posting_tags(monkeypatch):
+    """변경된 공고의 태그가 붙은 항목과 'all' 항목만 삭제되는지 테스트"""
+    cache = make_cache(monkeypatch)
+    cache.set('python', {'total': 1}, {'tech_stacks': [1]})
+    cache.set('java', {'total': 2}, {'tech_stacks': [2]})
+    cache.set('latest', {'total': 3}, {})
+    cache.set('seoul', {'total': 4}, {'location_ids': [10, 11]})
+
+    cache.invalidate([{'tech_stacks': (1,), 'categories': (), 'location_id': (12,)}])
+    assert cache.get('python') is None
+    assert cache.get('latest') is None
+    assert cache.get('java') == {'total': 2}
+    assert cache.get('seoul') == {'total': 4}
+
+    # 새 지역이 추가되면 region 필터 결과도 무효화
+    cache.invalidate([], regions_changed=True)
+    assert cache.get('seoul') is None
+    assert cache.get('java') == {'total': 2}
+
+def test_clear(monkeypatch):
+    """이전 태그를 알 수 없을 때 모든 항목과 태그가 삭제되는지 테스트"""
+    cache = make_cache(monkeypatch)
+    cache.set('a', {'total': 1}, {'tech_stacks': [1]})
+    cache.set('b', {'total': 2}, None)
+    cache.clear()
+    assert cache.get('a') is None and cache.get('b') is None
+    assert search_cache_module.cache.redis_client.data == {}
@@ -0,0 +1,54 @@
+import pytest
+from app.search.tokenizer import tokenize
+from app.search.inverted_index import SearchIndex
+
+@pytest.fixture
+def index(monkeypatch):
+    index = SearchIndex()
+    # DB 로딩 없이 메모리 색인만 사용
+    monkeypatch.setattr(index, 'load', lambda: None)
+    index.add(1, "백엔드 개발자 채용", "Python/Flask 경험자 우대")
+    index.add(2, "프론트엔드 개발자", "React, JavaScript")
+    index.add(3, "데이터 엔지니어", "Java 기반 파이프라인")
+    return index
+
+def test_tokenize():
+    """한글 2-gram / 영문 단어 토큰화 테스트"""
+    assert tokenize("백엔드 Python3") == ["백엔", "엔드", "python3"]
+    assert tokenize("웹 개발") == ["웹", "개발"]
+    assert tokenize("C++ / !!") == ["c"]
+    assert tokenize("") == []
+
+def test_candidates(index):
+    """검색어 후보 ID 조회 테스트"""
+    assert index.candidates("개발자") == {1, 2}
+    assert index.candidates("백엔드 python") == {1}
+    assert index.candidates("java") == {2, 3}  # 접두어 일치 (javascript)
+    assert index.candidates("엔") == {1, 2, 3}
+    assert index.candidates("없는검색어") == set()
+    assert index.candidates("!!") is None
+
+def test_remove_and_update(index):
+    """공고 삭제/수정 시 색인 갱신 테스트"""
+    index.remove(1)
+    assert index.candidates("백엔드") == set()
+
+    index.add(2, "백엔드 개발자", "Go")
+    assert index.candidates("백엔드") == {2}
+    assert index.candidates("react") == set()
+
+def test_rank_title_boost(index):
+    """제목 일치가 본문 일치보다 높은 점수 (BM25 + 제목 가중치)"""
+    index.add(4, "Python 백엔드", "서버 개발")
+    ranked = index.rank("python", index.candidates("python"))
+    assert [posting_id for posting_id, _ in ranked] == [4, 1]
+    assert ranked[0][1] > ranked[1][1] > 0
+
+def test_rank_corpus_stats_incremental(index):
+    """공고 추가/삭제 시 문서 수·평균 길이가 증분 갱신되어 점수에 반영"""
+    before = index.scores("데이터", [3])[3]
+    index.add(5, "데이터 분석가", "SQL")
+    assert index.scores("데이터", [3])[3] < before  # 흔한 단어일수록 IDF 감소
+    index.remove(5)
+    assert index.scores("데이터", [3])[3] == pytest.approx(before)
+    assert index.scores("데이터", [99]) == {99: 0.0}
@@ -0,0 +1,81 @@
+import pytest
+from app.search.tokenizer import to_jamo
+from app.search.suggest import SuggestIndex
+
+
+def row(posting_id, title, company_id, company_name, stacks=(), view_count=0):
+    return {
+        'posting_id': posting_id,
+        'title': title,
+        'company_id': company_id,
+        'company_name': company_name,
+        'view_count': view_count,
+        'tech_stack_ids': ','.join(str(stack_id) for stack_id, _ in stacks) or None,
+        'tech_stack_names': '|'.join(name for _, name in stacks) or None
+    }
+
+
+ROWS = [
+    row(1, "백엔드 개발자", 10, "네이버", [(1, 'Python'), (2, 'Java')], view_count=5),
+    row(2, "[카카오] 백엔드 개발자", 20, "카카오", [(2, 'Java'), (3, 'JavaScript')], view_count=50),
+    row(3, "프론트엔드 개발자", 20, "카카오", [(3, 'JavaScript')], view_count=1)
+]
+
+
+class FakeDB:
+    def cursor(self, **kwargs):
+        class Cursor:
+            def close(self):
+                pass
+        return Cursor()
+
+
+def fetch_rows(cursor, posting_ids=None):
+    return [r for r in ROWS if posting_ids is None or r['posting_id'] in posting_ids]
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = SuggestIndex()
+    # DB 대신 고정 행 사용
+    monkeypatch.setattr('app.search.suggest.get_db', FakeDB)
+    monkeypatch.setattr(SuggestIndex, '_fetch_rows', staticmethod(fetch_rows))
+    index.load()
+    return index
+
+
+def test_to_jamo():
+    """한글 자모 분해 테스트 (겹모음/겹받침은 낱자로)"""
+    assert to_jamo('개발') == 'ㄱㅐㅂㅏㄹ'
+    assert to_jamo('괜') == 'ㄱㅗㅐㄴ'
+    assert to_jamo('값') == 'ㄱㅏㅂㅅ'
+    assert to_jamo('java') == 'java'
+
+
+def test_suggest_prefix(index):
+    """단어 접두어/입력 중인 한글/인기순 정렬 테스트"""
+    result = index.suggest("백엔")
+    assert [item['text'] for item in result['titles']] == ["[카카오] 백엔드 개발자", "백엔드 개발자"]
+
+    # '갭' 입력 중 → '개발자'와 일치
+    assert len(index.suggest("갭")['titles']) == 3
+
+    stacks = index.suggest("jav")['tech_stacks']
+    assert [(item['stack_id'], item['count']) for item in stacks] == [(2, 2), (3, 2)]
+
+    companies = index.suggest("카")['companies']
+    assert companies == [{'text': '카카오', 'count': 2, 'company_id': 20}]
+    assert index.suggest("")['titles'] == []
+
+
+def test_refresh_updates_entries(index):
+    """공고 변경 시 항목/캐시 갱신 테스트"""
+    assert index.suggest("프론")['titles']
+    ROWS[2] = row(3, "데이터 엔지니어", 20, "카카오", [(4, 'Spark')])
+    try:
+        index.refresh([3])
+        assert index.suggest("프론")['titles'] == []
+        assert index.suggest("spa")['tech_stacks'][0]['text'] == 'Spark'
+        assert index.suggest("javas")['tech_stacks'][0]['count'] == 1
+    finally:
+        ROWS[2] = row(3, "프론트엔드 개발자", 20, "카카오", [(3, 'JavaScript')], view_count=1)
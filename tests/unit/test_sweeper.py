@@ -0,0 +1,51 @@
+from app.jobs import sweeper
+from app.jobs.sweeper import PostingSweeper
+
+class FakeDB:
+    """SELECT마다 준비된 ID 묶음을 차례로 돌려주는 DB"""
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.executed = []
+        self.commits = 0
+
+    def cursor(self):
+        db = self
+        class Cursor:
+            def execute(self, query, params=()):
+                db.executed.append(' '.join(query.split()))
+                self.rows = [(i,) for i in db.batches.pop(0)] if query.strip().startswith('SELECT') else []
+            def fetchall(self):
+                return self.rows
+            def close(self):
+                pass
+        return Cursor()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+def test_expire_in_batches(monkeypatch):
+    """마감 공고를 배치 단위로 만료 처리하고 배치마다 커밋/동기화하는지 테스트"""
+    synced, notified = [], []
+    monkeypatch.setattr(sweeper, 'sync_job_search', lambda cursor, ids: synced.append(list(ids)))
+    monkeypatch.setattr(sweeper, 'notify_postings_changed', lambda ids: notified.append(list(ids)))
+    monkeypatch.setattr(PostingSweeper, 'BATCH_SIZE', 2)
+
+    db = FakeDB([[1, 2], [3]])
+    assert PostingSweeper().expire(db) == 3
+    assert db.commits == 2
+    assert synced == notified == [[1, 2], [3]]
+    assert sum(query.startswith("UPDATE job_postings SET status = 'expired'") for query in db.executed) == 2
+
+def test_archive_moves_rows(monkeypatch):
+    """보관 대상 공고를 보관 테이블로 복사 후 종속 행과 함께 삭제하는지 테스트"""
+    monkeypatch.setattr(sweeper, 'notify_postings_changed', lambda ids: None)
+
+    # deleted: [5], expired: 없음, inactive: 없음
+    db = FakeDB([[5], [], []])
+    assert PostingSweeper().archive(db) == 1
+    assert db.executed[1].startswith("REPLACE INTO job_postings_archive")
+    assert "DELETE FROM job_postings WHERE posting_id IN (%s)" in db.executed
+    assert "DELETE FROM posting_tech_stacks WHERE posting_id IN (%s)" in db.executed
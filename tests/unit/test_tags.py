@@ -0,0 +1,52 @@
+from datetime import date
+
+from app.jobs.tags import diff_tags, sync_tags
+from app.jobs.utils import changed_values
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((' '.join(query.split()), params))
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_diff_tags():
+    """현재 연결과 요청한 연결의 차이 계산 테스트"""
+    assert diff_tags([1, 2, 3], [3, 4, 4, 1]) == ([4], [2])
+    assert diff_tags([], [2, 1]) == ([2, 1], [])
+    assert diff_tags([1, 2], [2, 1]) == ([], [])
+
+
+def test_sync_tags_applies_difference():
+    """추가분은 다중 행 INSERT 한 번, 제거분은 DELETE ... IN 한 번으로 반영되는지 테스트"""
+    cursor = FakeCursor([{'stack_id': 1}, {'stack_id': 2}, {'stack_id': 3}])
+    assert sync_tags(cursor, 7, 'tech_stacks', [1, 4, 5]) is True
+
+    assert len(cursor.queries) == 3
+    delete, params = cursor.queries[1]
+    assert delete == "DELETE FROM posting_tech_stacks WHERE posting_id = %s AND stack_id IN (%s,%s)"
+    assert params == [7, 2, 3]
+    insert, params = cursor.queries[2]
+    assert insert == "INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s), (%s, %s)"
+    assert params == [7, 4, 7, 5]
+
+
+def test_sync_tags_unchanged():
+    """연결이 같으면 쓰기 없이 False를 반환하는지 테스트"""
+    cursor = FakeCursor([(10,), (11,)])
+    assert sync_tags(cursor, 7, 'categories', [11, 10]) is False
+    assert len(cursor.queries) == 1
+
+
+def test_changed_values():
+    """현재 행과 값이 다른 컬럼만 남기는지 테스트"""
+    current = {'title': '백엔드', 'location_id': 3, 'deadline_date': date(2025, 1, 31), 'salary_info': None}
+    updates = {'title': '백엔드', 'location_id': '3', 'deadline_date': '2025-02-01', 'salary_info': None}
+    assert changed_values(current, updates) == {'deadline_date': '2025-02-01'}
+    assert changed_values(current, {'salary_info': '3000', 'title': None}) == {'salary_info': '3000', 'title': None}
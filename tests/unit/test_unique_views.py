@@ -0,0 +1,89 @@
+import redis
+
+from app.jobs import unique_views as unique_views_module
+from app.jobs.unique_views import UniqueViewCounter, visitor_key
+
+class FakeRedis:
+    """HyperLogLog 대신 집합으로 PFADD/PFCOUNT를 흉내 내는 메모리 Redis (down이면 연결 오류)"""
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.ConnectionError("down")
+
+    def pipeline(self):
+        redis_client = self
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+            def __getattr__(self, name):
+                def command(*args):
+                    self.commands.append((name, args))
+                return command
+            def execute(self):
+                redis_client._check()
+                return [getattr(redis_client, name)(*args) for name, args in self.commands]
+        return Pipeline()
+
+    def pfadd(self, key, *values):
+        self._check()
+        self.data.setdefault(key, set()).update(values)
+
+    def pfcount(self, *keys):
+        self._check()
+        return len(set().union(*(self.data.get(key, set()) for key in keys)))
+
+    def sadd(self, key, *values):
+        self.data.setdefault(key, set()).update(str(v) for v in values)
+
+    def expire(self, key, ttl):
+        pass
+
+def make_counter(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(unique_views_module.cache, 'redis_client', client, raising=False)
+    return UniqueViewCounter(), client
+
+def test_local_visitors_replayed_without_double_count(monkeypatch):
+    """Redis 장애 중 방문자가 복구 후 Redis에 합쳐지고, 양쪽에서 본 방문자는 한 번만 세는지 테스트"""
+    counter, client = make_counter(monkeypatch)
+    counter.record(1, 'u:1')
+
+    client.down = True
+    counter.record(1, 'u:1')
+    counter.record(1, 'u:2')
+    assert counter.count(1) == 2
+
+    client.down = False
+    assert counter.count(1) == 2
+    assert counter.count(1, days=7) == 2
+    assert counter._local == {} and counter._local_size == 0
+
+def test_local_buffer_is_bounded(monkeypatch):
+    """장애 중 모아 두는 방문자 수 상한 테스트"""
+    counter, client = make_counter(monkeypatch)
+    counter.MAX_LOCAL_VISITORS = 3
+    client.down = True
+    for i in range(10):
+        counter.record(1, f"u:{i}")
+    assert counter._local_size == 3
+
+def test_materialize_skipped_without_redis(monkeypatch):
+    """Redis에 연결할 수 없으면 컬럼을 덮어쓰지 않고 건너뛰는지 테스트"""
+    counter, client = make_counter(monkeypatch)
+    client.down = True
+    counter.record(1, 'u:1')
+
+    class FailingDb:
+        def cursor(self):
+            raise AssertionError("should not write")
+    assert counter.materialize(FailingDb()) == 0
+    assert counter._local_size == 1
+
+def test_visitor_key():
+    """로그인 사용자는 user_id, 비로그인은 IP + User-Agent로 식별"""
+    assert visitor_key(user_id=3, ip='1.1.1.1') == 'u:3'
+    assert visitor_key(ip='1.1.1.1', user_agent='A') == visitor_key(ip='1.1.1.1', user_agent='A')
+    assert visitor_key(ip='1.1.1.1', user_agent='A') != visitor_key(ip='1.1.1.1', user_agent='B')
@@ -0,0 +1,48 @@
+import redis
+from app.cache.redis_cache import cache
+from app.jobs.views import ViewCounter
+
+class DownRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("redis down")
+        return fail
+
+class FakeDB:
+    def __init__(self):
+        self.executed = []
+        self.committed = False
+
+    def cursor(self):
+        db = self
+        class Cursor:
+            def execute(self, query, params):
+                db.executed.append((' '.join(query.split()), list(params)))
+            def close(self):
+                pass
+        return Cursor()
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+def test_view_counter_local_fallback(monkeypatch):
+    """Redis 장애 시 프로세스 내 버퍼 누적 및 CASE 일괄 반영 테스트"""
+    monkeypatch.setattr(cache, 'redis_client', DownRedis())
+    counter = ViewCounter()
+    for _ in range(3):
+        counter.increment(7)
+    counter.increment(9)
+
+    rows = counter.merge([{'posting_id': 7, 'view_count': 10}, {'posting_id': 8, 'view_count': 1}])
+    assert [row['view_count'] for row in rows] == [13, 1]
+
+    db = FakeDB()
+    assert counter.flush(db) == 2
+    assert db.committed
+    query, params = db.executed[0]
+    assert query.startswith("UPDATE job_postings SET view_count = view_count + CASE posting_id")
+    assert params == [7, 3, 9, 1, 7, 9]
+    assert counter.pending([7, 9]) == {}